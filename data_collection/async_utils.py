@@ -0,0 +1,129 @@
+"""Asynchronous HTTP helpers for concurrent data collection.
+
+Scraping is dominated by network latency, so fetching profiles one at a
+time with blocking requests costs one round trip per profile.  The
+helpers in this module issue requests through a shared
+``aiohttp.ClientSession`` so that many profiles can be fetched
+concurrently while still respecting the per‑host pacing enforced by
+:func:`data_collection.utils.rate_limited`.
+
+``aiohttp`` is optional; the synchronous scrapers keep working when it
+is not installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import random
+import time
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Dict, Tuple
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # type: ignore
+
+from .utils import (
+    _HEAD_END,
+    _host_last_call,
+    _host_lock,
+    _throttle_key,
+    get_random_user_agent,
+)
+
+
+def async_rate_limited(
+    min_delay: float,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Asynchronous counterpart of :func:`data_collection.utils.rate_limited`.
+
+    Slots are reserved in the same shared table as the synchronous
+    decorator, but the wait is spent in ``asyncio.sleep`` so other
+    requests can proceed on the event loop.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _throttle_key(func, args)
+            with _host_lock:
+                now = time.monotonic()
+                last = _host_last_call.get(key)
+                wait = 0.0 if last is None else max(0.0, min_delay - (now - last))
+                _host_last_call[key] = now + wait
+            if wait > 0:
+                await asyncio.sleep(wait)
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def create_session(limit: int = 100) -> aiohttp.ClientSession:
+    """Return an ``aiohttp`` session with a pooled, DNS‑caching connector."""
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is required for asynchronous scraping")
+    connector = aiohttp.TCPConnector(limit=limit, ttl_dns_cache=300)
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def make_request_async(
+    session: aiohttp.ClientSession,
+    url: str,
+    *,
+    proxies: Optional[Iterable[str]] = None,
+    timeout: int = 10,
+    max_bytes: Optional[int] = 65536,
+) -> Tuple[int, str]:
+    """Perform an asynchronous HTTP GET request.
+
+    Mirrors :func:`data_collection.utils.make_request`: a random user
+    agent is sent, one of ``proxies`` is chosen at random when supplied
+    and the body is only read up to ``max_bytes`` or the end of
+    ``<head>``.  Returns the status code and decoded body.
+    """
+    headers = {"User-Agent": get_random_user_agent()}
+    proxy = random.choice(list(proxies)) if proxies else None
+    async with session.get(
+        url,
+        headers=headers,
+        proxy=proxy,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as resp:
+        if max_bytes is None:
+            return resp.status, await resp.text()
+        buf = bytearray()
+        async for chunk in resp.content.iter_chunked(8192):
+            search_from = max(0, len(buf) - len(_HEAD_END) + 1)
+            buf += chunk
+            if len(buf) >= max_bytes or buf.find(_HEAD_END, search_from) >= 0:
+                break
+        return resp.status, buf.decode(resp.get_encoding(), errors="replace")
+
+
+async def gather_profiles(
+    handles: Iterable[str],
+    scraper: Any,
+    *,
+    concurrency: int = 10,
+) -> List[Optional[Dict[str, object]]]:
+    """Fetch many profiles concurrently with ``scraper.get_profile_async``.
+
+    At most ``concurrency`` requests are in flight at once.  Failed
+    fetches yield ``None`` in the corresponding position, matching the
+    behaviour of the synchronous ``get_profile`` methods.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with create_session() as session:
+
+        async def fetch(handle: str) -> Optional[Dict[str, object]]:
+            async with semaphore:
+                try:
+                    return await scraper.get_profile_async(session, handle)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    return None
+
+        return await asyncio.gather(*(fetch(h) for h in handles))
@@ -2,22 +2,124 @@
 
 This module defines functions to normalise, validate and store
 influencer data collected by platform scrapers.  It uses the
-``sqlite3`` module to interact with the local TAIPPA database and
-ensures that the necessary tables exist before inserting or updating
+``sqlite3`` module (or ``apsw`` when ``TAIPPA_USE_APSW`` is set) to
+interact with the local TAIPPA database and ensures that the necessary tables exist before inserting or updating
 records.  Data validation rules can be extended to enforce quality
 standards such as minimum engagement rates or recent activity.
 """
 
 from __future__ import annotations
 
+import contextlib
 import os
 import sqlite3
 import uuid
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Dict, Optional, Sequence, Tuple
 from datetime import datetime
 
+try:
+    import apsw
+except ImportError:
+    apsw = None  # type: ignore
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None  # type: ignore
+    pc = None  # type: ignore
+
+from taippa.taippa.services.tokens import influencer_match_tokens
+
 from .utils import rate_limited
 
+if TYPE_CHECKING:
+    from .writer import SQLiteWriter
+
+# apsw is a thinner wrapper around SQLite with lower per-statement binding
+# overhead.  It is opt-in because it is not part of the standard library.
+_USE_APSW = os.getenv("TAIPPA_USE_APSW", "false").lower() in {"1", "true", "yes"}
+
+
+@dataclass(slots=True)
+class Profile:
+    """A normalised influencer profile ready to be stored.
+
+    Fields are declared in the column order of the ``influencers`` table
+    so that a profile can be bound positionally with :meth:`as_row`.
+    """
+
+    id: str
+    handle: str
+    name: str
+    platform: str
+    followers: int
+    engagement_rate: Optional[float]
+    bio: Optional[str]
+    topics: Optional[str]
+    country: Optional[str]
+    language: Optional[str]
+    avg_likes: Optional[int]
+    avg_comments: Optional[int]
+    audience_country: Optional[str]
+    audience_gender: Optional[str]
+    audience_age: Optional[str]
+    last_updated: str
+    match_tokens: str
+    created_at: str
+    updated_at: str
+    tenant_id: str
+
+    def as_row(self) -> Tuple[object, ...]:
+        """Return the field values in ``influencers`` column order."""
+        return (
+            self.id, self.handle, self.name, self.platform, self.followers,
+            self.engagement_rate, self.bio, self.topics, self.country,
+            self.language, self.avg_likes, self.avg_comments,
+            self.audience_country, self.audience_gender, self.audience_age,
+            self.last_updated, self.match_tokens, self.created_at, self.updated_at,
+            self.tenant_id,
+        )
+
+    def asdict(self) -> Dict[str, object]:
+        """Return the profile as a column-name to value mapping."""
+        return dict(zip(_INFLUENCER_COLUMNS, self.as_row()))
+
+
+# Column order used when binding influencer rows positionally.
+_INFLUENCER_COLUMNS = tuple(f.name for f in fields(Profile))
+_ROW_PLACEHOLDER = "(" + ", ".join("?" * len(_INFLUENCER_COLUMNS)) + ")"
+# SQLite builds older than 3.32 cap a statement at 999 bound parameters.
+_ROWS_PER_STATEMENT = 999 // len(_INFLUENCER_COLUMNS)
+
+
+def _upsert_sql(rows: int) -> str:
+    """Return the ``INSERT OR REPLACE`` statement for ``rows`` rows."""
+    return (
+        f"INSERT OR REPLACE INTO influencers ({', '.join(_INFLUENCER_COLUMNS)}) "
+        f"VALUES {', '.join([_ROW_PLACEHOLDER] * rows)}"
+    )
+
+
+# Secondary lookup index.  The UNIQUE index on ``handle`` is left alone
+# during bulk loads because INSERT OR REPLACE relies on it to detect
+# existing rows.
+_CREATE_PLATFORM_HANDLE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_inf_platform_handle "
+    "ON influencers(platform, handle)"
+)
+# Loads of at least this many rows rebuild secondary indexes afterwards
+# instead of maintaining them row by row.
+BULK_LOAD_THRESHOLD = 1000
+# Batches larger than this are normalised in a process pool.
+PARALLEL_NORMALISE_THRESHOLD = 2000
+
+# Built once so every full batch reuses the same SQL text, which lets the
+# connection's statement cache skip re-preparing it.
+_UPSERT_SQL = _upsert_sql(_ROWS_PER_STATEMENT)
+
 
 def get_db_connection() -> sqlite3.Connection:
     """Return a connection to the TAIPPA SQLite database.
@@ -25,68 +127,106 @@ def get_db_connection() -> sqlite3.Connection:
     If the database file does not exist, it will be created along with
     the required tables.  The location of the database file is fixed
     relative to the repository root at ``taippa.db``.
+
+    When ``TAIPPA_USE_APSW`` is truthy and ``apsw`` is installed an
+    ``apsw.Connection`` is returned instead; the functions in this module
+    only use the subset of the API that both drivers share.
     """
     db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "taippa.db")
-    conn = sqlite3.connect(db_path)
+    if _USE_APSW and apsw is not None:
+        conn = apsw.Connection(db_path)
+    else:
+        conn = sqlite3.connect(db_path)
     # Ensure foreign keys are enforced
     conn.execute("PRAGMA foreign_keys = ON;")
+    # WAL with synchronous=NORMAL avoids an fsync on every commit, which
+    # otherwise dominates insert time for this local database.
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -65536;")
+    conn.execute("PRAGMA busy_timeout = 5000;")
+    conn.execute("PRAGMA cache_spill = OFF;")
     # Initialise tables if necessary
     _ensure_tables(conn)
     return conn
 
 
+@contextlib.contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """Run the enclosed statements in one explicit transaction.
+
+    Works for both ``sqlite3`` and ``apsw`` connections.  If the caller
+    already has a transaction open, statements simply join it.
+    """
+    if conn.in_transaction:
+        yield
+        return
+    conn.execute("BEGIN")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
 def _ensure_tables(conn: sqlite3.Connection) -> None:
     """Create tenants and influencers tables if absent.
 
     This helper is similar to the one defined in the population script
-    but scoped locally to avoid cross‑imports.
+    but scoped locally to avoid cross‑imports.  Both tables and the
+    ``(platform, handle)`` lookup index are created inside a single
+    transaction.
     """
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS tenants (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL UNIQUE,
-            domain TEXT,
-            logo_url TEXT,
-            primary_color TEXT,
-            secondary_color TEXT,
-            site_name TEXT,
-            tagline TEXT,
-            footer_message TEXT,
-            features TEXT,
-            custom_css TEXT,
-            created_at TEXT,
-            updated_at TEXT
-        );
-        """
-    )
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS influencers (
-            id TEXT PRIMARY KEY,
-            handle TEXT NOT NULL UNIQUE,
-            name TEXT NOT NULL,
-            platform TEXT NOT NULL,
-            followers INTEGER,
-            engagement_rate REAL,
-            bio TEXT,
-            topics TEXT,
-            country TEXT,
-            language TEXT,
-            avg_likes INTEGER,
-            avg_comments INTEGER,
-            audience_country TEXT,
-            audience_gender TEXT,
-            audience_age TEXT,
-            last_updated TEXT,
-            created_at TEXT,
-            updated_at TEXT,
-            tenant_id TEXT NOT NULL,
-            FOREIGN KEY(tenant_id) REFERENCES tenants(id) ON DELETE CASCADE
-        );
-        """
-    )
-    conn.commit()
+    with _transaction(conn):
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tenants (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE,
+                domain TEXT,
+                logo_url TEXT,
+                primary_color TEXT,
+                secondary_color TEXT,
+                site_name TEXT,
+                tagline TEXT,
+                footer_message TEXT,
+                features TEXT,
+                custom_css TEXT,
+                created_at TEXT,
+                updated_at TEXT
+            );
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS influencers (
+                id TEXT PRIMARY KEY,
+                handle TEXT NOT NULL UNIQUE,
+                name TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                followers INTEGER,
+                engagement_rate REAL,
+                bio TEXT,
+                topics TEXT,
+                country TEXT,
+                language TEXT,
+                avg_likes INTEGER,
+                avg_comments INTEGER,
+                audience_country TEXT,
+                audience_gender TEXT,
+                audience_age TEXT,
+                last_updated TEXT,
+                match_tokens TEXT,
+                created_at TEXT,
+                updated_at TEXT,
+                tenant_id TEXT NOT NULL,
+                FOREIGN KEY(tenant_id) REFERENCES tenants(id) ON DELETE CASCADE
+            );
+            """
+        )
+        conn.execute(_CREATE_PLATFORM_HANDLE_INDEX)
 
 
 def get_or_create_tenant(conn: sqlite3.Connection, name: str = "Demo Tenant") -> str:
@@ -98,27 +238,74 @@ def get_or_create_tenant(conn: sqlite3.Connection, name: str = "Demo Tenant") ->
         return row[0]
     tenant_id = uuid.uuid4().hex
     now = datetime.utcnow().isoformat()
-    cur.execute(
-        """
-        INSERT INTO tenants (
-            id, name, domain, logo_url, primary_color, secondary_color,
-            site_name, tagline, footer_message, features, custom_css,
-            created_at, updated_at
-        ) VALUES (?, ?, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, ?, ?)
-        """,
-        (tenant_id, name, now, now),
-    )
-    conn.commit()
+    with _transaction(conn):
+        cur.execute(
+            """
+            INSERT INTO tenants (
+                id, name, domain, logo_url, primary_color, secondary_color,
+                site_name, tagline, footer_message, features, custom_css,
+                created_at, updated_at
+            ) VALUES (?, ?, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, ?, ?)
+            """,
+            (tenant_id, name, now, now),
+        )
     return tenant_id
 
 
-def normalise_profile(profile: Dict[str, object], tenant_id: str) -> Optional[Dict[str, object]]:
+def _compile_profile_builder() -> Callable[[Dict[str, object], str, str, str], Profile]:
+    """Generate a function that builds a :class:`Profile` from a raw dict.
+
+    The source is derived from the ``Profile`` fields, so every column is
+    read with one inlined expression and the dataclass is constructed
+    positionally, without per-field keyword handling.
+    """
+    special = {
+        "id": "profile_id",
+        "handle": "p['handle'].lower()",
+        "name": "p['name']",
+        "platform": "p['platform']",
+        "followers": "p['followers']",
+        "last_updated": "now",
+        "match_tokens": "influencer_match_tokens(p['name'], p['handle'], p['platform'])",
+        "created_at": "now",
+        "updated_at": "now",
+        "tenant_id": "tenant_id",
+    }
+    args = ",\n        ".join(
+        special.get(col, f"get({col!r})") for col in _INFLUENCER_COLUMNS
+    )
+    src = (
+        "def _build_profile(p, tenant_id, now, profile_id):\n"
+        "    get = p.get\n"
+        f"    return Profile(\n        {args},\n    )\n"
+    )
+    namespace: Dict[str, object] = {"Profile": Profile, "influencer_match_tokens": influencer_match_tokens}
+    exec(src, namespace)
+    return namespace["_build_profile"]  # type: ignore[return-value]
+
+
+_build_profile = _compile_profile_builder()
+
+
+def _id_pool_gen(n: int) -> Iterator[str]:
+    """Yield ``n`` random 32-character hex IDs from a single urandom read."""
+    block = os.urandom(16 * n).hex()
+    return (block[i:i + 32] for i in range(0, 32 * n, 32))
+
+
+def normalise_profile(
+    profile: Dict[str, object],
+    tenant_id: str,
+    profile_id: Optional[str] = None,
+) -> Optional[Profile]:
     """Validate and normalise a scraped profile dictionary.
 
     Ensures required fields are present and adds timestamps and tenant
-    association.  Returns None if the profile does not meet minimum
+    association, returning a :class:`Profile`.  Returns None if the profile does not meet minimum
     quality criteria (e.g. missing followers).  Extend this function
-    with additional validation logic as needed.
+    with additional validation logic as needed.  Batch callers can supply
+    ``profile_id`` from :func:`_id_pool_gen`; otherwise a fresh UUID is
+    generated.
     """
     required_fields = {"handle", "name", "platform"}
     if not required_fields.issubset(profile.keys()):
@@ -128,71 +315,152 @@ def normalise_profile(profile: Dict[str, object], tenant_id: str) -> Optional[Di
     if followers is None or (isinstance(followers, int) and followers <= 0):
         return None
     now = datetime.utcnow().isoformat()
-    return {
-        "id": uuid.uuid4().hex,
-        "handle": profile["handle"].lower(),
-        "name": profile["name"],
-        "platform": profile["platform"],
-        "followers": followers,
-        "engagement_rate": profile.get("engagement_rate"),
-        "bio": profile.get("bio"),
-        "topics": profile.get("topics"),
-        "country": profile.get("country"),
-        "language": profile.get("language"),
-        "avg_likes": profile.get("avg_likes"),
-        "avg_comments": profile.get("avg_comments"),
-        "audience_country": profile.get("audience_country"),
-        "audience_gender": profile.get("audience_gender"),
-        "audience_age": profile.get("audience_age"),
-        "last_updated": now,
-        "created_at": now,
-        "updated_at": now,
-        "tenant_id": tenant_id,
-    }
+    return _build_profile(profile, tenant_id, now, profile_id or uuid.uuid4().hex)
 
 
-def upsert_profiles(conn: sqlite3.Connection, profiles: List[Dict[str, object]]) -> None:
+def upsert_profiles(conn: sqlite3.Connection, profiles: List[Profile]) -> None:
     """Insert or update influencer profiles in the database.
 
     Uses ``INSERT OR REPLACE`` semantics to update existing records with
-    the same handle.  Handles are assumed to be unique per platform.
+    the same handle.  Handles are assumed to be unique per platform.  All
+    rows are written in a single transaction, with each statement carrying
+    as many rows as SQLite's bound-parameter limit allows.
     """
-    stmt = (
-        """
-        INSERT OR REPLACE INTO influencers (
-            id, handle, name, platform, followers, engagement_rate, bio,
-            topics, country, language, avg_likes, avg_comments,
-            audience_country, audience_gender, audience_age,
-            last_updated, created_at, updated_at, tenant_id
-        ) VALUES (
-            :id, :handle, :name, :platform, :followers, :engagement_rate, :bio,
-            :topics, :country, :language, :avg_likes, :avg_comments,
-            :audience_country, :audience_gender, :audience_age,
-            :last_updated, :created_at, :updated_at, :tenant_id
-        )
-        """
+    _upsert_rows(conn, [p.as_row() for p in profiles])
+
+
+def _upsert_rows(conn: sqlite3.Connection, rows: Sequence[Tuple[object, ...]]) -> None:
+    """Write ``rows`` (tuples in ``influencers`` column order) in one transaction."""
+    with _transaction(conn):
+        for start in range(0, len(rows), _ROWS_PER_STATEMENT):
+            chunk = rows[start:start + _ROWS_PER_STATEMENT]
+            stmt = _UPSERT_SQL if len(chunk) == _ROWS_PER_STATEMENT else _upsert_sql(len(chunk))
+            params = [value for row in chunk for value in row]
+            conn.execute(stmt, params)
+
+
+def ingest_arrow_table(
+    table: pa.Table,
+    tenant_name: str = "Demo Tenant",
+    conn: Optional[sqlite3.Connection] = None,
+) -> int:
+    """Validate and store a columnar batch of profiles, e.g. from a CSV import.
+
+    Applies the same rules as :func:`normalise_profile` using pyarrow
+    compute kernels over whole columns: rows without a handle or with a
+    missing or non‑positive follower count are dropped and handles are
+    lowercased.  Columns of the ``influencers`` table that are absent
+    from ``table`` are stored as NULL.  Returns the number of rows stored.
+    """
+    if pc is None:
+        raise RuntimeError("pyarrow is required for columnar ingestion")
+    missing = {"handle", "name", "platform", "followers"} - set(table.column_names)
+    if missing:
+        raise ValueError(f"Table is missing required columns: {', '.join(sorted(missing))}")
+    keep = pc.and_(
+        pc.is_valid(table["handle"]),
+        pc.fill_null(pc.greater(table["followers"], 0), False),
     )
-    conn.executemany(stmt, profiles)
-    conn.commit()
+    table = table.filter(keep)
+    n = table.num_rows
+    if n == 0:
+        return 0
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
+    try:
+        tenant_id = get_or_create_tenant(conn, tenant_name)
+        now = datetime.utcnow().isoformat()
+        columns: Dict[str, Iterable[object]] = {
+            "id": list(_id_pool_gen(n)),
+            "handle": pc.utf8_lower(table["handle"]).to_pylist(),
+            "last_updated": repeat(now, n),
+            "created_at": repeat(now, n),
+            "updated_at": repeat(now, n),
+            "tenant_id": repeat(tenant_id, n),
+        }
+        columns["match_tokens"] = list(map(
+            influencer_match_tokens,
+            table["name"].to_pylist(),
+            columns["handle"],
+            table["platform"].to_pylist(),
+        ))
+        for col in _INFLUENCER_COLUMNS:
+            if col not in columns:
+                columns[col] = table[col].to_pylist() if col in table.column_names else repeat(None, n)
+        _upsert_rows(conn, list(zip(*(columns[col] for col in _INFLUENCER_COLUMNS))))
+        return n
+    finally:
+        if own_conn:
+            conn.close()
+
+
+def _normalise_batch(raw_profiles: List[Dict[str, object]], tenant_id: str) -> List[Profile]:
+    """Normalise ``raw_profiles``, dropping those that fail validation."""
+    ids = _id_pool_gen(len(raw_profiles))
+    if len(raw_profiles) > PARALLEL_NORMALISE_THRESHOLD:
+        # Spread the CPU-bound normalisation across processes
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(
+                normalise_profile, raw_profiles, repeat(tenant_id), ids, chunksize=500
+            )
+            return [norm for norm in results if norm]
+    processed: List[Profile] = []
+    for profile, profile_id in zip(raw_profiles, ids):
+        norm = normalise_profile(profile, tenant_id, profile_id)
+        if norm:
+            processed.append(norm)
+    return processed
 
 
-def process_and_store(raw_profiles: List[Dict[str, object]], tenant_name: str = "Demo Tenant") -> int:
+def process_and_store(
+    raw_profiles: List[Dict[str, object]],
+    tenant_name: str = "Demo Tenant",
+    conn: Optional[sqlite3.Connection] = None,
+    bulk: Optional[bool] = None,
+    writer: Optional[SQLiteWriter] = None,
+) -> int:
     """Normalise and store raw influencer profiles.
 
-    Opens a database connection, creates the tenant if necessary,
-    normalises each profile, filters out invalid entries and inserts
-    them into the database.  Returns the number of profiles stored.
+    Creates the tenant if necessary, normalises each profile (in a
+    process pool for batches above ``PARALLEL_NORMALISE_THRESHOLD``),
+    filters out invalid entries and inserts them into the database.  Returns the
+    number of profiles stored.  Callers storing several batches can pass
+    an open ``conn`` to reuse it (and its prepared statements); otherwise
+    a connection is opened and closed for this call.
+
+    When ``bulk`` is true (by default, when at least
+    ``BULK_LOAD_THRESHOLD`` profiles are stored) the secondary
+    ``(platform, handle)`` index is dropped before inserting and rebuilt
+    once afterwards.
+
+    If a running :class:`~data_collection.writer.SQLiteWriter` is given,
+    the normalised profiles are handed to it instead of being written
+    here; the return value then counts profiles queued for storage.
     """
-    conn = get_db_connection()
+    if writer is not None:
+        tenant_id = writer.tenant_id(tenant_name)
+        processed = _normalise_batch(raw_profiles, tenant_id)
+        writer.enqueue(processed)
+        return len(processed)
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
     try:
         tenant_id = get_or_create_tenant(conn, tenant_name)
-        processed: List[Dict[str, object]] = []
-        for profile in raw_profiles:
-            norm = normalise_profile(profile, tenant_id)
-            if norm:
-                processed.append(norm)
+        processed = _normalise_batch(raw_profiles, tenant_id)
         if processed:
-            upsert_profiles(conn, processed)
+            if bulk is None:
+                bulk = len(processed) >= BULK_LOAD_THRESHOLD
+            if bulk:
+                conn.execute("DROP INDEX IF EXISTS idx_inf_platform_handle")
+            try:
+                upsert_profiles(conn, processed)
+            finally:
+                if bulk:
+                    with _transaction(conn):
+                        conn.execute(_CREATE_PLATFORM_HANDLE_INDEX)
         return len(processed)
     finally:
-        conn.close()
\ No newline at end of file
+        if own_conn:
+            conn.close()
@@ -2,8 +2,11 @@
 
 Each scraper class encapsulates the logic for fetching and parsing
 publicly available influencer information from a specific social media
-platform.  These classes rely on the ``requests`` and ``BeautifulSoup``
-libraries to perform HTTP requests and parse HTML content.  The
+platform.  These classes rely on the ``requests`` library to perform
+HTTP requests and read the handful of ``<meta>`` tags they need with
+direct string scans rather than a full HTML parser; each
+scraper also offers a ``get_profile_async`` variant built on ``aiohttp``
+(see :mod:`data_collection.async_utils`) for concurrent collection.  The
 scrapers are designed to be extended with additional parsing logic
 and error handling as needed.  They currently focus on extracting
 basic profile metrics such as follower counts, bios and usernames.
@@ -16,12 +19,146 @@ need to be adapted by the user for reliability at scale.
 
 from __future__ import annotations
 
+import html
+import json
 import re
-from typing import Optional, Dict, Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional, Dict, Iterable, Union
 
-from bs4 import BeautifulSoup
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
 
-from .utils import make_request, rate_limited
+    def _json_loads(data: Union[str, bytes, memoryview]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+from .async_utils import async_rate_limited, make_request_async
+from .utils import make_request, make_request_to_buffer, rate_limited
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# Patterns used by the parsers, compiled once at import time.
+_IG_TITLE_RE = re.compile(r"(.+) \(@.+\) • Instagram")
+_TW_TITLE_RE = re.compile(r"(.+) \(@.+\) /")
+# Tokens that matter when scanning an embedded JSON object: escape
+# sequences, quotes and braces.
+_JSON_TOKEN_RE = re.compile(r'\\.|["{}]', re.S)
+_JSON_TOKEN_BYTES_RE = re.compile(rb'\\.|["{}]', re.S)
+
+
+@lru_cache(maxsize=32)
+def _anchor_re(anchor: str, binary: bool) -> re.Pattern:
+    """Compiled ``anchor = {`` pattern, as text or bytes, built once per anchor."""
+    if binary:
+        return re.compile(re.escape(anchor.encode()) + rb"\s*=\s*(?=\{)")
+    return re.compile(re.escape(anchor) + r"\s*=\s*(?=\{)")
+
+
+_FOLLOWER_SUFFIXES = {"k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
+
+def _parse_follower(text: str) -> Optional[int]:
+    """Parse the follower count preceding ``" Followers"`` in ``text``.
+
+    Handles thousands separators and abbreviated counts such as ``1.4m``
+    or ``12.5K`` in a single backwards scan from the label.
+    """
+    end = text.find(" Followers")
+    if end <= 0:
+        return None
+    multiplier = _FOLLOWER_SUFFIXES.get(text[end - 1].lower(), 1)
+    if multiplier != 1:
+        end -= 1
+    start = end
+    while start > 0 and (text[start - 1].isdigit() or text[start - 1] in ",."):
+        start -= 1
+    digits = text[start:end].replace(",", "")
+    if not digits:
+        return None
+    try:
+        return int(float(digits) * multiplier)
+    except ValueError:
+        return None
+
+
+def _extract_json_object(
+    data: Union[str, bytes, memoryview], anchor: str
+) -> Union[str, bytes, memoryview, None]:
+    """Return the JSON object literal assigned to ``anchor`` in ``data``.
+
+    Finds ``anchor = {`` and scans forward counting brace depth (ignoring
+    braces inside string literals) until the matching closing brace.
+    ``data`` may be text or any bytes-like object; a ``memoryview`` is
+    scanned in place and the result is a slice of it, so no copy of the
+    page is made.  The regex engine skips over ordinary characters, which
+    keeps the scan linear and cheap even on large pages.
+    """
+    if isinstance(data, str):
+        head = _anchor_re(anchor, False)
+        tokens, quote, opening = _JSON_TOKEN_RE, '"', "{"
+    else:
+        head = _anchor_re(anchor, True)
+        tokens, quote, opening = _JSON_TOKEN_BYTES_RE, b'"', b"{"
+    match = head.search(data)
+    if match is None:
+        return None
+    start = match.end()
+    depth = 0
+    in_string = False
+    for token in tokens.finditer(data, start):
+        ch = token.group()
+        if ch == quote:
+            in_string = not in_string
+        elif in_string or len(ch) > 1:
+            # Braces inside strings and escape sequences don't nest
+            continue
+        elif ch == opening:
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return data[start:token.end()]
+    return None
+
+
+def _extract_meta(text: str, attr: str, value: str) -> Optional[str]:
+    """Return the ``content`` of the first ``<meta attr="value">`` tag.
+
+    Scans the raw HTML with ``str.find`` instead of building a DOM: the
+    attribute is located first and the enclosing tag is then searched for
+    its ``content`` value, so either attribute order is handled.
+    """
+    needle = f'{attr}="{value}"'
+    i = text.find(needle)
+    while i >= 0:
+        tag_start = text.rfind("<", 0, i)
+        tag_end = text.find(">", i)
+        if tag_start >= 0 and tag_end >= 0 and text.startswith("<meta", tag_start):
+            tag = text[tag_start:tag_end]
+            c = tag.find('content="')
+            if c >= 0:
+                c += len('content="')
+                return html.unescape(tag[c:tag.find('"', c)])
+            return None
+        i = text.find(needle, i + len(needle))
+    return None
+
+
+def _extract_title(text: str) -> Optional[str]:
+    """Return the text of the document ``<title>``, if any."""
+    i = text.find("<title")
+    if i < 0:
+        return None
+    i = text.find(">", i)
+    j = text.find("</title>", i)
+    if i < 0 or j < 0:
+        return None
+    return html.unescape(text[i + 1:j])
 
 
 class InstagramScraper:
@@ -44,32 +181,37 @@ class InstagramScraper:
         resp = make_request(url, proxies=self.proxies)
         if resp.status_code != 200:
             return None
-        soup = BeautifulSoup(resp.text, "html.parser")
+        return self.parse_profile(username, resp.text)
+
+    @async_rate_limited(1.0)
+    async def get_profile_async(
+        self, session: aiohttp.ClientSession, username: str
+    ) -> Optional[Dict[str, object]]:
+        url = f"{self.BASE_URL}{username}/"
+        status, text = await make_request_async(session, url, proxies=self.proxies)
+        if status != 200:
+            return None
+        return self.parse_profile(username, text)
+
+    def parse_profile(self, username: str, page: str) -> Optional[Dict[str, object]]:
+        """Extract profile fields from the HTML of a profile page."""
         # Extract title text which contains followers info for public pages
-        title = soup.find("title")
+        title = _extract_title(page)
         if not title:
             return None
         # Example title: "Marques Brownlee (@mkbhd) • Instagram photos and videos"
-        name_match = re.match(r"(.+) \(@.+\) • Instagram", title.text.strip())
+        name_match = _IG_TITLE_RE.match(title.strip())
         full_name = name_match.group(1) if name_match else username
         # Follower count may appear in meta property description
-        desc = soup.find("meta", attrs={"property": "og:description"})
+        desc = _extract_meta(page, "property", "og:description")
         followers = None
         bio = None
-        if desc and desc.get("content"):
+        if desc:
             # Description contains follower count and posts: "1.4m Followers, 123 Following, 1,234 Posts - See Instagram photos..."
-            content = desc["content"]
-            match = re.match(r"([\d,.]+)\w* Followers", content)
-            if match:
-                followers_str = match.group(1).replace(",", "")
-                try:
-                    followers = int(float(followers_str) * 1000) if "k" in content.lower() else int(followers_str)
-                except ValueError:
-                    followers = None
+            followers = _parse_follower(desc)
         # Bio might appear in meta property for biography
-        bio_meta = soup.find("meta", attrs={"property": "og:description"})
-        if bio_meta and bio_meta.get("content"):
-            bio = bio_meta["content"]
+        if desc:
+            bio = desc
         return {
             "handle": username,
             "name": full_name,
@@ -95,16 +237,36 @@ class TikTokScraper:
     @rate_limited(1.0)
     def get_profile(self, username: str) -> Optional[Dict[str, object]]:
         url = f"{self.BASE_URL}{username}"
-        resp = make_request(url, proxies=self.proxies)
+        # The profile JSON lives in the page body, so download it in full
+        # and scan the raw bytes without decoding the whole page
+        resp, buf = make_request_to_buffer(url, proxies=self.proxies)
         if resp.status_code != 200:
             return None
-        # Search for initial state JSON
-        json_match = re.search(r'window.__INIT_PROPS__\s*=\s*(\{.*\});', resp.text)
-        if not json_match:
+        with buf.getbuffer() as view:
+            return self.parse_profile(username, view)
+
+    @async_rate_limited(1.0)
+    async def get_profile_async(
+        self, session: aiohttp.ClientSession, username: str
+    ) -> Optional[Dict[str, object]]:
+        url = f"{self.BASE_URL}{username}"
+        status, text = await make_request_async(
+            session, url, proxies=self.proxies, max_bytes=None
+        )
+        if status != 200:
+            return None
+        return self.parse_profile(username, text)
+
+    def parse_profile(
+        self, username: str, page: Union[str, bytes, memoryview]
+    ) -> Optional[Dict[str, object]]:
+        """Extract profile fields from the JSON embedded in a profile page."""
+        # Locate the initial state JSON assigned to window.__INIT_PROPS__
+        payload = _extract_json_object(page, "window.__INIT_PROPS__")
+        if payload is None:
             return None
-        import json
         try:
-            data = json.loads(json_match.group(1))
+            data = _json_loads(payload)
             # Navigate to user info (this structure may change over time)
             user_data = next(iter(data.values()))["userInfo"]
             stats = user_data["stats"]
@@ -136,21 +298,37 @@ class YouTubeScraper:
     def get_profile(self, channel_handle: str) -> Optional[Dict[str, object]]:
         # Channel handles often start with '@'
         url = f"{self.BASE_URL}{channel_handle}"
-        resp = make_request(url, proxies=self.proxies)
+        # The subscriber count is microdata in the page body, so download
+        # the page in full rather than stopping at </head>
+        resp = make_request(url, proxies=self.proxies, max_bytes=None)
         if resp.status_code != 200:
             return None
-        soup = BeautifulSoup(resp.text, "html.parser")
+        return self.parse_profile(channel_handle, resp.text)
+
+    @async_rate_limited(1.0)
+    async def get_profile_async(
+        self, session: aiohttp.ClientSession, channel_handle: str
+    ) -> Optional[Dict[str, object]]:
+        url = f"{self.BASE_URL}{channel_handle}"
+        status, text = await make_request_async(
+            session, url, proxies=self.proxies, max_bytes=None
+        )
+        if status != 200:
+            return None
+        return self.parse_profile(channel_handle, text)
+
+    def parse_profile(self, channel_handle: str, page: str) -> Optional[Dict[str, object]]:
+        """Extract channel fields from the HTML of a channel page."""
         # Subscriber count may be in meta itemprop="interactionCount"
         subs = None
-        meta_subs = soup.find("meta", attrs={"itemprop": "interactionCount"})
-        if meta_subs and meta_subs.get("content"):
+        meta_subs = _extract_meta(page, "itemprop", "interactionCount")
+        if meta_subs:
             try:
-                subs = int(meta_subs["content"])
+                subs = int(meta_subs)
             except ValueError:
                 subs = None
         # Description in meta name="description"
-        desc_meta = soup.find("meta", attrs={"name": "description"})
-        desc = desc_meta.get("content") if desc_meta else None
+        desc = _extract_meta(page, "name", "description")
         return {
             "handle": channel_handle,
             "name": channel_handle.lstrip("@"),
@@ -180,28 +358,33 @@ class TwitterScraper:
         resp = make_request(url, proxies=self.proxies)
         if resp.status_code != 200:
             return None
-        soup = BeautifulSoup(resp.text, "html.parser")
+        return self.parse_profile(handle, resp.text)
+
+    @async_rate_limited(1.0)
+    async def get_profile_async(
+        self, session: aiohttp.ClientSession, handle: str
+    ) -> Optional[Dict[str, object]]:
+        url = f"{self.BASE_URL}{handle}"
+        status, text = await make_request_async(session, url, proxies=self.proxies)
+        if status != 200:
+            return None
+        return self.parse_profile(handle, text)
+
+    def parse_profile(self, handle: str, page: str) -> Optional[Dict[str, object]]:
+        """Extract profile fields from the HTML of a profile page."""
         # Bio and name are in meta tags
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        bio = meta_desc.get("content") if meta_desc else None
+        bio = _extract_meta(page, "name", "description")
         # Follower count may appear in meta property="og:description"
-        og_desc = soup.find("meta", attrs={"property": "og:description"})
+        og_desc = _extract_meta(page, "property", "og:description")
         followers = None
-        if og_desc and og_desc.get("content"):
+        if og_desc:
             # Example: "1.5M Followers, 100 Following, 3,000 Posts"
-            content = og_desc["content"]
-            match = re.match(r"([\d,.]+) Followers", content)
-            if match:
-                count_str = match.group(1).replace(",", "")
-                try:
-                    followers = int(float(count_str))
-                except ValueError:
-                    followers = None
+            followers = _parse_follower(og_desc)
         # Name is in og:title ("Name (@handle) / X")
-        og_title = soup.find("meta", attrs={"property": "og:title"})
+        og_title = _extract_meta(page, "property", "og:title")
         name = None
-        if og_title and og_title.get("content"):
-            name_match = re.match(r"(.+) \(@.+\) /", og_title["content"])
+        if og_title:
+            name_match = _TW_TITLE_RE.match(og_title)
             if name_match:
                 name = name_match.group(1)
         return {
@@ -9,11 +9,17 @@ reduce the likelihood of detection.
 
 from __future__ import annotations
 
+import functools
+import io
 import random
+import threading
 import time
-from typing import Iterable, Optional, Callable, Any
+from typing import Iterable, Optional, Callable, Any, Dict, Tuple
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # List of common desktop and mobile user agents.  Extend this list as
 # needed to mimic diverse clients.
@@ -29,17 +35,56 @@ USER_AGENTS = [
 ]
 
 
+# Monotonic start time of the most recent call per throttle key, shared by
+# every function decorated with ``rate_limited``.
+_host_last_call: Dict[str, float] = {}
+_host_lock = threading.Lock()
+
+
+# Shared session so TCP/TLS connections to each platform are kept alive and
+# reused across requests.  Transient failures are retried with backoff.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=100,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
+_HEAD_END = b"</head>"
+
+
 def get_random_user_agent() -> str:
     """Return a random user agent string from the list of known agents."""
     return random.choice(USER_AGENTS)
 
 
+def _throttle_key(func: Callable[..., Any], args: tuple) -> str:
+    """Return the key used to pace calls to ``func``.
+
+    Calls are grouped by the host of the first URL argument when one is
+    present; otherwise all calls to the same function share one key.
+    """
+    for arg in args:
+        if isinstance(arg, str) and arg.startswith(("http://", "https://")):
+            return urlsplit(arg).netloc
+    return f"{func.__module__}.{func.__qualname__}"
+
+
 def rate_limited(min_delay: float) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator to enforce a minimum delay between function calls.
 
-    The decorated function will pause for at least ``min_delay`` seconds
-    after each call.  This is useful for respecting rate limits on
-    external websites.  Usage::
+    Calls sharing a key (the target host, or the decorated function when
+    no URL is passed) are started at least ``min_delay`` seconds apart,
+    across all threads and scraper instances.  Each caller reserves the
+    next free slot under a lock and sleeps outside it, so callers that are
+    already spaced out never wait.  Usage::
 
         @rate_limited(1.0)
         def fetch(...):
@@ -47,25 +92,54 @@ def rate_limited(min_delay: float) -> Callable[[Callable[..., Any]], Callable[..
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        last_call = 0.0
-
+        @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            nonlocal last_call
-            elapsed = time.time() - last_call
-            if elapsed < min_delay:
-                time.sleep(min_delay - elapsed)
-            result = func(*args, **kwargs)
-            last_call = time.time()
-            return result
+            key = _throttle_key(func, args)
+            with _host_lock:
+                now = time.monotonic()
+                last = _host_last_call.get(key)
+                wait = 0.0 if last is None else max(0.0, min_delay - (now - last))
+                _host_last_call[key] = now + wait
+            if wait > 0:
+                time.sleep(wait)
+            return func(*args, **kwargs)
 
         return wrapper
 
     return decorator
 
 
-def make_request(url: str, *, proxies: Optional[Iterable[str]] = None, timeout: int = 10) -> requests.Response:
+def _stream_get(
+    url: str, proxies: Optional[Iterable[str]], timeout: int
+) -> requests.Response:
+    """Start a streamed GET through the shared session."""
+    headers = {"User-Agent": get_random_user_agent()}
+    if proxies:
+        proxy = random.choice(list(proxies))
+        proxy_dict = {"http": proxy, "https": proxy}
+    else:
+        proxy_dict = None
+    return _SESSION.get(
+        url, headers=headers, proxies=proxy_dict, timeout=timeout, stream=True
+    )
+
+
+def make_request(
+    url: str,
+    *,
+    proxies: Optional[Iterable[str]] = None,
+    timeout: int = 10,
+    max_bytes: Optional[int] = 65536,
+) -> requests.Response:
     """Perform an HTTP GET request with randomised user agent and optional proxies.
 
+    Requests go through a module‑level :class:`requests.Session`, so
+    connections to the same host are pooled and reused.  The body is
+    streamed and reading stops once ``max_bytes`` have arrived or the
+    closing ``</head>`` tag has been seen, since most scrapers only need
+    the page metadata; those reading fields from the body pass
+    ``max_bytes=None``.
+
     Parameters
     ----------
     url: str
@@ -75,19 +149,54 @@ def make_request(url: str, *, proxies: Optional[Iterable[str]] = None, timeout:
         proxy will be chosen at random for the request.
     timeout: int
         Timeout in seconds for the HTTP request.
+    max_bytes: Optional[int]
+        Maximum number of body bytes to read.  Pass ``None`` to download
+        the full page.
 
     Returns
     -------
     requests.Response
         The HTTP response object.  Users should check the status code
-        and handle errors appropriately.
+        and handle errors appropriately.  When the download was cut
+        short, ``content`` and ``text`` hold only the bytes read.
     """
-    headers = {"User-Agent": get_random_user_agent()}
-    proxy = None
-    if proxies:
-        proxy = random.choice(list(proxies))
-        proxy_dict = {"http": proxy, "https": proxy}
-    else:
-        proxy_dict = None
-    response = requests.get(url, headers=headers, proxies=proxy_dict, timeout=timeout)
-    return response
\ No newline at end of file
+    response = _stream_get(url, proxies, timeout)
+    content_length = response.headers.get("Content-Length")
+    if max_bytes is None or (
+        content_length and content_length.isdigit() and int(content_length) <= max_bytes
+    ):
+        # Small or uncapped bodies are read in full as usual
+        response.content
+        return response
+    buf = bytearray()
+    for chunk in response.iter_content(chunk_size=8192):
+        search_from = max(0, len(buf) - len(_HEAD_END) + 1)
+        buf += chunk
+        if len(buf) >= max_bytes or buf.find(_HEAD_END, search_from) >= 0:
+            break
+    # Abort the rest of the transfer and expose the truncated body
+    response.close()
+    response._content = bytes(buf)
+    return response
+
+
+def make_request_to_buffer(
+    url: str,
+    *,
+    proxies: Optional[Iterable[str]] = None,
+    timeout: int = 10,
+) -> Tuple[requests.Response, io.BytesIO]:
+    """Download the full body of ``url`` into an in-memory buffer.
+
+    The chunks are written straight into an :class:`io.BytesIO` and never
+    decoded, so callers can scan ``buf.getbuffer()`` as a zero‑copy
+    ``memoryview`` instead of materialising ``response.text``.  The
+    response is returned for its status code and headers; its body has
+    already been consumed.
+    """
+    response = _stream_get(url, proxies, timeout)
+    buf = io.BytesIO()
+    with response:
+        for chunk in response.iter_content(chunk_size=65536):
+            buf.write(chunk)
+    return response, buf
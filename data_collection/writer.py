@@ -0,0 +1,110 @@
+"""Background writer that serialises all pipeline inserts.
+
+SQLite allows a single writer at a time, so concurrent scrapers that
+each open a connection and commit their own batches spend much of their
+time waiting on the database lock.  :class:`SQLiteWriter` owns the only
+write connection, collects profiles from any number of producer threads
+through a queue and stores them in large transactions.
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .pipeline import Profile, get_db_connection, get_or_create_tenant, upsert_profiles
+
+# Queue item that tells the writer thread to flush and exit.
+_STOP = object()
+
+
+class SQLiteWriter(threading.Thread):
+    """Thread that batches queued profiles into few, large commits.
+
+    Profiles passed to :meth:`enqueue` are buffered until ``max_rows``
+    have accumulated or ``flush_interval`` seconds have passed since the
+    first buffered profile, then written with one ``upsert_profiles``
+    call.  Use the writer as a context manager, or call :meth:`close`, to
+    flush the remaining profiles and stop the thread.  If a batch fails
+    to store, the error is re‑raised by :meth:`close`.
+    """
+
+    def __init__(self, max_rows: int = 10_000, flush_interval: float = 1.0) -> None:
+        super().__init__(name="sqlite-writer", daemon=True)
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[object]" = queue.Queue()
+        self._tenant_ids: Dict[str, str] = {}
+        self._tenant_lock = threading.Lock()
+        self._error: Optional[BaseException] = None
+
+    def __enter__(self) -> "SQLiteWriter":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def enqueue(self, profiles: List[Profile]) -> None:
+        """Queue normalised profiles for storage."""
+        if profiles:
+            self._queue.put(profiles)
+
+    def tenant_id(self, name: str) -> str:
+        """Return the ID of the named tenant, creating it if needed.
+
+        Results are cached, so the database is only consulted the first
+        time each tenant name is seen.
+        """
+        with self._tenant_lock:
+            if name not in self._tenant_ids:
+                conn = get_db_connection()
+                try:
+                    self._tenant_ids[name] = get_or_create_tenant(conn, name)
+                finally:
+                    conn.close()
+            return self._tenant_ids[name]
+
+    def close(self) -> None:
+        """Flush pending profiles, stop the thread and wait for it."""
+        self._queue.put(_STOP)
+        self.join()
+        if self._error is not None:
+            raise self._error
+
+    def run(self) -> None:
+        conn = get_db_connection()
+        pending: List[Profile] = []
+        deadline = 0.0
+        try:
+            while True:
+                timeout = max(0.0, deadline - time.monotonic()) if pending else None
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+                if item is _STOP:
+                    break
+                if item:
+                    if not pending:
+                        deadline = time.monotonic() + self.flush_interval
+                    pending.extend(item)
+                if pending and (len(pending) >= self.max_rows or time.monotonic() >= deadline):
+                    self._flush(conn, pending)
+                    pending = []
+            self._flush(conn, pending)
+        finally:
+            conn.close()
+
+    def _flush(self, conn: sqlite3.Connection, profiles: List[Profile]) -> None:
+        if not profiles:
+            return
+        try:
+            upsert_profiles(conn, profiles)
+        except Exception as exc:
+            # Keep draining the queue; the first failure is reported on close
+            if self._error is None:
+                self._error = exc
@@ -76,10 +76,13 @@ read -r STRIPE_SUCCESS_DOMAIN
 echo "Enter the default tenant ID (leave blank if seeding later):"
 read -r DEFAULT_TENANT_ID
 
-# 6. Set environment variables on the project
+# 6. Set environment variables on the project.  TAIPPA_AUTOCREATE makes
+#    the backend create any missing tables on startup, as there are no
+#    migrations to set up the schema yet.
 echo "\nStep 4: Setting environment variables..."
 railway variables set \
   DATABASE_URL="$DB_URL" \
+  TAIPPA_AUTOCREATE="1" \
   SECRET_KEY="$SECRET_KEY" \
   JWT_SECRET_KEY="$JWT_SECRET_KEY" \
   ACCESS_TOKEN_EXPIRE_MINUTES="60" \
@@ -873,6 +873,11 @@ async function analyseCampaign(id) {
   }
 }
 
+// Count shown for a paginated list: "50+" when the API reports another page
+function pageCount(res, items) {
+  return res.headers.get("X-Next-Cursor") ? `${items.length}+` : items.length;
+}
+
 // Dashboard page logic: fetch summary counts and render chart
 async function loadDashboard() {
   // Ensure user is logged in and display name
@@ -896,14 +901,14 @@ async function loadDashboard() {
     const countBrandsEl = document.getElementById("count-brands");
     if (countBrandsEl) countBrandsEl.textContent = brands.length;
     const countCampaignsEl = document.getElementById("count-campaigns");
-    if (countCampaignsEl) countCampaignsEl.textContent = campaigns.length;
+    if (countCampaignsEl) countCampaignsEl.textContent = pageCount(campaignsRes, campaigns);
     const countInfluencersEl = document.getElementById("count-influencers");
-    if (countInfluencersEl) countInfluencersEl.textContent = influencers.length;
+    if (countInfluencersEl) countInfluencersEl.textContent = pageCount(influencersRes, influencers);
     // update leads count if available
     if (leadsRes && leadsRes.ok) {
       const leads = await leadsRes.json();
       const countLeadsEl = document.getElementById("count-leads");
-      if (countLeadsEl) countLeadsEl.textContent = leads.length;
+      if (countLeadsEl) countLeadsEl.textContent = pageCount(leadsRes, leads);
     }
     // compute status distribution
     const statusCounts = {};
@@ -0,0 +1,240 @@
+"""
+Shared data and sampling helpers for the influencer populate scripts.
+
+Both ``populate_influencers.py`` (SQLAlchemy) and
+``populate_influencers_sqlite.py`` (plain ``sqlite3``) generate the same
+synthetic influencers.  The category definitions, name pools and the
+NumPy-based samplers they draw from live here so the two scripts stay
+in step.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+
+# Influencer categories and the ranges and pools each one draws from
+CATEGORIES: Dict[str, Dict] = {
+    "fashion_beauty": {
+        "count": 60,
+        "follower_range": (10_000, 2_000_000),
+        "locations": (
+            ("United States", "en"),
+            ("United Kingdom", "en"),
+            ("France", "fr"),
+            ("Italy", "it"),
+            ("Brazil", "pt"),
+            ("South Korea", "ko"),
+        ),
+        "topics": (
+            "streetwear", "luxury fashion", "skincare", "makeup tutorials",
+            "vintage", "minimalist fashion", "plus size", "men's fashion",
+        ),
+        "bios": (
+            "Fashion lover sharing daily #OOTD and style inspo.",
+            "Makeup artist & beauty blogger. Reviews and tutorials.",
+            "Skincare obsessed. Honest reviews and routines.",
+            "Luxury fashion curator. Showing my favourite designer pieces.",
+            "Streetwear enthusiast. Sneakers, hoodies and more.",
+        ),
+    },
+    "technology_gaming": {
+        "count": 60,
+        "follower_range": (25_000, 5_000_000),
+        "locations": (
+            ("United States", "en"),
+            ("United Kingdom", "en"),
+            ("Germany", "de"),
+            ("Japan", "ja"),
+            ("Canada", "en"),
+            ("South Korea", "ko"),
+        ),
+        "topics": (
+            "mobile reviews", "PC gaming", "crypto", "blockchain",
+            "AI", "machine learning", "hardware reviews", "programming",
+        ),
+        "bios": (
+            "Tech reviewer sharing insights on the latest gadgets.",
+            "Full‑time streamer & gaming enthusiast.",
+            "Crypto and blockchain educator. Explaining DeFi & NFTs.",
+            "AI researcher making complex topics accessible.",
+            "PC builder & hardware geek. Benchmarks and builds.",
+        ),
+    },
+    "health_fitness": {
+        "count": 60,
+        "follower_range": (15_000, 3_000_000),
+        "locations": (
+            ("United States", "en"),
+            ("Australia", "en"),
+            ("United Kingdom", "en"),
+            ("Canada", "en"),
+            ("Sweden", "sv"),
+        ),
+        "topics": (
+            "yoga", "bodybuilding", "nutrition", "mental health",
+            "crossfit", "running", "sports science", "meditation",
+        ),
+        "bios": (
+            "Certified personal trainer helping you reach your goals.",
+            "Yoga teacher sharing flows and mindfulness tips.",
+            "Nutrition coach. Healthy recipes and meal plans.",
+            "Mental health advocate & wellness blogger.",
+            "Athlete & sports science nerd. Training tips & recovery.",
+        ),
+    },
+    "food_cooking": {
+        "count": 60,
+        "follower_range": (20_000, 4_000_000),
+        "locations": (
+            ("Italy", "it"),
+            ("Mexico", "es"),
+            ("United States", "en"),
+            ("Japan", "ja"),
+            ("Spain", "es"),
+            ("India", "hi"),
+        ),
+        "topics": (
+            "baking", "healthy eating", "ethnic cuisines", "restaurant reviews",
+            "vegan", "quick recipes", "street food", "food photography",
+        ),
+        "bios": (
+            "Home cook sharing family recipes with a modern twist.",
+            "Baker & cake decorator. Sweet treats all day.",
+            "Exploring the world's cuisines one dish at a time.",
+            "Restaurant critic & foodie. Honest reviews.",
+            "Vegan chef making plant‑based meals delicious.",
+        ),
+    },
+    "travel_lifestyle": {
+        "count": 60,
+        "follower_range": (30_000, 6_000_000),
+        "locations": (
+            ("France", "fr"),
+            ("Thailand", "th"),
+            ("United States", "en"),
+            ("South Africa", "en"),
+            ("Brazil", "pt"),
+            ("Australia", "en"),
+        ),
+        "topics": (
+            "luxury travel", "budget backpacking", "solo travel", "family travel",
+            "adventure", "city guides", "cultural experiences", "digital nomad",
+        ),
+        "bios": (
+            "Travel photographer capturing the beauty of the world.",
+            "Digital nomad exploring hidden gems & local culture.",
+            "Luxury travel advisor. Hotels, resorts and experiences.",
+            "Backpacker sharing budget travel tips & tricks.",
+            "Family of four navigating the globe together.",
+        ),
+    },
+}
+
+# Name pools shared by every category
+FIRST_NAMES = (
+    "Alex", "Sam", "Jordan", "Taylor", "Chris", "Jamie",
+    "Morgan", "Casey", "Riley", "Dana", "Leo", "Mia", "Sofia", "Lucas",
+    "Ananya", "Ravi", "Luisa", "Giulia", "Yuki", "Minho",
+)
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia",
+    "Martinez", "Davis", "Lopez", "Kim", "Lee", "Patel", "Khan", "Singh",
+    "Rossi", "Bianchi", "Nakamura", "Kobayashi", "Fernandez", "Silva",
+)
+
+# Audience gender splits each category draws from
+CATEGORY_GENDER_POOLS: Dict[str, Tuple[str, ...]] = {
+    "fashion_beauty": ("80% female, 20% male", "70% female, 30% male", "60% female, 40% male"),
+    "technology_gaming": ("70% male, 30% female", "80% male, 20% female", "60% male, 40% female"),
+    "health_fitness": ("50% female, 50% male", "60% female, 40% male", "40% female, 60% male"),
+    "food_cooking": ("60% female, 40% male", "55% female, 45% male", "50% female, 50% male"),
+    "travel_lifestyle": ("50% female, 50% male", "55% female, 45% male", "45% female, 55% male"),
+}
+
+AUDIENCE_AGES = ("18-24", "25-34", "35-44", "18-34")
+
+
+# Platform distribution: 60% Instagram, 25% TikTok, 15% YouTube.  The
+# cumulative distribution is built once so a whole batch of platforms can
+# be drawn with one binary search.
+PLATFORMS = np.array(["instagram", "tiktok", "youtube"])
+PLATFORM_CDF = np.cumsum([0.6, 0.25, 0.15])
+PLATFORM_CDF /= PLATFORM_CDF[-1]
+
+
+def choose_platforms(rng: np.random.Generator, count: int) -> List[str]:
+    """Return ``count`` platforms drawn from the platform distribution."""
+    idx = np.searchsorted(PLATFORM_CDF, rng.random(count), side="right")
+    return PLATFORMS[idx].tolist()
+
+
+# Handle suffixes: nothing, a random number or one of a few words.  The
+# entry at NUMBER_SUFFIX is replaced by the drawn number.
+HANDLE_SUFFIXES = np.array(["", "", "official", "tv", "blog"])
+NUMBER_SUFFIX = 1
+
+
+def unique_handles(
+    rng: np.random.Generator, first: np.ndarray, last: np.ndarray, used: Set[str]
+) -> List[str]:
+    """Return one handle per name that clashes neither within the batch nor with ``used``.
+
+    Handles are the lowercased name plus a random suffix, built for the
+    whole batch at once.  Duplicates are found with ``np.unique`` and only
+    those rows are redrawn, with a longer random number as the suffix.
+    ``used`` is updated with the returned handles.
+    """
+    count = len(first)
+    bases = np.char.lower(np.char.add(first, last))
+    kinds = rng.integers(0, len(HANDLE_SUFFIXES), count)
+    numbers = rng.integers(1, 10_000, count).astype(str)
+    handles = np.char.add(bases, np.where(kinds == NUMBER_SUFFIX, numbers, HANDLE_SUFFIXES[kinds]))
+    while True:
+        _, first_seen = np.unique(handles, return_index=True)
+        dup = np.ones(count, dtype=bool)
+        dup[first_seen] = False
+        if used:
+            dup |= np.isin(handles, list(used))
+        if not dup.any():
+            break
+        retry = np.char.add(bases, rng.integers(10_000, 10_000_000, count).astype(str))
+        handles = np.where(dup, retry, handles)
+    result = handles.tolist()
+    used.update(result)
+    return result
+
+
+def sample_topics(rng: np.random.Generator, pool: Tuple[str, ...], count: int) -> List[str]:
+    """Return ``count`` comma-separated picks of 1–3 distinct topics from ``pool``.
+
+    Each row's picks are the first ``k`` entries of a random permutation
+    of the pool, obtained for all rows at once by argsorting a matrix of
+    uniform draws.
+    """
+    ks = rng.integers(1, 4, count).tolist()
+    order = np.argsort(rng.random((count, len(pool))), axis=1)[:, :3].tolist()
+    return [", ".join(pool[j] for j in row[:k]) for row, k in zip(order, ks)]
+
+
+def uuid7_batch(count: int) -> List[uuid.UUID]:
+    """Return ``count`` time-ordered UUID7 values in ascending order.
+
+    Same layout as ``taippa.models.uuid7``: every value carries the current
+    millisecond and its random bits come from one ``os.urandom`` call.  The
+    batch is sorted, so rows inserted in list order append to the right edge
+    of the primary key index.
+    """
+    prefix = (time.time_ns() // 1_000_000) << 80 | 0x7 << 76 | 0b10 << 62
+    raw = os.urandom(10 * count)
+    values = []
+    for i in range(0, 10 * count, 10):
+        rand = int.from_bytes(raw[i:i + 10], "big")
+        values.append(prefix | (rand >> 68) << 64 | rand & ((1 << 62) - 1))
+    values.sort()
+    return [uuid.UUID(int=value) for value in values]
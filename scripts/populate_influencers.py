@@ -22,9 +22,15 @@ SQLAlchemy's async engine and session factory defined in
 import asyncio
 import os
 import sys
-import random
-from datetime import datetime
-from typing import List, Dict, Tuple
+from datetime import datetime, timezone
+from typing import List, Dict, Set
+
+import numpy as np
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 # Add the repository root to sys.path to allow relative imports when executed
@@ -34,20 +40,35 @@ if PROJECT_ROOT not in sys.path:
 
 from taippa.taippa.database import engine, async_session_factory, Base
 from taippa.taippa.models import Tenant, Influencer
-from sqlalchemy import select
-
-
-def choose_weighted(options: List[Tuple[str, float]]) -> str:
-    """Return one option from a list of (value, weight) pairs."""
-    total = sum(weight for _, weight in options)
-    r = random.uniform(0, total)
-    upto = 0
-    for value, weight in options:
-        if upto + weight >= r:
-            return value
-        upto += weight
-    # fallback
-    return options[-1][0]
+from taippa.taippa.services.tokens import influencer_match_tokens
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from _influencer_data import (
+    AUDIENCE_AGES, CATEGORIES, CATEGORY_GENDER_POOLS, FIRST_NAMES, LAST_NAMES,
+    choose_platforms, sample_topics, unique_handles, uuid7_batch,
+)
+
+
+async def copy_influencers(session: AsyncSession, rows: List[Dict[str, object]]) -> None:
+    """Load ``rows`` into the influencers table with PostgreSQL ``COPY``.
+
+    The rows are streamed through asyncpg's ``copy_records_to_table`` on
+    the session's own connection, so they share its transaction.  Primary
+    keys and timestamps are filled in here because ``COPY`` bypasses the
+    ORM column defaults.
+    """
+    columns = [column.name for column in Influencer.__table__.columns]
+    now = datetime.now(timezone.utc)
+    records = []
+    for row, row_id in zip(rows, uuid7_batch(len(rows))):
+        row = dict(row, id=row_id, last_updated=now, created_at=now, updated_at=now)
+        records.append(tuple(row[name] for name in columns))
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        Influencer.__tablename__, records=records, columns=columns
+    )
 
 
 async def populate() -> None:
@@ -64,214 +85,88 @@ async def populate() -> None:
             await session.commit()
             await session.refresh(tenant)
 
-        # Define categories and their parameters
-        categories: Dict[str, Dict] = {
-            "fashion_beauty": {
-                "count": 60,
-                "follower_range": (10_000, 2_000_000),
-                "locations": [
-                    ("United States", "en"),
-                    ("United Kingdom", "en"),
-                    ("France", "fr"),
-                    ("Italy", "it"),
-                    ("Brazil", "pt"),
-                    ("South Korea", "ko"),
-                ],
-                "topics": [
-                    "streetwear", "luxury fashion", "skincare", "makeup tutorials",
-                    "vintage", "minimalist fashion", "plus size", "men's fashion",
-                ],
-                "bios": [
-                    "Fashion lover sharing daily #OOTD and style inspo.",
-                    "Makeup artist & beauty blogger. Reviews and tutorials.",
-                    "Skincare obsessed. Honest reviews and routines.",
-                    "Luxury fashion curator. Showing my favourite designer pieces.",
-                    "Streetwear enthusiast. Sneakers, hoodies and more.",
-                ],
-            },
-            "technology_gaming": {
-                "count": 60,
-                "follower_range": (25_000, 5_000_000),
-                "locations": [
-                    ("United States", "en"),
-                    ("United Kingdom", "en"),
-                    ("Germany", "de"),
-                    ("Japan", "ja"),
-                    ("Canada", "en"),
-                    ("South Korea", "ko"),
-                ],
-                "topics": [
-                    "mobile reviews", "PC gaming", "crypto", "blockchain",
-                    "AI", "machine learning", "hardware reviews", "programming",
-                ],
-                "bios": [
-                    "Tech reviewer sharing insights on the latest gadgets.",
-                    "Full‑time streamer & gaming enthusiast.",
-                    "Crypto and blockchain educator. Explaining DeFi & NFTs.",
-                    "AI researcher making complex topics accessible.",
-                    "PC builder & hardware geek. Benchmarks and builds.",
-                ],
-            },
-            "health_fitness": {
-                "count": 60,
-                "follower_range": (15_000, 3_000_000),
-                "locations": [
-                    ("United States", "en"),
-                    ("Australia", "en"),
-                    ("United Kingdom", "en"),
-                    ("Canada", "en"),
-                    ("Sweden", "sv"),
-                ],
-                "topics": [
-                    "yoga", "bodybuilding", "nutrition", "mental health",
-                    "crossfit", "running", "sports science", "meditation",
-                ],
-                "bios": [
-                    "Certified personal trainer helping you reach your goals.",
-                    "Yoga teacher sharing flows and mindfulness tips.",
-                    "Nutrition coach. Healthy recipes and meal plans.",
-                    "Mental health advocate & wellness blogger.",
-                    "Athlete & sports science nerd. Training tips & recovery.",
-                ],
-            },
-            "food_cooking": {
-                "count": 60,
-                "follower_range": (20_000, 4_000_000),
-                "locations": [
-                    ("Italy", "it"),
-                    ("Mexico", "es"),
-                    ("United States", "en"),
-                    ("Japan", "ja"),
-                    ("Spain", "es"),
-                    ("India", "hi"),
-                ],
-                "topics": [
-                    "baking", "healthy eating", "ethnic cuisines", "restaurant reviews",
-                    "vegan", "quick recipes", "street food", "food photography",
-                ],
-                "bios": [
-                    "Home cook sharing family recipes with a modern twist.",
-                    "Baker & cake decorator. Sweet treats all day.",
-                    "Exploring the world's cuisines one dish at a time.",
-                    "Restaurant critic & foodie. Honest reviews.",
-                    "Vegan chef making plant‑based meals delicious.",
-                ],
-            },
-            "travel_lifestyle": {
-                "count": 60,
-                "follower_range": (30_000, 6_000_000),
-                "locations": [
-                    ("France", "fr"),
-                    ("Thailand", "th"),
-                    ("United States", "en"),
-                    ("South Africa", "en"),
-                    ("Brazil", "pt"),
-                    ("Australia", "en"),
-                ],
-                "topics": [
-                    "luxury travel", "budget backpacking", "solo travel", "family travel",
-                    "adventure", "city guides", "cultural experiences", "digital nomad",
-                ],
-                "bios": [
-                    "Travel photographer capturing the beauty of the world.",
-                    "Digital nomad exploring hidden gems & local culture.",
-                    "Luxury travel advisor. Hotels, resorts and experiences.",
-                    "Backpacker sharing budget travel tips & tricks.",
-                    "Family of four navigating the globe together.",
-                ],
-            },
-        }
-
-        # Platform distribution: 60% Instagram, 25% TikTok, 15% YouTube
-        platform_weights = [("instagram", 0.6), ("tiktok", 0.25), ("youtube", 0.15)]
-
-        total_created = 0
+        rows: List[Dict[str, object]] = []
+        rng = np.random.default_rng()
+        # One timestamp for the whole run, shared by every generated row
+        now = datetime.utcnow()
+        # Track used handles to ensure uniqueness across all categories
+        used_handles: Set[str] = set()
 
-        for cat_key, cfg in categories.items():
+        for cat_key, cfg in CATEGORIES.items():
             count = cfg["count"]
             min_followers, max_followers = cfg["follower_range"]
             locations = cfg["locations"]
             topics_pool = cfg["topics"]
             bios = cfg["bios"]
-            for _ in range(count):
-                # Name generation: pick random first and last names with cultural diversity
-                first_names = [
-                    "Alex", "Sam", "Jordan", "Taylor", "Chris", "Jamie",
-                    "Morgan", "Casey", "Riley", "Dana", "Leo", "Mia", "Sofia", "Lucas",
-                    "Ananya", "Ravi", "Luisa", "Giulia", "Yuki", "Minho",
-                ]
-                last_names = [
-                    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia",
-                    "Martinez", "Davis", "Lopez", "Kim", "Lee", "Patel", "Khan", "Singh",
-                    "Rossi", "Bianchi", "Nakamura", "Kobayashi", "Fernandez", "Silva",
-                ]
-                name = f"{random.choice(first_names)} {random.choice(last_names)}"
-                # Handle generation: combine lowercase name and random number or word
-                handle_base = name.lower().replace(" ", "")
-                suffix = random.choice(["", str(random.randint(1, 9999)), "official", "tv", "blog"])
-                handle = f"{handle_base}{suffix}"
-                # Platform
-                platform = choose_weighted(platform_weights)
-                # Followers and engagement
-                followers = random.randint(min_followers, max_followers)
-                # Determine tier to derive engagement rate
-                if followers < 50_000:
-                    engagement_rate = round(random.uniform(1.5, 4.0), 2)
-                elif followers < 200_000:
-                    engagement_rate = round(random.uniform(1.0, 3.0), 2)
-                elif followers < 1_000_000:
-                    engagement_rate = round(random.uniform(0.5, 2.0), 2)
-                else:
-                    engagement_rate = round(random.uniform(0.3, 1.2), 2)
+            # Draw every random column for the category in one batch
+            first = rng.choice(FIRST_NAMES, count)
+            last = rng.choice(LAST_NAMES, count)
+            handles = unique_handles(rng, first, last, used_handles)
+            first = first.tolist()
+            last = last.tolist()
+            followers = rng.integers(min_followers, max_followers, count, endpoint=True)
+            # Engagement rate range by follower tier
+            er_low = np.where(followers < 50_000, 1.5,
+                              np.where(followers < 200_000, 1.0,
+                                       np.where(followers < 1_000_000, 0.5, 0.3)))
+            er_high = np.where(followers < 50_000, 4.0,
+                               np.where(followers < 200_000, 3.0,
+                                        np.where(followers < 1_000_000, 2.0, 1.2)))
+            engagement = np.round(rng.uniform(er_low, er_high), 2)
+            # Average likes & comments based on engagement
+            avg_likes = (followers * (engagement / 100) * rng.uniform(0.8, 1.2, count)).astype(np.int64)
+            avg_comments = (avg_likes * rng.uniform(0.02, 0.05, count)).astype(np.int64)
+            location_idx = rng.integers(0, len(locations), count).tolist()
+            topics = sample_topics(rng, topics_pool, count)
+            bio_idx = rng.integers(0, len(bios), count).tolist()
+            genders = rng.choice(CATEGORY_GENDER_POOLS[cat_key], count).tolist()
+            ages = rng.choice(AUDIENCE_AGES, count).tolist()
+            platforms = choose_platforms(rng, count)
+            followers = followers.tolist()
+            engagement = engagement.tolist()
+            avg_likes = avg_likes.tolist()
+            avg_comments = avg_comments.tolist()
+            for i in range(count):
+                name = f"{first[i]} {last[i]}"
                 # Location & language
-                country, language = random.choice(locations)
-                # Topics: pick 1‑3 unique topics
-                topics = ", ".join(random.sample(topics_pool, k=random.randint(1, 3)))
-                # Bio
-                bio = random.choice(bios)
-                # Average likes & comments based on engagement
-                avg_likes = int(followers * (engagement_rate / 100) * random.uniform(0.8, 1.2))
-                avg_comments = int(avg_likes * random.uniform(0.02, 0.05))
+                country, language = locations[location_idx[i]]
                 # Audience demographics (simplified)
                 audience_country = country
-                # Gender distribution: random but biased by category
-                if cat_key == "fashion_beauty":
-                    gender_split = random.choice(["80% female, 20% male", "70% female, 30% male", "60% female, 40% male"])
-                elif cat_key == "technology_gaming":
-                    gender_split = random.choice(["70% male, 30% female", "80% male, 20% female", "60% male, 40% female"])
-                elif cat_key == "health_fitness":
-                    gender_split = random.choice(["50% female, 50% male", "60% female, 40% male", "40% female, 60% male"])
-                elif cat_key == "food_cooking":
-                    gender_split = random.choice(["60% female, 40% male", "55% female, 45% male", "50% female, 50% male"])
-                else:
-                    gender_split = random.choice(["50% female, 50% male", "55% female, 45% male", "45% female, 55% male"])
-                audience_age = random.choice(["18-24", "25-34", "35-44", "18-34"])
-                # Create influencer
-                influencer = Influencer(
-                    handle=handle,
+                # Collect the row; it is inserted with the rest in one batch
+                rows.append(dict(
+                    handle=handles[i],
                     name=name,
-                    platform=platform,
-                    followers=followers,
-                    engagement_rate=engagement_rate,
-                    bio=bio,
-                    topics=topics,
+                    platform=platforms[i],
+                    followers=followers[i],
+                    engagement_rate=engagement[i],
+                    bio=bios[bio_idx[i]],
+                    topics=topics[i],
                     country=country,
                     language=language,
-                    avg_likes=avg_likes,
-                    avg_comments=avg_comments,
+                    avg_likes=avg_likes[i],
+                    avg_comments=avg_comments[i],
                     audience_country=audience_country,
-                    audience_gender=gender_split,
-                    audience_age=audience_age,
-                    last_updated=datetime.utcnow(),
+                    audience_gender=genders[i],
+                    audience_age=ages[i],
+                    last_updated=now,
+                    match_tokens=influencer_match_tokens(name, handles[i], platforms[i]),
                     tenant_id=tenant.id,
-                )
-                session.add(influencer)
-                total_created += 1
+                ))
             # end for
-        # commit all
+        # Bulk load all rows, bypassing the unit of work, and commit.
+        # PostgreSQL takes the COPY fast path; other backends use a
+        # batched INSERT.
+        if engine.dialect.name == "postgresql":
+            await copy_influencers(session, rows)
+        else:
+            await session.execute(insert(Influencer), rows)
         await session.commit()
-        print(f"Created {total_created} influencer profiles for tenant {tenant.name}")
+        print(f"Created {len(rows)} influencer profiles for tenant {tenant.name}")
 
 
 if __name__ == "__main__":
-    asyncio.run(populate())
\ No newline at end of file
+    # Prefer uvloop's faster event loop when it is installed
+    if uvloop is not None:
+        uvloop.run(populate())
+    else:
+        asyncio.run(populate())
\ No newline at end of file
@@ -16,7 +16,7 @@ are associated with the default tenant.
 
 This script is designed to run in environments where SQLAlchemy is not
 available.  It uses Python's built-in ``sqlite3`` module to interact
-with the database.  You can execute this script directly with:
+with the database and NumPy to draw the random columns.  You can execute this script directly with:
 
   python scripts/populate_influencers_sqlite.py
 
@@ -29,10 +29,72 @@ from __future__ import annotations
 
 import os
 import sqlite3
+import sys
 import uuid
-import random
 from datetime import datetime
-from typing import Dict, List, Tuple
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, Set
+
+import numpy as np
+
+# Add the repository root to sys.path so the app's tokenizer can be imported
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from taippa.taippa.services.tokens import influencer_match_tokens
+
+from _influencer_data import (
+    AUDIENCE_AGES, CATEGORIES, CATEGORY_GENDER_POOLS, FIRST_NAMES, LAST_NAMES,
+    choose_platforms, sample_topics, unique_handles, uuid7_batch,
+)
+
+
+# Schema for the tables this script writes, mirroring the ORM models.  IDs are
+# stored as 32-character hex strings, which is how SQLAlchemy's ``Uuid`` type
+# persists UUIDs on SQLite.
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS tenants (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    domain TEXT,
+    logo_url TEXT,
+    primary_color TEXT,
+    secondary_color TEXT,
+    site_name TEXT,
+    tagline TEXT,
+    footer_message TEXT,
+    features TEXT,
+    custom_css TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS influencers (
+    id TEXT PRIMARY KEY,
+    handle TEXT NOT NULL,
+    name TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    followers INTEGER,
+    engagement_rate REAL,
+    bio TEXT,
+    topics TEXT,
+    country TEXT,
+    language TEXT,
+    avg_likes INTEGER,
+    avg_comments INTEGER,
+    audience_country TEXT,
+    audience_gender TEXT,
+    audience_age TEXT,
+    last_updated TEXT,
+    match_tokens TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    tenant_id TEXT NOT NULL,
+    FOREIGN KEY(tenant_id) REFERENCES tenants(id) ON DELETE CASCADE
+);
+"""
 
 
 def ensure_tables(conn: sqlite3.Connection) -> None:
@@ -42,57 +104,31 @@ def ensure_tables(conn: sqlite3.Connection) -> None:
     The ``tenants`` table stores branding and configuration fields for
     white-label customisation.  The ``influencers`` table stores
     enriched influencer profiles including social metrics and
-    demographics.  Foreign key support is enabled on the connection.
+    demographics.
+
+    The DDL is sent as one script.  ``executescript`` commits any pending
+    transaction before it runs, so the script itself opens the load's
+    write transaction (``BEGIN IMMEDIATE``) and leaves it open; the
+    caller commits or rolls back.
+    """
+    conn.executescript("BEGIN IMMEDIATE;\n" + SCHEMA_SQL)
+
+
+def create_influencer_indexes(conn: sqlite3.Connection) -> None:
+    """Create the unique handle index and the tenant index on influencers.
+
+    The handle uniqueness is enforced by this index rather than a column
+    constraint so that a bulk load can insert first and build the index
+    in one sorted pass afterwards.  Index names match the ones the ORM
+    models create.
     """
-    conn.execute("PRAGMA foreign_keys = ON;")
-    # Create tenants table
     conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS tenants (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL UNIQUE,
-            domain TEXT,
-            logo_url TEXT,
-            primary_color TEXT,
-            secondary_color TEXT,
-            site_name TEXT,
-            tagline TEXT,
-            footer_message TEXT,
-            features TEXT,
-            custom_css TEXT,
-            created_at TEXT,
-            updated_at TEXT
-        );
-        """
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_influencers_handle ON influencers (handle);"
     )
-    # Create influencers table
     conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS influencers (
-            id TEXT PRIMARY KEY,
-            handle TEXT NOT NULL UNIQUE,
-            name TEXT NOT NULL,
-            platform TEXT NOT NULL,
-            followers INTEGER,
-            engagement_rate REAL,
-            bio TEXT,
-            topics TEXT,
-            country TEXT,
-            language TEXT,
-            avg_likes INTEGER,
-            avg_comments INTEGER,
-            audience_country TEXT,
-            audience_gender TEXT,
-            audience_age TEXT,
-            last_updated TEXT,
-            created_at TEXT,
-            updated_at TEXT,
-            tenant_id TEXT NOT NULL,
-            FOREIGN KEY(tenant_id) REFERENCES tenants(id) ON DELETE CASCADE
-        );
-        """
+        "CREATE INDEX IF NOT EXISTS ix_influencers_tenant_updated"
+        " ON influencers (tenant_id, updated_at);"
     )
-    conn.commit()
 
 
 def get_or_create_default_tenant(conn: sqlite3.Connection) -> str:
@@ -107,7 +143,7 @@ def get_or_create_default_tenant(conn: sqlite3.Connection) -> str:
     if row:
         return row[0]
     # Create a new tenant
-    tenant_id = str(uuid.uuid4())
+    tenant_id = uuid.uuid4().hex
     now = datetime.utcnow().isoformat()
     cur.execute(
         """
@@ -119,299 +155,146 @@ def get_or_create_default_tenant(conn: sqlite3.Connection) -> str:
         """,
         (tenant_id, "Demo Tenant", now, now),
     )
-    conn.commit()
     return tenant_id
 
 
-def choose_weighted(options: List[Tuple[str, float]]) -> str:
-    """Return one option from a list of (value, weight) pairs using random weights."""
-    total = sum(weight for _, weight in options)
-    r = random.uniform(0, total)
-    upto = 0
-    for value, weight in options:
-        if upto + weight >= r:
-            return value
-        upto += weight
-    # Fallback in case of rounding errors
-    return options[-1][0]
-
-
-def generate_influencers(tenant_id: str) -> List[Dict[str, object]]:
-    """Generate a list of influencer dictionaries across all categories.
+def generate_influencers(tenant_id: str) -> Iterator[Dict[str, object]]:
+    """Yield influencer dictionaries across all categories.
 
     Each influencer dictionary contains values matching the columns of
     the ``influencers`` table.  The generation logic is based on
     realistic ranges for follower counts, engagement rates, topics and
     demographics for five marketing verticals.  All generated
-    influencers share the supplied ``tenant_id``.
+    influencers share the supplied ``tenant_id``.  Rows are produced
+    lazily, one category batch at a time, so they can be streamed into
+    the database.
     """
-    influencers: List[Dict[str, object]] = []
-    categories: Dict[str, Dict] = {
-        "fashion_beauty": {
-            "count": 60,
-            "follower_range": (10_000, 2_000_000),
-            "locations": [
-                ("United States", "en"),
-                ("United Kingdom", "en"),
-                ("France", "fr"),
-                ("Italy", "it"),
-                ("Brazil", "pt"),
-                ("South Korea", "ko"),
-            ],
-            "topics": [
-                "streetwear", "luxury fashion", "skincare", "makeup tutorials",
-                "vintage", "minimalist fashion", "plus size", "men's fashion",
-            ],
-            "bios": [
-                "Fashion lover sharing daily #OOTD and style inspo.",
-                "Makeup artist & beauty blogger. Reviews and tutorials.",
-                "Skincare obsessed. Honest reviews and routines.",
-                "Luxury fashion curator. Showing my favourite designer pieces.",
-                "Streetwear enthusiast. Sneakers, hoodies and more.",
-            ],
-        },
-        "technology_gaming": {
-            "count": 60,
-            "follower_range": (25_000, 5_000_000),
-            "locations": [
-                ("United States", "en"),
-                ("United Kingdom", "en"),
-                ("Germany", "de"),
-                ("Japan", "ja"),
-                ("Canada", "en"),
-                ("South Korea", "ko"),
-            ],
-            "topics": [
-                "mobile reviews", "PC gaming", "crypto", "blockchain",
-                "AI", "machine learning", "hardware reviews", "programming",
-            ],
-            "bios": [
-                "Tech reviewer sharing insights on the latest gadgets.",
-                "Full‑time streamer & gaming enthusiast.",
-                "Crypto and blockchain educator. Explaining DeFi & NFTs.",
-                "AI researcher making complex topics accessible.",
-                "PC builder & hardware geek. Benchmarks and builds.",
-            ],
-        },
-        "health_fitness": {
-            "count": 60,
-            "follower_range": (15_000, 3_000_000),
-            "locations": [
-                ("United States", "en"),
-                ("Australia", "en"),
-                ("United Kingdom", "en"),
-                ("Canada", "en"),
-                ("Sweden", "sv"),
-            ],
-            "topics": [
-                "yoga", "bodybuilding", "nutrition", "mental health",
-                "crossfit", "running", "sports science", "meditation",
-            ],
-            "bios": [
-                "Certified personal trainer helping you reach your goals.",
-                "Yoga teacher sharing flows and mindfulness tips.",
-                "Nutrition coach. Healthy recipes and meal plans.",
-                "Mental health advocate & wellness blogger.",
-                "Athlete & sports science nerd. Training tips & recovery.",
-            ],
-        },
-        "food_cooking": {
-            "count": 60,
-            "follower_range": (20_000, 4_000_000),
-            "locations": [
-                ("Italy", "it"),
-                ("Mexico", "es"),
-                ("United States", "en"),
-                ("Japan", "ja"),
-                ("Spain", "es"),
-                ("India", "hi"),
-            ],
-            "topics": [
-                "baking", "healthy eating", "ethnic cuisines", "restaurant reviews",
-                "vegan", "quick recipes", "street food", "food photography",
-            ],
-            "bios": [
-                "Home cook sharing family recipes with a modern twist.",
-                "Baker & cake decorator. Sweet treats all day.",
-                "Exploring the world's cuisines one dish at a time.",
-                "Restaurant critic & foodie. Honest reviews.",
-                "Vegan chef making plant‑based meals delicious.",
-            ],
-        },
-        "travel_lifestyle": {
-            "count": 60,
-            "follower_range": (30_000, 6_000_000),
-            "locations": [
-                ("France", "fr"),
-                ("Thailand", "th"),
-                ("United States", "en"),
-                ("South Africa", "en"),
-                ("Brazil", "pt"),
-                ("Australia", "en"),
-            ],
-            "topics": [
-                "luxury travel", "budget backpacking", "solo travel", "family travel",
-                "adventure", "city guides", "cultural experiences", "digital nomad",
-            ],
-            "bios": [
-                "Travel photographer capturing the beauty of the world.",
-                "Digital nomad exploring hidden gems & local culture.",
-                "Luxury travel advisor. Hotels, resorts and experiences.",
-                "Backpacker sharing budget travel tips & tricks.",
-                "Family of four navigating the globe together.",
-            ],
-        },
-    }
-
-    # Platform distribution: 60% Instagram, 25% TikTok, 15% YouTube
-    platform_weights: List[Tuple[str, float]] = [
-        ("instagram", 0.6),
-        ("tiktok", 0.25),
-        ("youtube", 0.15),
-    ]
-
-    # Helper lists for generating names
-    first_names = [
-        "Alex", "Sam", "Jordan", "Taylor", "Chris", "Jamie",
-        "Morgan", "Casey", "Riley", "Dana", "Leo", "Mia", "Sofia", "Lucas",
-        "Ananya", "Ravi", "Luisa", "Giulia", "Yuki", "Minho",
-    ]
-    last_names = [
-        "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia",
-        "Martinez", "Davis", "Lopez", "Kim", "Lee", "Patel", "Khan", "Singh",
-        "Rossi", "Bianchi", "Nakamura", "Kobayashi", "Fernandez", "Silva",
-    ]
-
     # Track used handles to ensure uniqueness across all categories
-    used_handles: set[str] = set()
+    used_handles: Set[str] = set()
+
+    rng = np.random.default_rng()
+    # One timestamp for the whole run, shared by every generated row
+    now = datetime.utcnow().isoformat()
 
     # Generate influencers per category
-    for cat_key, cfg in categories.items():
+    for cat_key, cfg in CATEGORIES.items():
         count = cfg["count"]
         min_followers, max_followers = cfg["follower_range"]
         locations = cfg["locations"]
         topics_pool = cfg["topics"]
         bios = cfg["bios"]
-        for _ in range(count):
-            # Generate a unique ID
-            influencer_id = str(uuid.uuid4())
+        # Draw every random column for the category in one batch; the row
+        # loop below only indexes into these.
+        first = rng.choice(FIRST_NAMES, count)
+        last = rng.choice(LAST_NAMES, count)
+        handles = unique_handles(rng, first, last, used_handles)
+        first = first.tolist()
+        last = last.tolist()
+        followers = rng.integers(min_followers, max_followers, count, endpoint=True)
+        # Engagement rate range by follower tier
+        er_low = np.where(followers < 50_000, 1.5,
+                          np.where(followers < 200_000, 1.0,
+                                   np.where(followers < 1_000_000, 0.5, 0.3)))
+        er_high = np.where(followers < 50_000, 4.0,
+                           np.where(followers < 200_000, 3.0,
+                                    np.where(followers < 1_000_000, 2.0, 1.2)))
+        engagement = np.round(rng.uniform(er_low, er_high), 2)
+        # Average likes & comments (approx engagement_rate * followers)
+        avg_likes = (followers * (engagement / 100) * rng.uniform(0.8, 1.2, count)).astype(np.int64)
+        avg_comments = (avg_likes * rng.uniform(0.02, 0.05, count)).astype(np.int64)
+        location_idx = rng.integers(0, len(locations), count).tolist()
+        topics = sample_topics(rng, topics_pool, count)
+        bio_idx = rng.integers(0, len(bios), count).tolist()
+        genders = rng.choice(CATEGORY_GENDER_POOLS[cat_key], count).tolist()
+        ages = rng.choice(AUDIENCE_AGES, count).tolist()
+        platforms = choose_platforms(rng, count)
+        ids = [row_id.hex for row_id in uuid7_batch(count)]
+        followers = followers.tolist()
+        engagement = engagement.tolist()
+        avg_likes = avg_likes.tolist()
+        avg_comments = avg_comments.tolist()
+        for i in range(count):
             # Name
-            name = f"{random.choice(first_names)} {random.choice(last_names)}"
-            # Generate a unique handle.  If a collision occurs, keep trying
-            # different suffixes until a unique handle is found.  This loop
-            # should rarely iterate more than once given the large name and
-            # suffix space.
-            base_handle = name.lower().replace(" ", "")
-            while True:
-                suffix = random.choice([
-                    "",
-                    str(random.randint(1, 9999)),
-                    "official",
-                    "tv",
-                    "blog",
-                ])
-                handle = f"{base_handle}{suffix}"
-                if handle not in used_handles:
-                    used_handles.add(handle)
-                    break
-            # Platform
-            platform = choose_weighted(platform_weights)
-            # Followers
-            followers = random.randint(min_followers, max_followers)
-            # Engagement rate based on follower tier
-            if followers < 50_000:
-                engagement_rate = round(random.uniform(1.5, 4.0), 2)
-            elif followers < 200_000:
-                engagement_rate = round(random.uniform(1.0, 3.0), 2)
-            elif followers < 1_000_000:
-                engagement_rate = round(random.uniform(0.5, 2.0), 2)
-            else:
-                engagement_rate = round(random.uniform(0.3, 1.2), 2)
+            name = f"{first[i]} {last[i]}"
             # Location & language
-            country, language = random.choice(locations)
-            # Topics: pick 1–3 topics
-            topics = ", ".join(random.sample(topics_pool, k=random.randint(1, 3)))
-            # Bio
-            bio = random.choice(bios)
-            # Average likes & comments (approx engagement_rate * followers)
-            avg_likes = int(followers * (engagement_rate / 100) * random.uniform(0.8, 1.2))
-            avg_comments = int(avg_likes * random.uniform(0.02, 0.05))
+            country, language = locations[location_idx[i]]
             # Audience demographics
             audience_country = country
-            # Gender distribution with category biases
-            if cat_key == "fashion_beauty":
-                gender_split = random.choice([
-                    "80% female, 20% male", "70% female, 30% male", "60% female, 40% male"
-                ])
-            elif cat_key == "technology_gaming":
-                gender_split = random.choice([
-                    "70% male, 30% female", "80% male, 20% female", "60% male, 40% female"
-                ])
-            elif cat_key == "health_fitness":
-                gender_split = random.choice([
-                    "50% female, 50% male", "60% female, 40% male", "40% female, 60% male"
-                ])
-            elif cat_key == "food_cooking":
-                gender_split = random.choice([
-                    "60% female, 40% male", "55% female, 45% male", "50% female, 50% male"
-                ])
-            else:  # travel_lifestyle
-                gender_split = random.choice([
-                    "50% female, 50% male", "55% female, 45% male", "45% female, 55% male"
-                ])
-            audience_age = random.choice(["18-24", "25-34", "35-44", "18-34"])
-            now = datetime.utcnow().isoformat()
-            influencers.append({
-                "id": influencer_id,
-                "handle": handle,
+            yield {
+                "id": ids[i],
+                "handle": handles[i],
                 "name": name,
-                "platform": platform,
-                "followers": followers,
-                "engagement_rate": engagement_rate,
-                "bio": bio,
-                "topics": topics,
+                "platform": platforms[i],
+                "followers": followers[i],
+                "engagement_rate": engagement[i],
+                "bio": bios[bio_idx[i]],
+                "topics": topics[i],
                 "country": country,
                 "language": language,
-                "avg_likes": avg_likes,
-                "avg_comments": avg_comments,
+                "avg_likes": avg_likes[i],
+                "avg_comments": avg_comments[i],
                 "audience_country": audience_country,
-                "audience_gender": gender_split,
-                "audience_age": audience_age,
+                "audience_gender": genders[i],
+                "audience_age": ages[i],
                 "last_updated": now,
+                "match_tokens": influencer_match_tokens(name, handles[i], platforms[i]),
                 "created_at": now,
                 "updated_at": now,
                 "tenant_id": tenant_id,
-            })
-    return influencers
+            }
+
+
+# Influencer columns in table order; rows are bound positionally in this order
+INFLUENCER_COLUMNS = (
+    "id", "handle", "name", "platform", "followers", "engagement_rate", "bio",
+    "topics", "country", "language", "avg_likes", "avg_comments",
+    "audience_country", "audience_gender", "audience_age",
+    "last_updated", "match_tokens", "created_at", "updated_at", "tenant_id",
+)
+
+# Extracts a record's values as a tuple in column order (C-level lookup)
+_row_values = itemgetter(*INFLUENCER_COLUMNS)
 
+# SQLite's default limit is 999 bound parameters per statement
+ROWS_PER_STATEMENT = 999 // len(INFLUENCER_COLUMNS)
 
-def insert_influencers(conn: sqlite3.Connection, influencers: List[Dict[str, object]]) -> None:
+
+def _insert_statement(rows: int) -> str:
+    """Return an INSERT statement with ``rows`` positional VALUES groups."""
+    group = "(" + ", ".join("?" * len(INFLUENCER_COLUMNS)) + ")"
+    return (
+        f"INSERT INTO influencers ({', '.join(INFLUENCER_COLUMNS)}) "
+        f"VALUES {', '.join([group] * rows)};"
+    )
+
+
+def insert_influencers(conn: sqlite3.Connection, influencers: Iterable[Dict[str, object]]) -> int:
     """Bulk insert influencer records into the database.
 
-    Uses executemany for efficiency.  Duplicate handles will cause an
-    integrity error due to the unique constraint, but the random
-    generation logic aims to avoid collisions.  If duplicates occur,
-    the caller should regenerate the dataset or adjust handle logic.
+    Records are bound positionally in ``INFLUENCER_COLUMNS`` order and
+    written with multi-row ``INSERT ... VALUES (...), (...)`` statements,
+    as many rows per statement as SQLite's bound-parameter limit allows.
+    Duplicate handles will cause an integrity error due to the unique
+    index, but the random generation logic aims to avoid collisions.
+    If duplicates occur, the caller should regenerate the dataset or
+    adjust handle logic.
+
+    ``influencers`` may be any iterable, including a generator; it is
+    consumed one statement's worth of rows at a time.  Returns the
+    number of records inserted.
     """
     cur = conn.cursor()
-    # Prepare insertion statement
-    stmt = (
-        """
-        INSERT INTO influencers (
-            id, handle, name, platform, followers, engagement_rate, bio,
-            topics, country, language, avg_likes, avg_comments,
-            audience_country, audience_gender, audience_age,
-            last_updated, created_at, updated_at, tenant_id
-        ) VALUES (
-            :id, :handle, :name, :platform, :followers, :engagement_rate, :bio,
-            :topics, :country, :language, :avg_likes, :avg_comments,
-            :audience_country, :audience_gender, :audience_age,
-            :last_updated, :created_at, :updated_at, :tenant_id
-        );
-        """
-    )
-    cur.executemany(stmt, influencers)
-    conn.commit()
+    rows = map(_row_values, influencers)
+    full_stmt = _insert_statement(ROWS_PER_STATEMENT)
+    total = 0
+    while True:
+        chunk = list(islice(rows, ROWS_PER_STATEMENT))
+        if not chunk:
+            break
+        stmt = full_stmt if len(chunk) == ROWS_PER_STATEMENT else _insert_statement(len(chunk))
+        cur.execute(stmt, list(chain.from_iterable(chunk)))
+        total += len(chunk)
+    return total
 
 
 def main() -> None:
@@ -420,11 +303,29 @@ def main() -> None:
     # Connect to SQLite database (creates file if missing)
     conn = sqlite3.connect(db_path)
     try:
-        ensure_tables(conn)
-        tenant_id = get_or_create_default_tenant(conn)
-        influencers = generate_influencers(tenant_id)
-        insert_influencers(conn, influencers)
-        print(f"Inserted {len(influencers)} influencer records into {db_path} for tenant {tenant_id}.")
+        # PRAGMAs must be set outside a transaction.  WAL with
+        # synchronous=NORMAL avoids a full fsync on commit.
+        conn.executescript(
+            """
+            PRAGMA foreign_keys = ON;
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -64000;
+            """
+        )
+        # Run the whole load as one write transaction with a single
+        # commit; ensure_tables() opens it
+        try:
+            ensure_tables(conn)
+            tenant_id = get_or_create_default_tenant(conn)
+            inserted = insert_influencers(conn, generate_influencers(tenant_id))
+            create_influencer_indexes(conn)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        print(f"Inserted {inserted} influencer records into {db_path} for tenant {tenant_id}.")
     finally:
         conn.close()
 
@@ -6,50 +6,210 @@ generating JSON Web Tokens and retrieving the current user from a request.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Annotated, Optional
+from datetime import timedelta
+from functools import lru_cache
+from typing import Annotated, Awaitable, Callable, Dict, FrozenSet, Optional, Tuple
 
+import asyncio
+import hashlib
+import hmac
 import os
-from jose import JWTError, jwt
+import time
+from concurrent.futures import ThreadPoolExecutor
+import jwt
+from cachetools import TTLCache
+from jwt import InvalidTokenError
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import joinedload
 
 from .models import User, RoleEnum
 from .schemas import Token, TokenData
-from .database import get_session
+from .database import current_session, get_session
+
+# JWT settings, read once at import time
+_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "changeme")
+_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+_EXPIRE_SECONDS = _EXPIRE_MINUTES * 60
+
+
+@lru_cache(maxsize=1)
+def _ctx() -> CryptContext:
+    """Return the bcrypt password hashing context, built on first use.
+
+    Building it loads and probes the bcrypt backend, which processes that
+    never check a password should not pay for.  The cost factor can be tuned
+    with the BCRYPT_ROUNDS environment variable.
+    """
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=int(os.getenv("BCRYPT_ROUNDS", "12")),
+    )
+
+
+# bcrypt is CPU-bound and would block the event loop, so hashing and
+# verification run on this pool instead.  bcrypt releases the GIL, so one
+# worker per core (BCRYPT_WORKERS to override) runs logins in parallel
+# without queueing behind the shared default thread pool.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("BCRYPT_WORKERS", "0")) or os.cpu_count(),
+    thread_name_prefix="bcrypt",
+)
+
+
+@lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    """Hash checked when a login names an unknown email, so that path costs
+    the same as a real password check and does not reveal whether the email
+    exists."""
+    return _ctx().hash(os.urandom(16).hex())
+
+
+# Successful password checks, keyed by an HMAC-SHA256 of the plaintext and
+# the stored hash.  Lets clients that log in repeatedly skip the bcrypt KDF
+# for five minutes.  Failures are never cached, and a password change alters
+# the stored hash so old entries stop matching.  The HMAC key is random per
+# process, so the cache keys are useless for guessing passwords outside it.
+_verify_cache: TTLCache[bytes, bool] = TTLCache(maxsize=1024, ttl=300)
+_VERIFY_CACHE_SECRET = os.urandom(32)
+
+
+def _verify_key(plain_password: str, hashed_password: str) -> bytes:
+    return hmac.new(
+        _VERIFY_CACHE_SECRET,
+        plain_password.encode() + b"\0" + hashed_password.encode(),
+        hashlib.sha256,
+    ).digest()
+
+
+def _verify(plain_password: str, hashed_password: Optional[str]) -> bool:
+    if hashed_password is None:
+        hashed_password = _dummy_hash()
+    return _ctx().verify(plain_password, hashed_password)
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # OAuth2 scheme for retrieving token from Authorization header
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
+# Users resolved from recently seen tokens, keyed by a 16-byte BLAKE2b
+# digest of the token and stored with the token's expiry.  Lets repeat
+# requests with the same token skip the user lookup for up to a minute.
+token_cache: TTLCache[bytes, Tuple[float, User]] = TTLCache(maxsize=4096, ttl=60)
+
+# Verified token payloads, keyed like ``token_cache`` and kept until the
+# token itself expires.  Once full, the oldest entry is evicted first.
+_jwt_cache: Dict[bytes, Tuple[float, dict]] = {}
+_JWT_CACHE_SIZE = 10_000
+
+
+# Users looked up by email, detached from the session that loaded them.
+# Shared across requests and sessions for a short time; call
+# invalidate_user() whenever a user's password or role changes.
+_user_cache: TTLCache[str, User] = TTLCache(maxsize=2048, ttl=30)
+
+
+def invalidate_user(email: str) -> None:
+    """Drop ``email`` from the user lookup cache."""
+    _user_cache.pop(email, None)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Return True if the provided password matches the stored hash."""
-    return pwd_context.verify(plain_password, hashed_password)
 
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
 
-def get_password_hash(password: str) -> str:
+
+def invalidate_token(token: str) -> None:
+    """Drop ``token`` from the auth caches, e.g. on logout or password change."""
+    key = _token_key(token)
+    token_cache.pop(key, None)
+    _jwt_cache.pop(key, None)
+
+
+def _decode_token(token: str, key: bytes) -> dict:
+    """Return the verified payload of ``token``, reusing an earlier decode.
+
+    Raises ``InvalidTokenError`` if the token is invalid or has expired.
+    """
+    cached = _jwt_cache.get(key)
+    if cached is not None:
+        if time.time() < cached[0]:
+            return cached[1]
+        del _jwt_cache[key]
+    payload = jwt.decode(token, _SECRET_KEY, algorithms=[_ALGORITHM])
+    exp = payload.get("exp")
+    if exp is not None:
+        if len(_jwt_cache) >= _JWT_CACHE_SIZE:
+            del _jwt_cache[next(iter(_jwt_cache))]
+        _jwt_cache[key] = (exp, payload)
+    return payload
+
+
+async def verify_password(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """Return True if the provided password matches the stored hash.
+
+    A ``hashed_password`` of None is checked against a dummy hash and always
+    fails.
+    """
+    if hashed_password is not None:
+        key = _verify_key(plain_password, hashed_password)
+        if key in _verify_cache:
+            return True
+    loop = asyncio.get_running_loop()
+    valid = await loop.run_in_executor(
+        _hash_executor, _verify, plain_password, hashed_password
+    )
+    if valid and hashed_password is not None:
+        _verify_cache[key] = True
+    return valid
+
+
+async def get_password_hash(password: str) -> str:
     """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, lambda: _ctx().hash(password))
+
+
+# Built once; only the email parameter is bound per call.  The tenant is
+# joined in so routers can read ``current_user.tenant`` without a lazy load,
+# which async sessions (and detached cached users) cannot perform.
+_GET_USER_BY_EMAIL_STMT = (
+    select(User)
+    .options(joinedload(User.tenant))
+    .where(User.email == bindparam("email"))
+)
+
 
+async def get_user_by_email(session: Optional[AsyncSession], email: str) -> Optional[User]:
+    """Return a User by email or None if not found.
 
-async def get_user_by_email(session: AsyncSession, email: str) -> Optional[User]:
-    """Return a User by email or None if not found."""
-    result = await session.execute(select(User).where(User.email == email))
-    return result.scalars().first()
+    Found users are cached for a short time as detached instances (see
+    ``_user_cache``); misses are not cached.  Pass ``session=None`` to use
+    the current request's session.
+    """
+    user = _user_cache.get(email)
+    if user is not None:
+        return user
+    if session is None:
+        session = current_session()
+    result = await session.execute(_GET_USER_BY_EMAIL_STMT, {"email": email})
+    user = result.scalars().first()
+    if user is not None:
+        session.expunge(user)
+        _user_cache[email] = user
+    return user
 
 
 async def authenticate_user(session: AsyncSession, email: str, password: str) -> Optional[User]:
     """Verify a user's credentials and return the user if valid."""
     user = await get_user_by_email(session, email)
     if not user:
+        await verify_password(password, None)
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password(password, user.hashed_password):
         return None
     return user
 
@@ -58,15 +218,15 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """Generate a JWT access token containing the provided data.
 
     The token payload includes an expiration claim (`exp`) calculated from
-    `expires_delta`.  The token is signed using the secret key and algorithm
-    configured via environment variables.
+    `expires_delta`, defaulting to ACCESS_TOKEN_EXPIRE_MINUTES.  The token is
+    signed using the secret key and algorithm configured via environment
+    variables, which are read once at import time.
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))))
-    to_encode.update({"exp": expire})
-    secret_key = os.getenv("JWT_SECRET_KEY", "changeme")
-    algorithm = os.getenv("JWT_ALGORITHM", "HS256")
-    encoded_jwt = jwt.encode(to_encode, secret_key, algorithm=algorithm)
+    # `exp` is a NumericDate, so compute it in epoch seconds directly
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else _EXPIRE_SECONDS
+    to_encode["exp"] = int(time.time()) + lifetime
+    encoded_jwt = jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
     return encoded_jwt
 
 
@@ -76,6 +236,10 @@ async def get_current_user(
 ) -> User:
     """Extract the current user from the JWT token.
 
+    Verified payloads are cached until the token expires, and users resolved
+    from a token are cached briefly (see ``token_cache``), so repeat requests
+    with the same unexpired token skip the signature check and the database
+    lookup.
     Raises HTTP 401 if the token is invalid or the user cannot be found.
     """
     credentials_exception = HTTPException(
@@ -83,19 +247,24 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    secret_key = os.getenv("JWT_SECRET_KEY", "changeme")
-    algorithm = os.getenv("JWT_ALGORITHM", "HS256")
+    cache_key = _token_key(token)
+    cached = token_cache.get(cache_key)
+    if cached is not None and time.time() < cached[0]:
+        return cached[1]
     try:
-        payload = jwt.decode(token, secret_key, algorithms=[algorithm])
+        payload = _decode_token(token, cache_key)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
         token_data = TokenData(email=email)
-    except JWTError:
+    except InvalidTokenError:
         raise credentials_exception
     user = await get_user_by_email(session, token_data.email)
     if user is None:
         raise credentials_exception
+    exp = payload.get("exp")
+    if exp is not None:
+        token_cache[cache_key] = (exp, user)
     return user
 
 
@@ -110,6 +279,10 @@ async def get_current_active_user(
     return current_user
 
 
+# Dependencies built by require_role(), keyed by their set of allowed roles
+_role_dependencies: Dict[FrozenSet[RoleEnum], Callable[..., Awaitable[User]]] = {}
+
+
 def require_role(*allowed_roles: RoleEnum):
     """Return a dependency that enforces one of the specified roles.
 
@@ -120,9 +293,17 @@ def require_role(*allowed_roles: RoleEnum):
         async def read_admin_data(current_user: User = Depends(require_role(RoleEnum.admin))):
             ...
     """
+    allowed = frozenset(allowed_roles)
+    # One dependency per role set, so every route requiring the same roles
+    # shares it and FastAPI resolves it at most once per request
+    role_dependency = _role_dependencies.get(allowed)
+    if role_dependency is not None:
+        return role_dependency
+
     async def role_dependency(current_user: Annotated[User, Depends(get_current_active_user)]) -> User:
-        if current_user.role not in allowed_roles:
+        if current_user.role not in allowed:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
         return current_user
 
+    _role_dependencies[allowed] = role_dependency
     return role_dependency
\ No newline at end of file
@@ -3,31 +3,66 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from typing import Coroutine
 
 from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine
 
-from .database import Base, engine
+from .database import Base, async_session_factory, engine
+from .pagination import NEXT_CURSOR_HEADER
 from .routers import auth as auth_router
 from .routers import brands as brands_router
 from .routers import campaigns as campaigns_router
 from .routers import influencers as influencers_router
+from .routers import subscriptions as subscriptions_router
+from .routers import leads as leads_router
+from .routers import tenants as tenants_router
+from .routers import match as match_router
+from .routers import analytics as analytics_router
+from .services import ai as ai_service
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CORS_SETTINGS = {
+    "allow_origins": ["*"],
+    "allow_credentials": True,
+    "allow_methods": ["*"],
+    "allow_headers": ["*"],
+    # Let browser clients read the list endpoints' pagination cursor
+    "expose_headers": [NEXT_CURSOR_HEADER],
+}
+
+
+def _create_missing_tables(conn) -> None:
+    """Create tables absent from the database in one pass.
+
+    The existing table names are read with a single introspection query,
+    so ``create_all`` does not have to check each table separately.
+    """
+    existing = set(inspect(conn).get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    if missing:
+        Base.metadata.create_all(conn, tables=missing, checkfirst=False)
 
 
 def create_application() -> FastAPI:
     """Create and configure the FastAPI application instance."""
-    app = FastAPI(title="TAIPPA Influencer Marketing Platform")
+    # Serialise responses with orjson when it is installed
+    app = FastAPI(
+        title="TAIPPA Influencer Marketing Platform",
+        default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+    )
 
     # Enable CORS for development and production front‑end.  In production you may restrict origins.
-    from fastapi.middleware.cors import CORSMiddleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"] ,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"]
-    )
+    app.add_middleware(CORSMiddleware, **CORS_SETTINGS)
 
     # Include routers
     app.include_router(auth_router.router)
@@ -35,11 +70,6 @@ def create_application() -> FastAPI:
     app.include_router(campaigns_router.router)
     app.include_router(influencers_router.router)
     # Newly added routers for subscriptions and leads
-    from .routers import subscriptions as subscriptions_router
-    from .routers import leads as leads_router
-    from .routers import tenants as tenants_router
-    from .routers import match as match_router
-    from .routers import analytics as analytics_router
     app.include_router(subscriptions_router.router)
     app.include_router(leads_router.router)
     app.include_router(tenants_router.router)
@@ -49,9 +79,52 @@ def create_application() -> FastAPI:
     # Startup event to create tables
     @app.on_event("startup")
     async def on_startup() -> None:
-        # Create database tables.  In production use migrations instead.
+        # Create missing database tables when TAIPPA_AUTOCREATE=1.  Until
+        # the schema has migrations, docker-compose.yml and
+        # deploy_railway.sh set it.
+        if os.getenv("TAIPPA_AUTOCREATE", "0") != "1":
+            return
         async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+            # With several workers on PostgreSQL only the one holding the
+            # advisory lock issues DDL; the lock is released on commit.
+            if conn.dialect.name == "postgresql":
+                locked = await conn.scalar(text("SELECT pg_try_advisory_xact_lock(42)"))
+                if not locked:
+                    return
+            await conn.run_sync(_create_missing_tables)
+
+    # Resolve the tenant used for public signups and leads once per process
+    @app.on_event("startup")
+    async def resolve_default_tenant() -> None:
+        app.state.default_tenant_id = None
+        try:
+            async with async_session_factory() as session:
+                app.state.default_tenant_id = await tenants_router.lookup_default_tenant_id(session)
+        except SQLAlchemyError:
+            # Schema not created yet; routes look the tenant up on first use
+            pass
+
+    # Keep stored influencer segments fresh.  Every worker runs the refresh;
+    # on PostgreSQL an advisory lock keeps two of them off the same
+    # segmentation.  SEGMENTS_REFRESH_MINUTES=0 disables it (e.g. when a
+    # dedicated worker runs it instead).
+    @app.on_event("startup")
+    async def start_segment_refresh() -> None:
+        interval = float(os.getenv("SEGMENTS_REFRESH_MINUTES", "10")) * 60
+        app.state.segment_refresh = None
+        if interval > 0 and analytics_router.MiniBatchKMeans is not None:
+            app.state.segment_refresh = asyncio.create_task(
+                analytics_router.refresh_segments_periodically(interval)
+            )
+
+    @app.on_event("shutdown")
+    async def stop_segment_refresh() -> None:
+        if app.state.segment_refresh is not None:
+            app.state.segment_refresh.cancel()
+
+    @app.on_event("shutdown")
+    async def close_ai_client() -> None:
+        await ai_service.close_client()
 
     # Health check endpoint
     @app.get("/health", tags=["Health"])
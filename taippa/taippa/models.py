@@ -12,15 +12,50 @@ and clarity.
 from __future__ import annotations
 
 import enum
+import os
+import time
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Enum, ForeignKey, String, Text, DateTime, Float, Integer
+from sqlalchemy import DDL, CheckConstraint, ForeignKey, Index, LargeBinary, String, Text, DateTime, Float, Integer, Uuid, event, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
 
 
+try:
+    from uuid import uuid7
+except ImportError:  # Python < 3.14
+    def uuid7() -> uuid.UUID:
+        """Return a time-ordered UUID (version 7, RFC 9562).
+
+        The leading 48 bits are the Unix time in milliseconds, so new keys sort
+        after existing ones and inserts land at the right edge of the primary
+        key index instead of on random pages.
+        """
+        rand = int.from_bytes(os.urandom(10), "big")
+        value = (
+            (time.time_ns() // 1_000_000) << 80
+            | 0x7 << 76
+            | (rand >> 68) << 64
+            | 0b10 << 62
+            | rand & ((1 << 62) - 1)
+        )
+        return uuid.UUID(int=value)
+
+
+def _one_of(column: str, choices: type[enum.Enum], name: str) -> CheckConstraint:
+    """Return a CHECK constraint limiting ``column`` to the values of ``choices``.
+
+    Enumerated columns are stored as short strings guarded by this constraint
+    rather than as SQLAlchemy ``Enum`` types, which avoids a Postgres ``CREATE
+    TYPE`` per enum and per-row enum conversion.  The Python enums are still
+    used for validation in the API schemas.
+    """
+    values = ", ".join(f"'{choice.value}'" for choice in choices)
+    return CheckConstraint(f"{column} IN ({values})", name=name)
+
+
 # ---------------------------------------------------------------------------
 # Tenancy and User Models
 # ---------------------------------------------------------------------------
@@ -32,8 +67,8 @@ class Tenant(Base):
 
     __tablename__ = "tenants"
 
-    id: Mapped[str] = mapped_column(
-        String(length=36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), primary_key=True, default=uuid7
     )
     name: Mapped[str] = mapped_column(String(length=100), unique=True)
     domain: Mapped[str | None] = mapped_column(String(length=255), nullable=True)
@@ -49,10 +84,10 @@ class Tenant(Base):
     custom_css: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True),
-                                                 default=datetime.utcnow)
+                                                 server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True),
-                                                 default=datetime.utcnow,
-                                                 onupdate=datetime.utcnow)
+                                                 server_default=func.now(),
+                                                 onupdate=func.now())
 
     # Relationships
     users: Mapped[list["User"]] = relationship(
@@ -85,23 +120,25 @@ class User(Base):
     """Represents a user of the TAIPPA platform."""
 
     __tablename__ = "users"
+    __table_args__ = (_one_of("role", RoleEnum, "ck_users_role"),)
 
-    id: Mapped[str] = mapped_column(
-        String(length=36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), primary_key=True, default=uuid7
     )
     email: Mapped[str] = mapped_column(String(length=320), unique=True, index=True)
-    hashed_password: Mapped[str] = mapped_column(String(length=255))
+    # bcrypt hashes are always 60 characters
+    hashed_password: Mapped[str] = mapped_column(String(length=60))
     full_name: Mapped[str | None] = mapped_column(String(length=100), nullable=True)
-    role: Mapped[RoleEnum] = mapped_column(Enum(RoleEnum), default=RoleEnum.client)
+    role: Mapped[str] = mapped_column(String(length=16), default=RoleEnum.client.value)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    tenant_id: Mapped[str] = mapped_column(ForeignKey("tenants.id"), index=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), index=True)
     tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="users")
 
     # relationships
@@ -118,11 +155,15 @@ class Brand(Base):
     """Represents a brand profile within the system."""
 
     __tablename__ = "brands"
+    __table_args__ = (
+        Index("ix_brands_tenant_owner", "tenant_id", "owner_id"),
+        Index("ix_brands_tenant_name", "tenant_id", "name"),
+    )
 
-    id: Mapped[str] = mapped_column(
-        String(length=36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), primary_key=True, default=uuid7
     )
-    owner_id: Mapped[str] = mapped_column(ForeignKey("users.id"), index=True)
+    owner_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True)
     name: Mapped[str] = mapped_column(String(length=100))
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     industry: Mapped[str | None] = mapped_column(String(length=100), nullable=True)
@@ -131,10 +172,10 @@ class Brand(Base):
     budget: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     owner: Mapped["User"] = relationship("User", back_populates="brands")
@@ -142,7 +183,7 @@ class Brand(Base):
         "Campaign", back_populates="brand", cascade="all, delete-orphan"
     )
 
-    tenant_id: Mapped[str] = mapped_column(ForeignKey("tenants.id"), index=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
     tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="brands")
 
 
@@ -160,15 +201,26 @@ class Campaign(Base):
     """Represents an influencer marketing campaign."""
 
     __tablename__ = "campaigns"
+    __table_args__ = (
+        Index("ix_campaigns_tenant_brand", "tenant_id", "brand_id"),
+        Index("ix_campaigns_tenant_status", "tenant_id", "status"),
+        _one_of("status", CampaignStatus, "ck_campaigns_status"),
+        # Partial index over live campaigns only (Postgres)
+        Index(
+            "ix_campaigns_tenant_active",
+            "tenant_id",
+            postgresql_where=text("status IN ('active', 'paused')"),
+        ),
+    )
 
-    id: Mapped[str] = mapped_column(
-        String(length=36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), primary_key=True, default=uuid7
     )
-    brand_id: Mapped[str] = mapped_column(ForeignKey("brands.id"), index=True)
+    brand_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("brands.id"), index=True)
     title: Mapped[str] = mapped_column(String(length=150))
     brief: Mapped[str] = mapped_column(Text)
-    status: Mapped[CampaignStatus] = mapped_column(
-        Enum(CampaignStatus), default=CampaignStatus.draft
+    status: Mapped[str] = mapped_column(
+        String(length=16), default=CampaignStatus.draft.value
     )
     start_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True),
                                                         nullable=True)
@@ -178,15 +230,15 @@ class Campaign(Base):
     analysis: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     brand: Mapped["Brand"] = relationship("Brand", back_populates="campaigns")
 
-    tenant_id: Mapped[str] = mapped_column(ForeignKey("tenants.id"), index=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
     tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="campaigns")
 
 
@@ -198,9 +250,14 @@ class Influencer(Base):
     """Represents an influencer profile in the system."""
 
     __tablename__ = "influencers"
+    __table_args__ = (
+        Index("ix_influencers_tenant_updated", "tenant_id", "updated_at"),
+        Index("ix_influencers_tenant_followers", "tenant_id", "followers"),
+        Index("ix_influencers_tenant_engagement", "tenant_id", "engagement_rate"),
+    )
 
-    id: Mapped[str] = mapped_column(
-        String(length=36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), primary_key=True, default=uuid7
     )
     handle: Mapped[str] = mapped_column(String(length=100), unique=True, index=True)
     name: Mapped[str] = mapped_column(String(length=100))
@@ -223,17 +280,92 @@ class Influencer(Base):
                                                      nullable=True)
     last_updated: Mapped[datetime | None] = mapped_column(DateTime(timezone=True),
                                                           nullable=True)
+    # Space-separated matchmaking tokens of name, handle and platform, written
+    # alongside them so /match does not re-tokenise on every request.  NULL
+    # for rows written before the column existed.
+    match_tokens: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    tenant_id: Mapped[str] = mapped_column(ForeignKey("tenants.id"), index=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
     tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="influencers")
 
 
+# Lower-cased text matched by the influencer search's ``q`` parameter.  On
+# PostgreSQL a pg_trgm GIN index over this expression serves
+# ``LIKE '%term%'`` lookups, which a btree cannot.
+INFLUENCER_SEARCH_TEXT = func.lower(
+    Influencer.name
+    + " "
+    + Influencer.handle
+    + " "
+    + func.coalesce(Influencer.topics, "")
+    + " "
+    + func.coalesce(Influencer.bio, "")
+)
+
+event.listen(
+    Influencer.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+Index(
+    "ix_influencers_search_trgm",
+    INFLUENCER_SEARCH_TEXT.label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+
+class InfluencerSegment(Base):
+    """One precomputed influencer cluster for a tenant and cluster count.
+
+    Rows are written by the analytics router and refreshed periodically in
+    the background, so the segments endpoint normally reads this table
+    instead of clustering on every request.
+    """
+
+    __tablename__ = "influencer_segments"
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), primary_key=True)
+    k: Mapped[int] = mapped_column(Integer, primary_key=True)
+    label: Mapped[int] = mapped_column(Integer, primary_key=True)
+    size: Mapped[int] = mapped_column(Integer)
+    avg_followers: Mapped[float] = mapped_column(Float)
+    avg_engagement_rate: Mapped[float] = mapped_column(Float)
+    avg_avg_likes: Mapped[float] = mapped_column(Float)
+    avg_avg_comments: Mapped[float] = mapped_column(Float)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+class ClusteringState(Base):
+    """The fitted k-means model behind a tenant's stored influencer segments.
+
+    Arrays are stored as raw float64 bytes: ``centers`` is (k, 4) in scaled
+    feature space, ``counts`` the number of rows each center has absorbed,
+    and ``mean``/``scale`` the feature standardisation.  ``fitted_at`` is
+    the database time the model last saw, so later refreshes only need to
+    fold in influencers updated since then.
+    """
+
+    __tablename__ = "clustering_states"
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), primary_key=True)
+    k: Mapped[int] = mapped_column(Integer, primary_key=True)
+    n: Mapped[int] = mapped_column(Integer)
+    centers: Mapped[bytes] = mapped_column(LargeBinary)
+    counts: Mapped[bytes] = mapped_column(LargeBinary)
+    mean: Mapped[bytes] = mapped_column(LargeBinary)
+    scale: Mapped[bytes] = mapped_column(LargeBinary)
+    fitted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
 class SubscriptionStatus(str, enum.Enum):
     """Possible states for a subscription."""
 
@@ -246,8 +378,8 @@ class SubscriptionPlan(Base):
 
     __tablename__ = "subscription_plans"
 
-    id: Mapped[str] = mapped_column(
-        String(length=36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), primary_key=True, default=uuid7
     )
     name: Mapped[str] = mapped_column(String(length=100), unique=True)
     price: Mapped[float] = mapped_column(Float)
@@ -258,10 +390,10 @@ class SubscriptionPlan(Base):
     active: Mapped[bool] = mapped_column(default=True)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
 
@@ -269,30 +401,37 @@ class Subscription(Base):
     """Represents a user's subscription to a plan."""
 
     __tablename__ = "subscriptions"
+    __table_args__ = (
+        Index("ix_subs_tenant_user", "tenant_id", "user_id"),
+        # Partial index over each user's active subscription, which every
+        # subscribe, cancel and /me request looks up (Postgres)
+        Index("ix_subscriptions_user_active", "user_id", postgresql_where=text("status = 'active'")),
+        _one_of("status", SubscriptionStatus, "ck_subscriptions_status"),
+    )
 
-    id: Mapped[str] = mapped_column(
-        String(length=36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), primary_key=True, default=uuid7
     )
-    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), index=True)
-    plan_id: Mapped[str] = mapped_column(ForeignKey("subscription_plans.id"),
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True)
+    plan_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("subscription_plans.id"),
                                          index=True)
     start_date: Mapped[datetime] = mapped_column(DateTime(timezone=True),
-                                                 default=datetime.utcnow)
+                                                 server_default=func.now())
     end_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True),
                                                       nullable=True)
-    status: Mapped[SubscriptionStatus] = mapped_column(
-        Enum(SubscriptionStatus), default=SubscriptionStatus.active
+    status: Mapped[str] = mapped_column(
+        String(length=16), default=SubscriptionStatus.active.value
     )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     # Link subscription to tenant via the user (subscriptions belong to a tenant)
-    tenant_id: Mapped[str] = mapped_column(ForeignKey("tenants.id"), index=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
     tenant: Mapped["Tenant"] = relationship("Tenant")
 
 
@@ -314,22 +453,26 @@ class Lead(Base):
     """Represents a marketing lead captured from the website."""
 
     __tablename__ = "leads"
+    __table_args__ = (
+        Index("ix_leads_tenant_status", "tenant_id", "status"),
+        _one_of("status", LeadStatus, "ck_leads_status"),
+    )
 
-    id: Mapped[str] = mapped_column(
-        String(length=36), primary_key=True, default=lambda: str(uuid.uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), primary_key=True, default=uuid7
     )
     name: Mapped[str] = mapped_column(String(length=100))
     email: Mapped[str] = mapped_column(String(length=320))
     company: Mapped[str | None] = mapped_column(String(length=100), nullable=True)
     message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    status: Mapped[LeadStatus] = mapped_column(
-        Enum(LeadStatus), default=LeadStatus.new
+    status: Mapped[str] = mapped_column(
+        String(length=16), default=LeadStatus.new.value
     )
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now()
     )
 
-    tenant_id: Mapped[str] = mapped_column(ForeignKey("tenants.id"), index=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
     tenant: Mapped["Tenant"] = relationship("Tenant", back_populates="leads")
@@ -0,0 +1,58 @@
+"""Keyset pagination for list endpoints.
+
+List endpoints return at most ``limit`` rows ordered by primary key (or by a
+sort column, with the primary key as tie-breaker).  The client passes the id
+of the last row it received as ``after`` to get the next page, which the
+database serves with an index range scan instead of skipping rows as OFFSET
+does.  Responses stay plain JSON arrays; when another page may follow, its
+cursor is sent in the ``X-Next-Cursor`` header.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from fastapi import Response
+from sqlalchemy import Select, literal, select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def paginate(
+    stmt: Select,
+    id_column: ColumnElement,
+    after: Optional[UUID],
+    limit: int,
+    sort_key: Optional[ColumnElement] = None,
+    descending: bool = False,
+) -> Select:
+    """Order ``stmt`` for keyset pagination and restrict it to one page.
+
+    Without ``sort_key`` rows are ordered by ``id_column``.  With it, rows
+    are ordered by ``(sort_key, id_column)`` and the sort key of the cursor
+    row is looked up in a subquery, so the cursor is still just an id.
+    """
+    if sort_key is None:
+        if after is not None:
+            stmt = stmt.where(id_column < after if descending else id_column > after)
+        order = (id_column.desc() if descending else id_column,)
+    else:
+        if after is not None:
+            cursor_key = select(sort_key).where(id_column == after).correlate(None).scalar_subquery()
+            row, cursor = tuple_(sort_key, id_column), tuple_(cursor_key, literal(after, id_column.type))
+            stmt = stmt.where(row < cursor if descending else row > cursor)
+        if descending:
+            order = (sort_key.desc(), id_column.desc())
+        else:
+            order = (sort_key, id_column)
+    return stmt.order_by(*order).limit(limit)
+
+
+def set_next_cursor(response: Response, items: Sequence[Any], limit: int) -> None:
+    """Advertise the cursor of the next page if ``items`` filled this one."""
+    if len(items) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(items[-1].id)
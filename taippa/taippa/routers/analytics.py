@@ -6,72 +6,424 @@ their follower counts, engagement rates and other numeric metrics.
 These insights can help clients identify meaningful groups of
 influencers and tailor campaigns accordingly.
 
-The clustering implementation uses scikit‑learn's KMeans algorithm.
+The clustering implementation uses scikit‑learn's MiniBatchKMeans algorithm.
 Because scikit‑learn is CPU‑bound and synchronous, the computation is
 dispatched to a separate thread via ``asyncio.to_thread`` to avoid
-blocking the event loop.  Only authenticated users with appropriate
-roles can access the analytics endpoints.
+blocking the event loop.  Results are stored in the
+``influencer_segments`` table: the first request for a tenant and cluster
+count computes them, after which requests read the stored rows and
+``refresh_segments`` updates them in the background, folding only the
+influencers changed since the last run into the stored model
+(``clustering_states``).  Only
+authenticated users with appropriate roles can access the analytics
+endpoints.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, Any, List
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import delete, func, insert, lambda_stmt, select, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..auth import get_current_user
+from ..database import async_session_factory, get_session
+from ..models import ClusteringState, Influencer, InfluencerSegment, RoleEnum, User
 # Attempt to import external clustering modules; fallback if unavailable
 try:
     from sklearn.preprocessing import StandardScaler
-    from sklearn.cluster import KMeans
+    from sklearn.cluster import MiniBatchKMeans
     import numpy as np
 except ImportError:
     StandardScaler = None  # type: ignore
-    KMeans = None  # type: ignore
+    MiniBatchKMeans = None  # type: ignore
     np = None  # type: ignore
 
 
-
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
+logger = logging.getLogger(__name__)
+
+# Summary statistics stored per cluster, in ``InfluencerSegment`` column order
+_SEGMENT_FIELDS = ("avg_followers", "avg_engagement_rate", "avg_avg_likes", "avg_avg_comments")
+
+
+def _summarise(
+    X: np.ndarray, labels: np.ndarray, mean: np.ndarray, scale: np.ndarray, k: int
+) -> Dict[str, Any]:
+    """Summarise each cluster of the standardised rows ``X``.
+
+    Means are linear, so averaging the scaled features and undoing the
+    scaling yields the means of the original values.
+    """
+    counts = np.bincount(labels, minlength=k)
+    sums = np.column_stack([
+        np.bincount(labels, weights=X[:, col], minlength=k)
+        for col in range(X.shape[1])
+    ])
+    means = (sums / np.maximum(counts, 1)[:, None]) * scale + mean
+    summary: Dict[str, Dict[str, float | int]] = {
+        str(label): {
+            "size": int(counts[label]),
+            "avg_followers": float(means[label, 0]),
+            "avg_engagement_rate": float(means[label, 1]),
+            "avg_avg_likes": float(means[label, 2]),
+            "avg_avg_comments": float(means[label, 3]),
+        }
+        for label in range(k)
+        if counts[label]
+    }
+    return {"clusters": summary}
+
+
+def _nearest(X: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """Return the index of the nearest center for each row of ``X``."""
+    # ||x - c||^2 = ||x||^2 + ||c||^2 - 2 x.c, and ||x||^2 does not change
+    # which center is nearest
+    centers = centers.astype(X.dtype)
+    return np.argmin((centers * centers).sum(axis=1) - 2 * (X @ centers.T), axis=1)
+
 
-async def _compute_clusters(data: np.ndarray, k: int) -> Dict[str, Any]:
-    
+def _compute_clusters(data: np.ndarray, k: int) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """Cluster influencer feature rows and summarise each cluster.
 
     Parameters
     ----------
     data: np.ndarray
-        Array of shape (n_samples, n_features) with numeric features.
+        Array of shape (n_samples, n_features) with numeric features.  It is
+        standardised in place.
     k: int
         Desired number of clusters.
 
     Returns
     -------
-    Dict[str, Any]
-        Dictionary mapping cluster labels to summary statistics.
+    Tuple[Dict[str, Any], Dict[str, np.ndarray]]
+        Dictionary mapping cluster labels to summary statistics, and the
+        fitted model (see ``ClusteringState``) for later incremental updates.
     """
-    # Standardise features to zero mean and unit variance
-    scaler = StandardScaler()
+    # Standardise features to zero mean and unit variance in place
+    scaler = StandardScaler(with_mean=True, copy=False)
     X = scaler.fit_transform(data)
-    # Fit KMeans
-    kmeans = KMeans(n_clusters=k, n_init=10, random_state=42)
+    # Fit mini-batch k-means; a few restarts on mini-batches cost far less
+    # than ten full Lloyd runs over the whole dataset
+    kmeans = MiniBatchKMeans(n_clusters=k, batch_size=1024, n_init=3, random_state=42)
     labels = kmeans.fit_predict(X)
-    # Build summary
-    summary: Dict[str, Dict[str, float | int]] = {}
-    for label in range(k):
-        idx = np.where(labels == label)[0]
-        if idx.size == 0:
-            continue
-        subset = data[idx]
-        summary[str(label)] = {
-            "size": int(idx.size),
-            "avg_followers": float(np.mean(subset[:, 0])),
-            "avg_engagement_rate": float(np.mean(subset[:, 1])),
-            "avg_avg_likes": float(np.mean(subset[:, 2])),
-            "avg_avg_comments": float(np.mean(subset[:, 3])),
+    model = {
+        "centers": kmeans.cluster_centers_.astype(np.float64),
+        "counts": np.bincount(labels, minlength=k).astype(np.float64),
+        "mean": scaler.mean_.astype(np.float64),
+        "scale": scaler.scale_.astype(np.float64),
+    }
+    return _summarise(X, labels, model["mean"], model["scale"], k), model
+
+
+def _update_clusters(
+    data: np.ndarray, changed: np.ndarray, model: Dict[str, np.ndarray], k: int
+) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """Fold the ``changed`` rows into ``model`` and re-summarise ``data``.
+
+    Only the changed rows move the centers, using the mini-batch k-means
+    update (each center steps towards its new points by their share of all
+    points it has absorbed), so the cost of fitting grows with the number of
+    changes rather than with the tenant.  The standardisation is kept from
+    the last full fit.  ``data`` is standardised in place and every row is
+    reassigned to its nearest center for the summary.
+    """
+    mean, scale = model["mean"], model["scale"]
+    centers, counts = model["centers"].copy(), model["counts"].copy()
+    X_new = (changed - mean) / scale
+    labels = _nearest(X_new, centers)
+    for label in np.unique(labels):
+        points = X_new[labels == label]
+        counts[label] += len(points)
+        centers[label] += (points.sum(axis=0) - len(points) * centers[label]) / counts[label]
+    data -= mean.astype(data.dtype)
+    data /= scale.astype(data.dtype)
+    summary = _summarise(data, _nearest(data, centers), mean, scale, k)
+    return summary, dict(model, centers=centers, counts=counts)
+
+
+async def _load_features(
+    session: AsyncSession, tenant_id: UUID, n: int, since: Optional[datetime] = None
+) -> np.ndarray:
+    """Return up to ``n`` of the tenant's feature rows as an (n, 4) float32 array.
+
+    With ``since``, only influencers updated at or after that time are read.
+    The array is column-major, which suits the per-feature passes of the
+    scaler, and single precision halves the memory traffic of clustering.
+    """
+    # Built as a lambda statement so the compiled SQL is cached and only the
+    # tenant id is bound per call
+    stmt = lambda_stmt(
+        lambda: select(
+            Influencer.followers,
+            Influencer.engagement_rate,
+            Influencer.avg_likes,
+            Influencer.avg_comments,
+        ).where(*_feature_criteria(tenant_id))
+    )
+    if since is not None:
+        stmt += lambda s: s.where(Influencer.updated_at >= since)
+    # Copy each partition of rows straight into the preallocated array; rows
+    # inserted since ``n`` was counted are left for the next refresh
+    data = np.empty((n, 4), dtype=np.float32, order="F")
+    filled = 0
+    result = await session.stream(stmt)
+    async for partition in result.partitions(10_000):
+        take = min(len(partition), n - filled)
+        data[filled:filled + take] = partition[:take]
+        filled += take
+        if filled == n:
+            break
+    await result.close()
+    return data if filled == n else np.asfortranarray(data[:filled])
+
+
+def _feature_criteria(tenant_id: UUID) -> tuple:
+    """WHERE criteria selecting a tenant's influencers with usable features.
+
+    The database drops rows with missing or zero values (NULL never compares
+    greater than zero).
+    """
+    return (
+        Influencer.tenant_id == tenant_id,
+        Influencer.followers > 0,
+        Influencer.engagement_rate > 0,
+        Influencer.avg_likes > 0,
+        Influencer.avg_comments > 0,
+    )
+
+
+async def _count_features(
+    session: AsyncSession, tenant_id: UUID, since: Optional[datetime] = None
+) -> int:
+    """Count the rows ``_load_features`` would return."""
+    stmt = select(func.count()).select_from(Influencer).where(*_feature_criteria(tenant_id))
+    if since is not None:
+        stmt = stmt.where(Influencer.updated_at >= since)
+    return await session.scalar(stmt)
+
+
+async def _bucket_segments(session: AsyncSession, tenant_id: UUID, k: int) -> Dict[str, Any]:
+    """Summarise a small influencer set as ``k`` follower-count quantile buckets.
+
+    For only a few rows per cluster, k-means adds little over splitting by
+    follower count, so the database does the bucketing with ``ntile`` and
+    aggregates each bucket in the same query.
+    """
+    features = select(
+        func.ntile(k).over(order_by=Influencer.followers).label("bucket"),
+        Influencer.followers,
+        Influencer.engagement_rate,
+        Influencer.avg_likes,
+        Influencer.avg_comments,
+    ).where(*_feature_criteria(tenant_id)).subquery()
+    result = await session.execute(
+        select(
+            features.c.bucket,
+            func.count(),
+            func.avg(features.c.followers),
+            func.avg(features.c.engagement_rate),
+            func.avg(features.c.avg_likes),
+            func.avg(features.c.avg_comments),
+        )
+        .group_by(features.c.bucket)
+        .order_by(features.c.bucket)
+    )
+    return {
+        "clusters": {
+            str(bucket - 1): {
+                "size": int(size),
+                **{field: float(value) for field, value in zip(_SEGMENT_FIELDS, averages)},
+            }
+            for bucket, size, *averages in result
         }
-    return {"clusters": summary}
+    }
+
+
+async def _read_segments(
+    session: AsyncSession, tenant_id: UUID, k: int
+) -> Optional[Dict[str, Any]]:
+    """Return the stored segments for ``tenant_id`` and ``k``, if any."""
+    stored = (
+        await session.execute(
+            lambda_stmt(
+                lambda: select(InfluencerSegment).where(
+                    InfluencerSegment.tenant_id == tenant_id, InfluencerSegment.k == k
+                )
+            )
+        )
+    ).scalars().all()
+    if not stored:
+        return None
+    return {
+        "clusters": {
+            str(segment.label): {
+                "size": segment.size,
+                **{field: getattr(segment, field) for field in _SEGMENT_FIELDS},
+            }
+            for segment in sorted(stored, key=lambda segment: segment.label)
+        }
+    }
+
+
+async def _store_segments(
+    session: AsyncSession, tenant_id: UUID, k: int, summary: Dict[str, Any]
+) -> None:
+    """Replace the stored segments for ``tenant_id`` and ``k`` with ``summary``."""
+    await session.execute(
+        delete(InfluencerSegment).where(
+            InfluencerSegment.tenant_id == tenant_id, InfluencerSegment.k == k
+        )
+    )
+    rows = [
+        dict(stats, tenant_id=tenant_id, k=k, label=int(label))
+        for label, stats in summary["clusters"].items()
+    ]
+    if rows:
+        await session.execute(insert(InfluencerSegment), rows)
+
+
+async def _store_model(
+    session: AsyncSession,
+    tenant_id: UUID,
+    k: int,
+    model: Optional[Dict[str, np.ndarray]],
+    n: int,
+    fitted_at: datetime,
+) -> None:
+    """Replace the stored clustering state for ``tenant_id`` and ``k``.
+
+    A ``model`` of None (no k-means fit) just removes the old state.
+    """
+    await session.execute(
+        delete(ClusteringState).where(
+            ClusteringState.tenant_id == tenant_id, ClusteringState.k == k
+        )
+    )
+    if model is not None:
+        await session.execute(
+            insert(ClusteringState).values(
+                tenant_id=tenant_id,
+                k=k,
+                n=n,
+                fitted_at=fitted_at,
+                **{name: model[name].tobytes() for name in ("centers", "counts", "mean", "scale")},
+            )
+        )
+
+
+def _load_model(state: ClusteringState) -> Dict[str, np.ndarray]:
+    """Rebuild the model arrays saved by ``_store_model``."""
+    return {
+        "centers": np.frombuffer(state.centers, dtype=np.float64).reshape(state.k, -1).copy(),
+        "counts": np.frombuffer(state.counts, dtype=np.float64).copy(),
+        "mean": np.frombuffer(state.mean, dtype=np.float64),
+        "scale": np.frombuffer(state.scale, dtype=np.float64),
+    }
+
+
+async def _recompute_segments(
+    session: AsyncSession, tenant_id: UUID, k: int
+) -> Optional[Dict[str, Any]]:
+    """Segment the tenant's influencers from scratch and store the result.
+
+    Returns None, storing nothing, if there are fewer than ``k`` influencers.
+    The caller commits.
+    """
+    fitted_at = await session.scalar(select(func.now()))
+    n = await _count_features(session, tenant_id)
+    if not n:
+        summary: Dict[str, Any] = {"clusters": {}}
+        model = None
+    elif n < k:
+        return None
+    elif n < 4 * k:
+        # Too small to be worth a clustering thread
+        summary = await _bucket_segments(session, tenant_id, k)
+        model = None
+    else:
+        data = await _load_features(session, tenant_id, n)
+        # Dispatch clustering to a thread to avoid blocking
+        summary, model = await asyncio.to_thread(_compute_clusters, data, k)
+    await _store_segments(session, tenant_id, k, summary)
+    await _store_model(session, tenant_id, k, model, n, fitted_at)
+    return summary
+
+
+async def _refresh_tenant_segments(session: AsyncSession, tenant_id: UUID, k: int) -> None:
+    """Bring one stored segmentation up to date, incrementally if possible.
+
+    Nothing is recomputed when no influencer changed since the last fit.
+    When fewer than half of them changed, the stored model absorbs just the
+    changed rows (see ``_update_clusters``); otherwise it is refitted.
+    """
+    state = await session.get(ClusteringState, (tenant_id, k))
+    if state is not None:
+        fitted_at = await session.scalar(select(func.now()))
+        n = await _count_features(session, tenant_id)
+        n_changed = await _count_features(session, tenant_id, since=state.fitted_at)
+        if not n_changed and n == state.n:
+            return
+        if n >= 4 * k and n_changed <= n // 2:
+            changed = await _load_features(session, tenant_id, n_changed, since=state.fitted_at)
+            data = await _load_features(session, tenant_id, n)
+            summary, model = await asyncio.to_thread(
+                _update_clusters, data, changed, _load_model(state), k
+            )
+            await _store_segments(session, tenant_id, k, summary)
+            await _store_model(session, tenant_id, k, model, n, fitted_at)
+            return
+    summary = await _recompute_segments(session, tenant_id, k)
+    if summary is None:
+        await _store_segments(session, tenant_id, k, {"clusters": {}})
+
+
+# Taken by the worker refreshing one stored segmentation, so workers sharing
+# a PostgreSQL database don't rewrite the same rows at once.  Released when
+# that segmentation's transaction ends.
+_REFRESH_LOCK = text("SELECT pg_try_advisory_xact_lock(43, hashtext(:segmentation))")
+
+
+async def refresh_segments() -> None:
+    """Update every stored segmentation from current influencer data.
+
+    Segmentations another worker is refreshing, or that a request stored
+    concurrently, are skipped until the next run.
+    """
+    async with async_session_factory() as session:
+        postgres = session.bind.dialect.name == "postgresql"
+        pairs = (
+            await session.execute(
+                select(InfluencerSegment.tenant_id, InfluencerSegment.k).distinct()
+            )
+        ).all()
+        for tenant_id, k in pairs:
+            if postgres and not await session.scalar(
+                _REFRESH_LOCK, {"segmentation": f"{tenant_id}:{k}"}
+            ):
+                continue
+            try:
+                await _refresh_tenant_segments(session, tenant_id, k)
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+
+
+async def refresh_segments_periodically(interval: float) -> None:
+    """Run ``refresh_segments`` every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_segments()
+        except Exception:
+            logger.exception("Refreshing influencer segments failed")
 
 
 @router.get("/segments")
@@ -86,7 +438,9 @@ async def influencer_segments(
     endpoint.  Influencers belonging to the caller's tenant are
     included in the analysis.  The numeric features used are
     ``followers``, ``engagement_rate``, ``avg_likes`` and
-    ``avg_comments``.  Missing values are filtered out.
+    ``avg_comments``.  Missing values are filtered out.  Stored segments
+    are returned when available; they may lag influencer changes by up to
+    one background refresh interval.
     """
     if current_user.role not in {
         RoleEnum.admin,
@@ -94,30 +448,18 @@ async def influencer_segments(
         RoleEnum.team_member,
     }:
         raise HTTPException(status_code=403, detail="Not authorised for analytics")
-    # Query influencers for the user's tenant
-    result = await session.execute(
-        select(
-            Influencer.followers,
-            Influencer.engagement_rate,
-            Influencer.avg_likes,
-            Influencer.avg_comments,
-        ).where(Influencer.tenant_id == current_user.tenant_id)
-    )
-    rows = result.all()
-    # Filter out rows with missing or zero values
-    features: List[List[float]] = []
-    for followers, engagement_rate, avg_likes, avg_comments in rows:
-        if not followers or not engagement_rate or not avg_likes or not avg_comments:
-            continue
-        features.append([
-            float(followers),
-            float(engagement_rate),
-            float(avg_likes),
-            float(avg_comments),
-        ])
-    if not features:
-        return {"clusters": {}}
-    data_array = np.array(features)
-    # Dispatch clustering to a thread to avoid blocking
-    summary = await asyncio.to_thread(_compute_clusters, data_array, k)
+    tenant_id = current_user.tenant_id
+    stored = await _read_segments(session, tenant_id, k)
+    if stored is not None:
+        return stored
+    try:
+        summary = await _recompute_segments(session, tenant_id, k)
+        await session.commit()
+    except IntegrityError:
+        # A concurrent request stored the same segments first
+        await session.rollback()
+        summary = await _read_segments(session, tenant_id, k) or {"clusters": {}}
+    if summary is None:
+        # Too few influencers to form k clusters
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     return summary
@@ -5,11 +5,9 @@ Provides routes for user registration, login and retrieving the current user.
 
 from __future__ import annotations
 
-from datetime import timedelta
-import os
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import schemas
@@ -21,6 +19,7 @@ from ..auth import (
     get_user_by_email,
 )
 from ..database import get_session
+from .tenants import default_tenant_id, ensure_default_tenant_id
 from ..models import User, RoleEnum
 
 
@@ -28,7 +27,11 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=schemas.UserRead, status_code=status.HTTP_201_CREATED)
-async def register_user(user_in: schemas.UserCreate, session: AsyncSession = Depends(get_session)):
+async def register_user(
+    user_in: schemas.UserCreate,
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+):
     """Create a new user account.
 
     The user is created with the role specified in the request.  Duplicate
@@ -38,32 +41,28 @@ async def register_user(user_in: schemas.UserCreate, session: AsyncSession = Dep
     existing = await get_user_by_email(session, user_in.email)
     if existing:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
-    hashed_password = get_password_hash(user_in.password)
+    hashed_password = await get_password_hash(user_in.password)
     # Determine tenant for the new user.  If specified in the request use that,
-    # otherwise fall back to DEFAULT_TENANT_ID environment variable.  If no default
-    # tenant exists in the database, raise an error.
-    tenant_id = user_in.tenant_id
-    if not tenant_id:
-        tenant_id = os.getenv("DEFAULT_TENANT_ID")
-    if not tenant_id:
-        # fetch first tenant as fallback
-        from ..models import Tenant
-        result = await session.execute(select(Tenant))
-        tenant = result.scalars().first()
-        if tenant:
-            tenant_id = tenant.id
-        else:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="No tenant configured for user registration")
-    user = User(
-        email=user_in.email,
-        hashed_password=hashed_password,
-        full_name=user_in.full_name,
-        role=user_in.role,
-        tenant_id=tenant_id,
+    # otherwise fall back to the default tenant resolved at startup
+    # (DEFAULT_TENANT_ID or the first tenant).  If there is none yet, a
+    # tenant named "default" is created along with the user.
+    tenant_id = (
+        user_in.tenant_id
+        or await default_tenant_id(request, session)
+        or await ensure_default_tenant_id(session)
+    )
+    user = await session.scalar(
+        insert(User)
+        .values(
+            email=user_in.email,
+            hashed_password=hashed_password,
+            full_name=user_in.full_name,
+            role=user_in.role,
+            tenant_id=tenant_id,
+        )
+        .returning(User)
     )
-    session.add(user)
     await session.commit()
-    await session.refresh(user)
     return schemas.UserRead.model_validate(user)
 
 
@@ -80,10 +79,8 @@ async def login_for_access_token(
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token_expires = timedelta(minutes=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")))
-    access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
-    )
+    # Expiry defaults to ACCESS_TOKEN_EXPIRE_MINUTES, resolved at startup
+    access_token = create_access_token(data={"sub": user.email})
     return schemas.Token(access_token=access_token, token_type="bearer")
 
 
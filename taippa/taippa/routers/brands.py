@@ -3,19 +3,37 @@
 from __future__ import annotations
 
 from typing import List
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, insert, lambda_stmt, select, true, update
 
 from ..database import get_session
-from ..models import Brand, User, RoleEnum
+from ..models import Brand, Campaign, User, RoleEnum
 from ..schemas import BrandCreate, BrandRead, BrandUpdate
 from ..auth import get_current_active_user, require_role
+from .match import invalidate_matches
 
 
 router = APIRouter(prefix="/brands", tags=["brands"])
 
+# Columns needed to build a BrandRead without loading Brand entities
+_BRAND_READ_COLUMNS = tuple(getattr(Brand, field) for field in BrandRead.model_fields)
+
+
+def _visible_brand(brand_id: UUID, user: User) -> tuple:
+    """WHERE criteria matching ``brand_id`` only if ``user`` may access it.
+
+    Brands in other tenants, or owned by someone else unless the user is an
+    admin, simply do not match and are reported as not found.
+    """
+    return (
+        Brand.id == brand_id,
+        Brand.tenant_id == user.tenant_id,
+        true() if user.role == RoleEnum.admin else Brand.owner_id == user.id,
+    )
+
 
 @router.post("/", response_model=BrandRead, status_code=status.HTTP_201_CREATED)
 async def create_brand(
@@ -24,22 +42,50 @@ async def create_brand(
     current_user: User = Depends(require_role(RoleEnum.admin, RoleEnum.client)),
 ):
     """Create a new brand owned by the current user."""
-    brand = Brand(
-        owner_id=current_user.id,
-        name=brand_in.name,
-        description=brand_in.description,
-        industry=brand_in.industry,
-        contact_email=brand_in.contact_email,
-        target_audience=brand_in.target_audience,
-        budget=brand_in.budget,
-        tenant_id=current_user.tenant_id,
+    # INSERT ... RETURNING hands back the generated columns in the same round trip
+    brand = await session.scalar(
+        insert(Brand)
+        .values(
+            owner_id=current_user.id,
+            name=brand_in.name,
+            description=brand_in.description,
+            industry=brand_in.industry,
+            contact_email=brand_in.contact_email,
+            target_audience=brand_in.target_audience,
+            budget=brand_in.budget,
+            tenant_id=current_user.tenant_id,
+        )
+        .returning(Brand)
     )
-    session.add(brand)
     await session.commit()
-    await session.refresh(brand)
     return BrandRead.model_validate(brand)
 
 
+@router.post("/batch", response_model=List[BrandRead], status_code=status.HTTP_201_CREATED)
+async def create_brands_batch(
+    brands_in: List[BrandCreate],
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_role(RoleEnum.admin, RoleEnum.client)),
+):
+    """Create several brands owned by the current user in one transaction.
+
+    The rows are sent as a single multi-row INSERT ... RETURNING, so the
+    created brands come back without a refresh per row.
+    """
+    if not brands_in:
+        return []
+    rows = [
+        dict(brand_in.model_dump(), owner_id=current_user.id, tenant_id=current_user.tenant_id)
+        for brand_in in brands_in
+    ]
+    result = await session.scalars(
+        insert(Brand).returning(Brand, sort_by_parameter_order=True), rows
+    )
+    brands = result.all()
+    await session.commit()
+    return [BrandRead.model_validate(b) for b in brands]
+
+
 @router.get("/", response_model=List[BrandRead])
 async def list_brands(
     session: AsyncSession = Depends(get_session),
@@ -51,71 +97,82 @@ async def list_brands(
     roles currently return an empty list but could be extended to see assigned
     brands.
     """
-    # Limit results to the current tenant
-    query = select(Brand).where(Brand.tenant_id == current_user.tenant_id)
+    # Limit results to the current tenant.  Built as lambda statements so the
+    # compiled SQL is cached and only the ids are bound per request.  Plain
+    # column tuples are fetched rather than Brand entities because this
+    # read-only listing needs no identity map or change tracking.
+    tenant_id, user_id = current_user.tenant_id, current_user.id
+    query = lambda_stmt(lambda: select(*_BRAND_READ_COLUMNS).where(Brand.tenant_id == tenant_id))
     # Non‑admin users only see their own brands
     if current_user.role != RoleEnum.admin:
-        query = query.where(Brand.owner_id == current_user.id)
+        query += lambda s: s.where(Brand.owner_id == user_id)
     result = await session.execute(query)
-    brands = result.scalars().all()
-    return [BrandRead.model_validate(b) for b in brands]
+    # Rows come straight from the database, so skip re-validating them
+    return [BrandRead.model_construct(**row._mapping) for row in result]
 
 
 @router.get("/{brand_id}", response_model=BrandRead)
 async def get_brand(
-    brand_id: str,
+    brand_id: UUID,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
 ):
     """Return a brand if the user has permission to view it."""
-    brand = await session.get(Brand, brand_id)
-    if not brand:
+    brand = await session.scalar(select(Brand).where(*_visible_brand(brand_id, current_user)))
+    if brand is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Brand not found")
-    # Verify tenant and owner permissions
-    if brand.tenant_id != current_user.tenant_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to view this brand")
-    if current_user.role != RoleEnum.admin and brand.owner_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to view this brand")
     return BrandRead.model_validate(brand)
 
 
 @router.put("/{brand_id}", response_model=BrandRead)
 async def update_brand(
-    brand_id: str,
+    brand_id: UUID,
     brand_in: BrandUpdate,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
 ):
     """Update a brand's details."""
-    brand = await session.get(Brand, brand_id)
-    if not brand:
+    values = brand_in.model_dump(exclude_unset=True)
+    criteria = _visible_brand(brand_id, current_user)
+    if values:
+        # UPDATE ... RETURNING applies the change and reads it back at once
+        brand = await session.scalar(
+            update(Brand)
+            .where(*criteria)
+            .values(**values)
+            .returning(Brand)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        brand = await session.scalar(select(Brand).where(*criteria))
+    if brand is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Brand not found")
-    # verify tenant and owner
-    if brand.tenant_id != current_user.tenant_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to update this brand")
-    if current_user.role != RoleEnum.admin and brand.owner_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to update this brand")
-    for attr, value in brand_in.model_dump(exclude_unset=True).items():
-        setattr(brand, attr, value)
     await session.commit()
-    await session.refresh(brand)
+    invalidate_matches(current_user.tenant_id)
     return BrandRead.model_validate(brand)
 
 
 @router.delete("/{brand_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_brand(
-    brand_id: str,
+    brand_id: UUID,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
 ):
-    """Delete a brand."""
-    brand = await session.get(Brand, brand_id)
-    if not brand:
+    """Delete a brand and its campaigns."""
+    criteria = _visible_brand(brand_id, current_user)
+    # Remove the campaigns first, as the ORM cascade would, so the brand's
+    # foreign keys are clear when it is deleted
+    await session.execute(
+        delete(Campaign)
+        .where(Campaign.brand_id.in_(select(Brand.id).where(*criteria)))
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(
+        delete(Brand).where(*criteria).execution_options(synchronize_session=False)
+    )
+    if not result.rowcount:
+        await session.rollback()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Brand not found")
-    if brand.tenant_id != current_user.tenant_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to delete this brand")
-    if current_user.role != RoleEnum.admin and brand.owner_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to delete this brand")
-    await session.delete(brand)
     await session.commit()
-    return
\ No newline at end of file
+    invalidate_matches(current_user.tenant_id)
+    return
@@ -3,20 +3,71 @@
 from __future__ import annotations
 
 from typing import List
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from ..database import get_session
 from ..models import Campaign, Brand, User, RoleEnum, CampaignStatus
 from ..schemas import CampaignCreate, CampaignRead, CampaignUpdate
 from ..auth import get_current_active_user, require_role
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate, set_next_cursor
 from ..services.ai import analyse_brief
 
 
 router = APIRouter(prefix="/campaigns", tags=["campaigns"])
 
+# Validates a whole result list in one pass rather than one call per row
+_CAMPAIGN_LIST = TypeAdapter(List[CampaignRead])
+
+# Columns needed to build a CampaignRead without loading Campaign entities
+_CAMPAIGN_READ_COLUMNS = tuple(getattr(Campaign, field) for field in CampaignRead.model_fields)
+
+
+async def _get_campaign_for(session: AsyncSession, campaign_id: UUID, user: User, action: str) -> Campaign:
+    """Load a campaign ``user`` may ``action``, raising 404/403 otherwise.
+
+    The owning brand's ``owner_id`` is joined into the same query, so the
+    ownership check needs no second round trip to load the brand.
+    """
+    row = (
+        await session.execute(
+            select(Campaign, Brand.owner_id)
+            .outerjoin(Brand, Brand.id == Campaign.brand_id)
+            .where(Campaign.id == campaign_id)
+        )
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
+    campaign, owner_id = row
+    # verify tenant and brand owner
+    if campaign.tenant_id != user.tenant_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Not authorised to {action} this campaign")
+    if user.role != RoleEnum.admin and owner_id != user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Not authorised to {action} this campaign")
+    return campaign
+
+
+def authorized_campaign(action: str):
+    """Return a dependency resolving the path's campaign for ``action``.
+
+    The dependency shares the request's session and current user with the
+    endpoint (FastAPI caches both per request), so authorising a campaign
+    costs the single joined query in ``_get_campaign_for``.
+    """
+
+    async def campaign_dependency(
+        campaign_id: UUID,
+        session: AsyncSession = Depends(get_session),
+        current_user: User = Depends(get_current_active_user),
+    ) -> Campaign:
+        return await _get_campaign_for(session, campaign_id, current_user, action)
+
+    return campaign_dependency
+
 
 @router.post("/", response_model=CampaignRead, status_code=status.HTTP_201_CREATED)
 async def create_campaign(
@@ -39,115 +90,97 @@ async def create_campaign(
     # ensure brand belongs to current tenant
     if brand.tenant_id != current_user.tenant_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to create campaigns for this tenant")
-    campaign = Campaign(
-        brand_id=campaign_in.brand_id,
-        title=campaign_in.title,
-        brief=campaign_in.brief,
-        status=campaign_in.status,
-        start_date=campaign_in.start_date,
-        end_date=campaign_in.end_date,
-        budget=campaign_in.budget,
-        tenant_id=current_user.tenant_id,
+    # INSERT ... RETURNING hands back the generated columns in the same round trip
+    campaign = await session.scalar(
+        insert(Campaign)
+        .values(
+            brand_id=campaign_in.brand_id,
+            title=campaign_in.title,
+            brief=campaign_in.brief,
+            status=campaign_in.status,
+            start_date=campaign_in.start_date,
+            end_date=campaign_in.end_date,
+            budget=campaign_in.budget,
+            tenant_id=current_user.tenant_id,
+        )
+        .returning(Campaign)
     )
-    session.add(campaign)
     await session.commit()
-    await session.refresh(campaign)
     return CampaignRead.model_validate(campaign)
 
 
 @router.get("/", response_model=List[CampaignRead])
 async def list_campaigns(
+    response: Response,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
-    brand_id: str | None = None,
+    brand_id: UUID | None = None,
+    live: bool = Query(False, description="Only return active or paused campaigns"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: UUID | None = Query(None, description="Id of the last item of the previous page"),
 ):
     """List campaigns visible to the current user.
 
     Admins see all campaigns; clients see campaigns belonging to their brands.
+    With ``live=true`` only active and paused campaigns are returned, which
+    Postgres serves from the ``ix_campaigns_tenant_active`` partial index.
+    Results are paginated by id (see ``taippa.pagination``).
     """
     # Always restrict to current tenant
-    query = select(Campaign).where(Campaign.tenant_id == current_user.tenant_id)
+    query = select(*_CAMPAIGN_READ_COLUMNS).where(Campaign.tenant_id == current_user.tenant_id)
     if brand_id:
         query = query.where(Campaign.brand_id == brand_id)
+    if live:
+        query = query.where(Campaign.status.in_((CampaignStatus.active, CampaignStatus.paused)))
     if current_user.role != RoleEnum.admin:
         # restrict to campaigns belonging to the user's brands
         query = query.join(Brand).where(Brand.owner_id == current_user.id)
-    result = await session.execute(query)
-    campaigns = result.scalars().all()
-    return [CampaignRead.model_validate(c) for c in campaigns]
+    result = await session.execute(paginate(query, Campaign.id, after, limit))
+    campaigns = result.all()
+    set_next_cursor(response, campaigns, limit)
+    return _CAMPAIGN_LIST.validate_python(campaigns, from_attributes=True)
 
 
 @router.get("/{campaign_id}", response_model=CampaignRead)
-async def get_campaign(
-    campaign_id: str,
-    session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_active_user),
-):
+async def get_campaign(campaign: Campaign = Depends(authorized_campaign("view"))):
     """Return a campaign by ID, if authorised."""
-    campaign = await session.get(Campaign, campaign_id)
-    if not campaign:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
-    # verify tenant
-    if campaign.tenant_id != current_user.tenant_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to view this campaign")
-    if current_user.role != RoleEnum.admin:
-        brand = await session.get(Brand, campaign.brand_id)
-        if not brand or brand.owner_id != current_user.id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to view this campaign")
     return CampaignRead.model_validate(campaign)
 
 
 @router.put("/{campaign_id}", response_model=CampaignRead)
 async def update_campaign(
-    campaign_id: str,
+    campaign_id: UUID,
     campaign_in: CampaignUpdate,
+    campaign: Campaign = Depends(authorized_campaign("modify")),
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_active_user),
 ):
     """Update a campaign.  Only authorised users may modify campaigns."""
-    campaign = await session.get(Campaign, campaign_id)
-    if not campaign:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
-    if campaign.tenant_id != current_user.tenant_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to modify this campaign")
-    if current_user.role != RoleEnum.admin:
-        brand = await session.get(Brand, campaign.brand_id)
-        if not brand or brand.owner_id != current_user.id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to modify this campaign")
-    # apply updates
+    # apply updates; the new updated_at comes back with the UPDATE itself
     for attr, value in campaign_in.model_dump(exclude_unset=True).items():
         setattr(campaign, attr, value)
     await session.commit()
-    await session.refresh(campaign)
     return CampaignRead.model_validate(campaign)
 
 
 @router.delete("/{campaign_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_campaign(
-    campaign_id: str,
+    campaign: Campaign = Depends(authorized_campaign("delete")),
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_active_user),
 ):
     """Delete a campaign."""
-    campaign = await session.get(Campaign, campaign_id)
-    if not campaign:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
-    if campaign.tenant_id != current_user.tenant_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to delete this campaign")
-    if current_user.role != RoleEnum.admin:
-        brand = await session.get(Brand, campaign.brand_id)
-        if not brand or brand.owner_id != current_user.id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to delete this campaign")
     await session.delete(campaign)
     await session.commit()
     return
 
 
-@router.post("/{campaign_id}/analyse", response_model=CampaignRead)
+@router.post(
+    "/{campaign_id}/analyse",
+    response_model=CampaignRead,
+    dependencies=[Depends(require_role(RoleEnum.admin, RoleEnum.client))],
+)
 async def analyse_campaign_brief(
-    campaign_id: str,
+    campaign: Campaign = Depends(authorized_campaign("analyse")),
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(require_role(RoleEnum.admin, RoleEnum.client)),
 ):
     """Analyse a campaign's brief using the AI engine and update the analysis field.
 
@@ -155,17 +188,8 @@ async def analyse_campaign_brief(
     `analyse_brief` service.  The result is stored in the `analysis` column of
     the campaign.  Only admins and brand owners can trigger analysis.
     """
-    campaign = await session.get(Campaign, campaign_id)
-    if not campaign:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Campaign not found")
-    brand = await session.get(Brand, campaign.brand_id)
-    if campaign.tenant_id != current_user.tenant_id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to analyse this campaign")
-    if not brand or (current_user.role != RoleEnum.admin and brand.owner_id != current_user.id):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorised to analyse this campaign")
     # call AI service (may be asynchronous) to process the brief
     analysis = await analyse_brief(campaign.brief)
     campaign.analysis = analysis
     await session.commit()
-    await session.refresh(campaign)
     return CampaignRead.model_validate(campaign)
\ No newline at end of file
@@ -2,21 +2,38 @@
 
 from __future__ import annotations
 
-from typing import List
+import random
+from datetime import datetime
+from typing import AsyncIterator, List
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy import or_, and_, asc, desc
+from sqlalchemy import insert, select, update
+from sqlalchemy import and_, func
 
-from ..database import get_session
-from ..models import Influencer, User, RoleEnum
+from ..database import async_session_factory, get_session
+from ..models import INFLUENCER_SEARCH_TEXT, Influencer, User, RoleEnum
 from ..schemas import InfluencerCreate, InfluencerRead, InfluencerUpdate
 from ..auth import get_current_active_user, require_role
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate, set_next_cursor
+from ..services.tokens import influencer_match_tokens
+from .match import invalidate_matches
 
 
 router = APIRouter(prefix="/influencers", tags=["influencers"])
 
+# Validates a whole result list in one pass rather than one call per row
+_INFLUENCER_LIST = TypeAdapter(List[InfluencerRead])
+
+# Columns needed to build an InfluencerRead without loading Influencer entities
+_INFLUENCER_READ_COLUMNS = tuple(getattr(Influencer, field) for field in InfluencerRead.model_fields)
+
+# Rows read and updated per statement by refresh_influencers
+_REFRESH_BATCH_SIZE = 1000
+
 
 @router.post("/", response_model=InfluencerRead, status_code=status.HTTP_201_CREATED)
 async def create_influencer(
@@ -30,33 +47,146 @@ async def create_influencer(
     implementation this endpoint could support bulk import and integration with
     social media APIs.
     """
-    influencer = Influencer(**influencer_in.model_dump(), tenant_id=current_user.tenant_id)
-    session.add(influencer)
+    # INSERT ... RETURNING hands back the generated columns in the same round trip
+    influencer = await session.scalar(
+        insert(Influencer)
+        .values(
+            **influencer_in.model_dump(),
+            tenant_id=current_user.tenant_id,
+            match_tokens=influencer_match_tokens(influencer_in.name, influencer_in.handle, influencer_in.platform),
+        )
+        .returning(Influencer)
+    )
     await session.commit()
-    await session.refresh(influencer)
+    invalidate_matches(current_user.tenant_id)
     return InfluencerRead.model_validate(influencer)
 
 
 @router.get("/", response_model=List[InfluencerRead])
 async def list_influencers(
+    response: Response,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: UUID | None = Query(None, description="Id of the last item of the previous page"),
 ):
-    """Return all influencer profiles.
+    """Return influencer profiles, one page at a time.
 
-    Any authenticated user can view the influencer directory.  Search and
-    filtering are not implemented in this skeleton.
+    Any authenticated user can view the influencer directory.  Results are
+    paginated by id (see ``taippa.pagination``); use ``/search`` to filter.
     """
-    result = await session.execute(
-        select(Influencer).where(Influencer.tenant_id == current_user.tenant_id)
-    )
-    influencers = result.scalars().all()
-    return [InfluencerRead.model_validate(i) for i in influencers]
+    # Read-only listing: fetch column rows, not entities
+    stmt = select(*_INFLUENCER_READ_COLUMNS).where(Influencer.tenant_id == current_user.tenant_id)
+    result = await session.execute(paginate(stmt, Influencer.id, after, limit))
+    influencers = result.all()
+    set_next_cursor(response, influencers, limit)
+    return _INFLUENCER_LIST.validate_python(influencers, from_attributes=True)
+
+
+async def _export_rows(tenant_id: UUID) -> AsyncIterator[bytes]:
+    """Yield the tenant's influencers as one JSON array, a batch at a time."""
+    # The request's session is closed before a streaming body is sent, so
+    # the export reads through its own
+    async with async_session_factory() as session:
+        # Plain column rows rather than entities, so nothing accumulates in
+        # the session's identity map as the export proceeds
+        result = await session.stream(
+            select(*_INFLUENCER_READ_COLUMNS)
+            .where(Influencer.tenant_id == tenant_id)
+            .order_by(Influencer.id)
+        )
+        yield b"["
+        first = True
+        async for batch in result.partitions(1000):
+            # Serialise each batch in pydantic-core and splice the arrays
+            chunk = _INFLUENCER_LIST.dump_json(
+                _INFLUENCER_LIST.validate_python(batch, from_attributes=True)
+            )[1:-1]
+            yield chunk if first else b"," + chunk
+            first = False
+        yield b"]"
+
+
+@router.get("/export", response_model=List[InfluencerRead])
+async def export_influencers(
+    current_user: User = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """Return every influencer profile of the tenant in a single response.
+
+    Unlike the paginated listing, the body is streamed: rows are read from
+    the database and serialised in batches as the client receives them, so
+    neither the rows nor the encoded JSON are held in memory all at once.
+    """
+    return StreamingResponse(_export_rows(current_user.tenant_id), media_type="application/json")
+
+
+@router.get("/search", response_model=List[InfluencerRead])
+async def search_influencers(
+    response: Response,
+    q: str | None = None,
+    platform: str | None = None,
+    min_followers: int | None = None,
+    max_followers: int | None = None,
+    min_engagement_rate: float | None = None,
+    max_engagement_rate: float | None = None,
+    country: str | None = None,
+    topic: str | None = None,
+    sort_by: str | None = None,
+    order: str = "desc",
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_active_user),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: UUID | None = Query(None, description="Id of the last item of the previous page"),
+) -> List[InfluencerRead]:
+    """Search and filter influencers.
+
+    Supports full‑text search across name, handle, topics and bio as well as
+    filtering by platform, follower counts, engagement rates, country and
+    topics.  Results can be sorted by followers or engagement_rate (missing
+    values sort as zero) and are paginated with the ``after`` cursor (see
+    ``taippa.pagination``).
+    """
+    # Base query limited to current tenant
+    stmt = select(*_INFLUENCER_READ_COLUMNS).where(Influencer.tenant_id == current_user.tenant_id)
+    # Full text search (case‑insensitive) across selected fields
+    # as a single LIKE that the trigram index can serve on Postgres
+    if q:
+        stmt = stmt.where(INFLUENCER_SEARCH_TEXT.like(f"%{q.lower()}%"))
+    # Platform filter (case‑insensitive)
+    if platform:
+        stmt = stmt.where(Influencer.platform.ilike(platform))
+    # Country filter
+    if country:
+        stmt = stmt.where(Influencer.country.ilike(country))
+    # Topic filter: topics stored as comma‑separated string
+    if topic:
+        pattern = f"%{topic.lower()}%"
+        stmt = stmt.where(Influencer.topics.ilike(pattern))
+    # Follower and engagement filters
+    if min_followers is not None:
+        stmt = stmt.where((Influencer.followers >= min_followers) | (Influencer.followers == None))
+    if max_followers is not None:
+        stmt = stmt.where((Influencer.followers <= max_followers) | (Influencer.followers == None))
+    if min_engagement_rate is not None:
+        stmt = stmt.where((Influencer.engagement_rate >= min_engagement_rate) | (Influencer.engagement_rate == None))
+    if max_engagement_rate is not None:
+        stmt = stmt.where((Influencer.engagement_rate <= max_engagement_rate) | (Influencer.engagement_rate == None))
+    # Sorting, with the id as tie-breaker so pages do not overlap
+    if sort_by in {"followers", "engagement_rate"}:
+        sort_key = func.coalesce(getattr(Influencer, sort_by), 0)
+        stmt = paginate(stmt, Influencer.id, after, limit, sort_key, order.lower() == "desc")
+    else:
+        stmt = paginate(stmt, Influencer.id, after, limit)
+    # Execute query
+    result = await session.execute(stmt)
+    influencers = result.all()
+    set_next_cursor(response, influencers, limit)
+    return _INFLUENCER_LIST.validate_python(influencers, from_attributes=True)
 
 
 @router.get("/{influencer_id}", response_model=InfluencerRead)
 async def get_influencer(
-    influencer_id: str,
+    influencer_id: UUID,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
 ):
@@ -69,25 +199,40 @@ async def get_influencer(
 
 @router.put("/{influencer_id}", response_model=InfluencerRead)
 async def update_influencer(
-    influencer_id: str,
+    influencer_id: UUID,
     influencer_in: InfluencerUpdate,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(require_role(RoleEnum.admin)),
 ):
     """Update an influencer profile."""
-    influencer = await session.get(Influencer, influencer_id)
-    if not influencer or influencer.tenant_id != current_user.tenant_id:
+    values = influencer_in.model_dump(exclude_unset=True)
+    criteria = (Influencer.id == influencer_id, Influencer.tenant_id == current_user.tenant_id)
+    if values:
+        # UPDATE ... RETURNING applies the change and reads it back at once,
+        # new updated_at included
+        influencer = await session.scalar(
+            update(Influencer)
+            .where(*criteria)
+            .values(**values)
+            .returning(Influencer)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        influencer = await session.scalar(select(Influencer).where(*criteria))
+    if influencer is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Influencer not found")
-    for attr, value in influencer_in.model_dump(exclude_unset=True).items():
-        setattr(influencer, attr, value)
+    if values.keys() & {"name", "handle", "platform"}:
+        # Tokens depend on fields the update may have left unchanged, so
+        # they are derived from the returned row and flushed on commit
+        influencer.match_tokens = influencer_match_tokens(influencer.name, influencer.handle, influencer.platform)
     await session.commit()
-    await session.refresh(influencer)
+    invalidate_matches(current_user.tenant_id)
     return InfluencerRead.model_validate(influencer)
 
 
 @router.delete("/{influencer_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_influencer(
-    influencer_id: str,
+    influencer_id: UUID,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(require_role(RoleEnum.admin)),
 ):
@@ -97,6 +242,7 @@ async def delete_influencer(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Influencer not found")
     await session.delete(influencer)
     await session.commit()
+    invalidate_matches(current_user.tenant_id)
     return
 
 
@@ -113,86 +259,41 @@ async def refresh_influencers(
     scraping routines to fetch real data.  Only admins can trigger a
     refresh.
     """
-    import random
-    from datetime import datetime
-    result = await session.execute(
-        select(Influencer).where(Influencer.tenant_id == current_user.tenant_id)
-    )
-    influencers = result.scalars().all()
-    for inf in influencers:
-        # Generate random follower growth and engagement metrics
-        current_followers = inf.followers or random.randint(1000, 10000)
-        delta = random.randint(-100, 500)
-        inf.followers = max(0, current_followers + delta)
-        # Random engagement rate between 0.5% and 10%
-        inf.engagement_rate = round(random.uniform(0.5, 10.0), 2)
-        # Random likes and comments for demonstration
-        inf.avg_likes = random.randint(50, 1000)
-        inf.avg_comments = random.randint(1, 100)
-        # Update last_updated timestamp
-        inf.last_updated = datetime.utcnow()
+    # Work through the tenant in keyset batches so memory stays bounded on
+    # large tenants.  Each batch is read with its own short query, so no
+    # cursor is left open on rows that the batch's UPDATE then moves in the
+    # followers index.  Only the id and follower count are needed to compute
+    # the new values.
+    stmt = select(Influencer.id, Influencer.followers).where(Influencer.tenant_id == current_user.tenant_id)
+    now = datetime.utcnow()
+    refreshed = 0
+    after: UUID | None = None
+    while True:
+        influencers = (await session.execute(paginate(stmt, Influencer.id, after, _REFRESH_BATCH_SIZE))).all()
+        if not influencers:
+            break
+        rows = []
+        for influencer_id, followers in influencers:
+            # Generate random follower growth and engagement metrics
+            current_followers = followers or random.randint(1000, 10000)
+            delta = random.randint(-100, 500)
+            rows.append({
+                "id": influencer_id,
+                "followers": max(0, current_followers + delta),
+                # Random engagement rate between 0.5% and 10%
+                "engagement_rate": round(random.uniform(0.5, 10.0), 2),
+                # Random likes and comments for demonstration
+                "avg_likes": random.randint(50, 1000),
+                "avg_comments": random.randint(1, 100),
+                "last_updated": now,
+            })
+        # Bulk UPDATE by primary key: one executemany per batch instead of a
+        # flush of individually tracked objects
+        await session.execute(update(Influencer), rows)
+        refreshed += len(rows)
+        if len(influencers) < _REFRESH_BATCH_SIZE:
+            break
+        after = influencers[-1].id
     await session.commit()
-    return {"detail": f"Refreshed {len(influencers)} influencers"}
-
-
-@router.get("/search", response_model=List[InfluencerRead])
-async def search_influencers(
-    q: str | None = None,
-    platform: str | None = None,
-    min_followers: int | None = None,
-    max_followers: int | None = None,
-    min_engagement_rate: float | None = None,
-    max_engagement_rate: float | None = None,
-    country: str | None = None,
-    topic: str | None = None,
-    sort_by: str | None = None,
-    order: str = "desc",
-    session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_active_user),
-) -> List[InfluencerRead]:
-    """Search and filter influencers.
-
-    Supports full‑text search across name, handle, topics and bio as well as
-    filtering by platform, follower counts, engagement rates, country and
-    topics.  Results can be sorted by followers or engagement_rate.
-    """
-    # Base query limited to current tenant
-    stmt = select(Influencer).where(Influencer.tenant_id == current_user.tenant_id)
-    # Full text search (case‑insensitive) across selected fields
-    if q:
-        pattern = f"%{q.lower()}%"
-        stmt = stmt.where(
-            or_(
-                Influencer.name.ilike(pattern),
-                Influencer.handle.ilike(pattern),
-                Influencer.topics.ilike(pattern),
-                Influencer.bio.ilike(pattern),
-            )
-        )
-    # Platform filter (case‑insensitive)
-    if platform:
-        stmt = stmt.where(Influencer.platform.ilike(platform))
-    # Country filter
-    if country:
-        stmt = stmt.where(Influencer.country.ilike(country))
-    # Topic filter: topics stored as comma‑separated string
-    if topic:
-        pattern = f"%{topic.lower()}%"
-        stmt = stmt.where(Influencer.topics.ilike(pattern))
-    # Follower and engagement filters
-    if min_followers is not None:
-        stmt = stmt.where((Influencer.followers >= min_followers) | (Influencer.followers == None))
-    if max_followers is not None:
-        stmt = stmt.where((Influencer.followers <= max_followers) | (Influencer.followers == None))
-    if min_engagement_rate is not None:
-        stmt = stmt.where((Influencer.engagement_rate >= min_engagement_rate) | (Influencer.engagement_rate == None))
-    if max_engagement_rate is not None:
-        stmt = stmt.where((Influencer.engagement_rate <= max_engagement_rate) | (Influencer.engagement_rate == None))
-    # Sorting
-    if sort_by in {"followers", "engagement_rate"}:
-        column = getattr(Influencer, sort_by)
-        stmt = stmt.order_by(desc(column) if order.lower() == "desc" else asc(column))
-    # Execute query
-    result = await session.execute(stmt)
-    influencers = result.scalars().all()
-    return [InfluencerRead.model_validate(i) for i in influencers]
\ No newline at end of file
+    invalidate_matches(current_user.tenant_id)
+    return {"detail": f"Refreshed {refreshed} influencers"}
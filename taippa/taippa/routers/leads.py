@@ -3,24 +3,34 @@
 from __future__ import annotations
 
 from typing import List
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, HTTPException
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, Query, Request, Response, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 
 from ..database import get_session
-from ..models import Lead, User, RoleEnum, Tenant
+from ..models import Lead, User, RoleEnum
 from ..schemas import LeadCreate, LeadRead, LeadUpdate
 from ..auth import get_current_active_user, require_role
-import os
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate, set_next_cursor
+from .tenants import default_tenant_id
 
 
 router = APIRouter(prefix="/leads", tags=["leads"])
 
+# Validates a whole result list in one pass rather than one call per row
+_LEAD_LIST = TypeAdapter(List[LeadRead])
+
+# Columns needed to build a LeadRead without loading Lead entities
+_LEAD_READ_COLUMNS = tuple(getattr(Lead, field) for field in LeadRead.model_fields)
+
 
 @router.post("/", response_model=LeadRead, status_code=status.HTTP_201_CREATED)
 async def create_lead(
     lead_in: LeadCreate,
+    request: Request,
     session: AsyncSession = Depends(get_session),
 ):
     """Capture a new marketing lead.
@@ -28,50 +38,90 @@ async def create_lead(
     This endpoint is public and does not require authentication.  The lead is stored
     for later follow‑up by the sales team.
     """
-    # Determine tenant for public lead.  Use DEFAULT_TENANT_ID environment variable
-    tenant_id = os.getenv("DEFAULT_TENANT_ID")
+    # Public leads go to the default tenant (DEFAULT_TENANT_ID or the first tenant)
+    tenant_id = await default_tenant_id(request, session)
     if not tenant_id:
-        # if no default tenant configured, attempt to select the first tenant
-        result = await session.execute(select(Tenant))
-        tenant = result.scalars().first()
-        if not tenant:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="No tenant configured for lead capture")
-        tenant_id = tenant.id
-    lead = Lead(**lead_in.model_dump(), tenant_id=tenant_id)
-    session.add(lead)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="No tenant configured for lead capture")
+    # INSERT ... RETURNING hands back the generated columns in the same round
+    # trip.  Unset optional fields are left out so column defaults apply.
+    lead = await session.scalar(
+        insert(Lead)
+        .values(**lead_in.model_dump(exclude_none=True), tenant_id=tenant_id)
+        .returning(Lead)
+    )
     await session.commit()
-    await session.refresh(lead)
     return LeadRead.model_validate(lead)
 
 
+@router.post("/batch", response_model=List[LeadRead], status_code=status.HTTP_201_CREATED)
+async def create_leads_batch(
+    leads_in: List[LeadCreate],
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(require_role(RoleEnum.admin, RoleEnum.team_member)),
+):
+    """Import several leads into the current user's tenant at once.
+
+    Intended for backfills by the sales team.  The rows are sent as a single
+    multi-row INSERT ... RETURNING and committed together.
+    """
+    if not leads_in:
+        return []
+    # Unset optional fields are left out so column defaults (e.g. status) apply
+    rows = [
+        dict(lead_in.model_dump(exclude_none=True), tenant_id=current_user.tenant_id)
+        for lead_in in leads_in
+    ]
+    result = await session.scalars(
+        insert(Lead).returning(Lead, sort_by_parameter_order=True), rows
+    )
+    leads = result.all()
+    await session.commit()
+    return _LEAD_LIST.validate_python(leads, from_attributes=True)
+
+
 @router.get("/", response_model=List[LeadRead])
 async def list_leads(
+    response: Response,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(require_role(RoleEnum.admin, RoleEnum.team_member)),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: UUID | None = Query(None, description="Id of the last item of the previous page"),
 ):
     """List captured leads for the sales team.
 
-    Only admin and team_member roles can view leads.
+    Only admin and team_member roles can view leads.  Results are paginated
+    by id (see ``taippa.pagination``).
     """
     # restrict to leads in current user's tenant
-    result = await session.execute(select(Lead).where(Lead.tenant_id == current_user.tenant_id))
-    leads = result.scalars().all()
-    return [LeadRead.model_validate(l) for l in leads]
+    stmt = select(*_LEAD_READ_COLUMNS).where(Lead.tenant_id == current_user.tenant_id)
+    result = await session.execute(paginate(stmt, Lead.id, after, limit))
+    leads = result.all()
+    set_next_cursor(response, leads, limit)
+    return _LEAD_LIST.validate_python(leads, from_attributes=True)
 
 
 @router.put("/{lead_id}", response_model=LeadRead)
 async def update_lead(
-    lead_id: str,
+    lead_id: UUID,
     lead_in: LeadUpdate,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(require_role(RoleEnum.admin, RoleEnum.team_member)),
 ):
     """Update a lead's status or notes."""
-    lead = await session.get(Lead, lead_id)
-    if not lead or lead.tenant_id != current_user.tenant_id:
+    values = lead_in.model_dump(exclude_unset=True)
+    criteria = (Lead.id == lead_id, Lead.tenant_id == current_user.tenant_id)
+    if values:
+        # UPDATE ... RETURNING applies the change and reads it back at once
+        lead = await session.scalar(
+            update(Lead)
+            .where(*criteria)
+            .values(**values)
+            .returning(Lead)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        lead = await session.scalar(select(Lead).where(*criteria))
+    if lead is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Lead not found")
-    for attr, value in lead_in.model_dump(exclude_unset=True).items():
-        setattr(lead, attr, value)
     await session.commit()
-    await session.refresh(lead)
     return LeadRead.model_validate(lead)
\ No newline at end of file
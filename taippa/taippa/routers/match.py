@@ -10,38 +10,44 @@ provides useful recommendations without external dependencies.
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
 
+import numpy as np
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from ..database import get_session
 from ..models import Brand, Influencer, User
 from ..auth import get_current_active_user
+from ..services.tokens import tokenize
 
 
 router = APIRouter(prefix="/match", tags=["matchmaking"])
 
 
-def tokenize(text: str) -> List[str]:
-    """Simple tokenizer that lowercases and splits on non-alphabetic characters.
+# Recent match results, keyed by (tenant, brand, top_n, tenant version).
+# Writes that can change a tenant's results call invalidate_matches(),
+# which bumps the version so older entries are never read again and simply
+# age out.  Other workers only notice once their entries expire.
+_match_cache: TTLCache[Tuple[UUID, UUID, int, int], List[Dict[str, Any]]] = TTLCache(maxsize=1024, ttl=120)
+_match_versions: Dict[UUID, int] = defaultdict(int)
 
-    This function removes very short tokens and a small list of stop words to
-    improve similarity calculations.  It can be replaced with a more
-    sophisticated NLP pipeline as needed.
+
+def invalidate_matches(tenant_id: UUID) -> None:
+    """Discard cached match results for ``tenant_id``.
+
+    Call after changing the tenant's influencers or brands.
     """
-    if not text:
-        return []
-    import re
-    tokens = re.split(r"\W+", text.lower())
-    stop_words = {"the", "and", "for", "with", "a", "an", "of", "in", "to", "on"}
-    return [t for t in tokens if t and t not in stop_words and len(t) > 2]
+    _match_versions[tenant_id] += 1
 
 
 @router.get("/brand/{brand_id}", response_model=List[Dict[str, Any]])
 async def match_influencers_for_brand(
-    brand_id: str,
+    brand_id: UUID,
     top_n: int = Query(5, ge=1, le=50),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
@@ -58,6 +64,13 @@ async def match_influencers_for_brand(
     outside their tenant.  The number of results returned can be controlled
     with the `top_n` query parameter.
     """
+    # Results are only cached after the access check below has passed for
+    # this tenant, so a hit needs no database access at all
+    cache_key = (current_user.tenant_id, brand_id, top_n, _match_versions[current_user.tenant_id])
+    cached = _match_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Retrieve brand and validate access
     brand = await session.get(Brand, brand_id)
     if not brand:
@@ -65,38 +78,72 @@ async def match_influencers_for_brand(
     if brand.tenant_id != current_user.tenant_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
 
-    # Assemble a corpus for the brand
-    brand_text_parts = [brand.name or "", brand.description or "", brand.industry or "", brand.target_audience or ""]
-    brand_tokens = set(tokenize(" ".join(brand_text_parts)))
-
-    # Fetch influencers for the same tenant
-    result = await session.execute(select(Influencer).where(Influencer.tenant_id == current_user.tenant_id))
-    influencers = result.scalars().all()
+    # Tokenize each brand field on its own: the same tokens as tokenizing the
+    # fields joined by spaces, but each field is cached separately and no
+    # combined string is built
+    brand_text_parts = (brand.name, brand.description, brand.industry, brand.target_audience)
+    brand_tokens = frozenset().union(*(tokenize(part) for part in brand_text_parts if part))
+
+    # Fetch only the columns the scoring uses, as plain rows rather than
+    # Influencer entities.  The maximum follower count, which normalises the
+    # engagement scores, comes back with every row from a window aggregate,
+    # so no second query is needed.
+    result = await session.execute(
+        select(
+            Influencer.id,
+            Influencer.name,
+            Influencer.handle,
+            Influencer.platform,
+            Influencer.followers,
+            Influencer.engagement_rate,
+            Influencer.match_tokens,
+            func.max(Influencer.followers).over().label("max_followers"),
+        ).where(Influencer.tenant_id == current_user.tenant_id)
+    )
+    influencers = result.all()
     if not influencers:
         return []
-
-    # Determine maximum followers to normalise engagement scores
-    max_followers = max((inf.followers or 0) for inf in influencers) or 1
+    max_followers = influencers[0].max_followers or 1
+
+    # Score every influencer at once.  Set sizes come from C-level set
+    # operations on the stored token sets; everything else is array maths.
+    n = len(influencers)
+    token_sets = [
+        frozenset(inf.match_tokens.split())
+        if inf.match_tokens is not None
+        else tokenize(f"{inf.name or ''} {inf.handle or ''} {inf.platform or ''}")
+        for inf in influencers
+    ]
+    # Jaccard similarity for semantics: |A & B| / |A | B|
+    intersection = np.fromiter((len(brand_tokens & t) for t in token_sets), dtype=np.float64, count=n)
+    union = np.fromiter((len(t) for t in token_sets), dtype=np.float64, count=n)
+    union += len(brand_tokens) - intersection
+    semantic = np.divide(intersection, union, out=np.zeros(n), where=union > 0)
+    # Engagement score: normalise followers and engagement rate
+    followers_norm = np.fromiter((inf.followers or 0 for inf in influencers), dtype=np.float64, count=n)
+    followers_norm /= max_followers
+    engagement_norm = np.fromiter((inf.engagement_rate or 0 for inf in influencers), dtype=np.float64, count=n)
+    engagement_norm /= 100
+    engagement = 0.5 * followers_norm + 0.5 * engagement_norm
+    # Overall weighted score
+    overall = 0.6 * semantic + 0.4 * engagement
+
+    # Keep everything scoring at least the top_n-th best score without
+    # sorting the whole set, so ties at the cutoff all stay in the running,
+    # then order by descending score with ties in fetch order
+    if top_n < n:
+        top = np.flatnonzero(overall >= np.partition(overall, n - top_n)[n - top_n])
+    else:
+        top = np.arange(n)
+    top = top[np.lexsort((top, -overall[top]))][:top_n]
 
     recommendations: List[Dict[str, Any]] = []
-    for inf in influencers:
-        # Compose influencer text
-        inf_text_parts = [inf.name or "", inf.handle or "", inf.platform or ""]
-        inf_tokens = set(tokenize(" ".join(inf_text_parts)))
-        # Jaccard similarity for semantics
-        union = brand_tokens | inf_tokens
-        intersection = brand_tokens & inf_tokens
-        semantic_score = len(intersection) / len(union) if union else 0.0
-        # Engagement score: normalise followers and engagement rate
-        followers_norm = (inf.followers or 0) / max_followers
-        engagement_norm = (inf.engagement_rate or 0) / 100
-        engagement_score = 0.5 * followers_norm + 0.5 * engagement_norm
-        # Overall weighted score
-        overall_score = 0.6 * semantic_score + 0.4 * engagement_score
+    for i in top.tolist():
+        inf = influencers[i]
         # Build explanation string
         explanation = (
-            f"Semantic similarity: {semantic_score:.2f}, "
-            f"Engagement: {engagement_score:.2f} (followers {followers_norm:.2f}, engagement rate {engagement_norm:.2f})"
+            f"Semantic similarity: {semantic[i]:.2f}, "
+            f"Engagement: {engagement[i]:.2f} (followers {followers_norm[i]:.2f}, engagement rate {engagement_norm[i]:.2f})"
         )
         recommendations.append({
             "influencer_id": inf.id,
@@ -105,9 +152,8 @@ async def match_influencers_for_brand(
             "platform": inf.platform,
             "followers": inf.followers,
             "engagement_rate": inf.engagement_rate,
-            "score": round(overall_score, 4),
+            "score": round(float(overall[i]), 4),
             "explanation": explanation,
         })
-    # Sort recommendations by descending score
-    recommendations.sort(key=lambda x: x["score"], reverse=True)
-    return recommendations[:top_n]
\ No newline at end of file
+    _match_cache[cache_key] = recommendations
+    return recommendations
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import List, Optional
-from datetime import datetime
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from pydantic import TypeAdapter
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import false, func, insert, literal, select, update
 
-from ..database import get_session
-from ..models import SubscriptionPlan, Subscription, User, RoleEnum, SubscriptionStatus
+from ..database import async_session_factory, get_session
+from ..models import SubscriptionPlan, Subscription, User, RoleEnum, SubscriptionStatus, uuid7
 from ..schemas import (
     SubscriptionPlanCreate,
     SubscriptionPlanRead,
     SubscriptionRead,
     SubscriptionCreate,
+    construct_from_orm,
 )
 from ..auth import get_current_active_user, require_role
 
@@ -26,20 +30,100 @@ try:
 except ImportError:
     stripe = None  # Stripe is optional; if not installed payment endpoints will raise
 
+import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parses webhook payloads straight from bytes, with orjson when available
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 router = APIRouter(prefix="/subscriptions", tags=["subscriptions"])
 
+# Validates a whole result list in one pass rather than one call per row
+_PLAN_LIST = TypeAdapter(List[SubscriptionPlanRead])
+
+# Columns needed to build a SubscriptionPlanRead without loading entities
+_PLAN_READ_COLUMNS = tuple(getattr(SubscriptionPlan, field) for field in SubscriptionPlanRead.model_fields)
+
+# The /plans response body, already serialised, since plans rarely change.
+# Cleared by plan writes in this process; other workers see changes once
+# their entry expires.
+_plans_cache: TTLCache[str, bytes] = TTLCache(maxsize=1, ttl=30)
+
+# Stripe price ids of subscriptions already retrieved for the webhook, so
+# Stripe's retries of an event do not call the API again
+_stripe_price_cache: TTLCache[str, str] = TTLCache(maxsize=1024, ttl=3600)
+
+
+def _cancel_active(user_id: UUID, *criteria):
+    """Return an UPDATE ... RETURNING cancelling ``user_id``'s active subscriptions.
+
+    The end date is stamped by the database as the row is updated.
+    """
+    return (
+        update(Subscription)
+        .where(Subscription.user_id == user_id, Subscription.status == SubscriptionStatus.active, *criteria)
+        .values(status=SubscriptionStatus.cancelled, end_date=func.now())
+        .returning(Subscription)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _subscribe_from_plan(values: dict, *plan_criteria):
+    """Return an INSERT of a subscription to the plan matching ``plan_criteria``.
+
+    The plan id is selected from ``subscription_plans`` along with ``values``,
+    so nothing is inserted, and RETURNING yields no row, if no plan matches.
+    """
+    columns = Subscription.__table__.c
+    values = dict(values, id=uuid7())
+    plan_row = select(
+        SubscriptionPlan.id, *(literal(value, columns[name].type) for name, value in values.items())
+    ).where(*plan_criteria).limit(1)
+    return (
+        insert(Subscription)
+        .from_select(["plan_id", *values], plan_row)
+        .returning(Subscription)
+    )
+
+
+async def _subscription_price_id(subscription_id: str) -> Optional[str]:
+    """Return the price of a Stripe subscription, or ``None`` if it cannot be read.
+
+    The blocking Stripe client runs in a worker thread.  Failures are not
+    cached.
+    """
+    price_id = _stripe_price_cache.get(subscription_id)
+    if price_id is None:
+        try:
+            stripe_sub = await asyncio.to_thread(
+                stripe.Subscription.retrieve, subscription_id, expand=["items.data.price"]
+            )
+            price_id = stripe_sub["items"]["data"][0]["price"]["id"]
+        except Exception:
+            return None
+        _stripe_price_cache[subscription_id] = price_id
+    return price_id
+
 
 @router.get("/plans", response_model=List[SubscriptionPlanRead])
 async def list_plans(
     session: AsyncSession = Depends(get_session),
 ):
     """Return all active subscription plans."""
-    result = await session.execute(
-        select(SubscriptionPlan).where(SubscriptionPlan.active == True)
-    )
-    plans = result.scalars().all()
-    return [SubscriptionPlanRead.model_validate(p) for p in plans]
+    # The cached body is returned as is, skipping response_model validation
+    # and encoding; it was produced by the same schema
+    body = _plans_cache.get("active")
+    if body is None:
+        result = await session.execute(
+            select(*_PLAN_READ_COLUMNS).where(SubscriptionPlan.active == True)
+        )
+        plans = _PLAN_LIST.validate_python(result.all(), from_attributes=True)
+        _plans_cache["active"] = body = _PLAN_LIST.dump_json(plans)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/plans", response_model=SubscriptionPlanRead, status_code=status.HTTP_201_CREATED)
@@ -52,8 +136,8 @@ async def create_plan(
     plan = SubscriptionPlan(**plan_in.model_dump(exclude_unset=True))
     session.add(plan)
     await session.commit()
-    await session.refresh(plan)
-    return SubscriptionPlanRead.model_validate(plan)
+    _plans_cache.clear()
+    return construct_from_orm(SubscriptionPlanRead, plan)
 
 
 @router.get("/me", response_model=SubscriptionRead | None)
@@ -70,7 +154,7 @@ async def get_my_subscription(
     )
     sub = result.scalars().first()
     if sub:
-        return SubscriptionRead.model_validate(sub)
+        return construct_from_orm(SubscriptionRead, sub)
     return None
 
 
@@ -84,34 +168,28 @@ async def subscribe_to_plan(
 
     If an active subscription already exists it will be cancelled and replaced.
     """
-    # verify plan exists and is active
-    plan = await session.get(SubscriptionPlan, sub_in.plan_id)
-    if not plan or not plan.active:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
-    # cancel existing subscription
-    result = await session.execute(
-        select(Subscription).where(
-            Subscription.user_id == current_user.id,
-            Subscription.status == SubscriptionStatus.active,
-        )
-    )
-    existing = result.scalars().first()
-    if existing:
-        existing.status = SubscriptionStatus.cancelled
-        existing.end_date = datetime.utcnow()
-    # create new subscription
-    sub = Subscription(
-        user_id=current_user.id,
-        plan_id=sub_in.plan_id,
-        start_date=sub_in.start_date or datetime.utcnow(),
-        end_date=sub_in.end_date,
-        status=sub_in.status or SubscriptionStatus.active,
-        tenant_id=current_user.tenant_id,
+    # Cancel any active subscription without loading it.  If the plan turns
+    # out not to exist the request's transaction is never committed, so the
+    # cancellation is discarded with it.
+    await session.execute(_cancel_active(current_user.id))
+    # Create the new subscription in an INSERT ... SELECT from the plan, so
+    # the plan check and the insert are one statement; start_date defaults
+    # to the database's now()
+    values = {
+        "user_id": current_user.id,
+        "end_date": sub_in.end_date,
+        "status": sub_in.status or SubscriptionStatus.active,
+        "tenant_id": current_user.tenant_id,
+    }
+    if sub_in.start_date:
+        values["start_date"] = sub_in.start_date
+    sub = await session.scalar(
+        _subscribe_from_plan(values, SubscriptionPlan.id == sub_in.plan_id, SubscriptionPlan.active == True)
     )
-    session.add(sub)
+    if sub is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
     await session.commit()
-    await session.refresh(sub)
-    return SubscriptionRead.model_validate(sub)
+    return construct_from_orm(SubscriptionRead, sub)
 
 
 @router.post("/cancel", response_model=SubscriptionRead)
@@ -120,28 +198,21 @@ async def cancel_my_subscription(
     current_user: User = Depends(get_current_active_user),
 ):
     """Cancel the current user's active subscription."""
-    result = await session.execute(
-        select(Subscription).where(
-            Subscription.user_id == current_user.id,
-            Subscription.status == SubscriptionStatus.active,
-            Subscription.tenant_id == current_user.tenant_id,
-        )
+    result = await session.scalars(
+        _cancel_active(current_user.id, Subscription.tenant_id == current_user.tenant_id)
     )
-    sub = result.scalars().first()
+    sub = result.first()
     if not sub:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No active subscription")
-    sub.status = SubscriptionStatus.cancelled
-    sub.end_date = datetime.utcnow()
     await session.commit()
-    await session.refresh(sub)
-    return SubscriptionRead.model_validate(sub)
+    return construct_from_orm(SubscriptionRead, sub)
 
 
 # Payment integration: create a Stripe checkout session for the given plan.
 # This endpoint returns a URL to redirect the user to Stripe for payment.
 @router.post("/checkout/{plan_id}")
 async def create_checkout_session(
-    plan_id: str,
+    plan_id: UUID,
     request: Request,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
@@ -183,12 +254,18 @@ async def create_checkout_session(
         base_url = str(request.url).rsplit("/", 1)[0]
         domain = base_url
     try:
-        checkout_session = stripe.checkout.Session.create(
+        # The plan id travels with the session so the webhook can find the
+        # plan without calling back to Stripe.  The blocking client runs in
+        # a worker thread.
+        checkout_session = await asyncio.to_thread(
+            stripe.checkout.Session.create,
             mode="subscription",
             line_items=[{"price": db_plan.stripe_price_id, "quantity": 1}],
             customer_email=current_user.email,
             success_url=f"{domain}/pricing.html?session_id={{CHECKOUT_SESSION_ID}}",
             cancel_url=f"{domain}/pricing.html?cancelled=1",
+            metadata={"plan_id": str(db_plan.id)},
+            subscription_data={"metadata": {"plan_id": str(db_plan.id)}},
         )
     except Exception as e:
         raise HTTPException(
@@ -199,17 +276,69 @@ async def create_checkout_session(
 
 
 # Stripe webhook endpoint to handle payment events and activate subscriptions.
+async def _process_checkout_completed(session_obj: dict, verified: bool) -> None:
+    """Record the subscription bought in a completed Stripe checkout session.
+
+    Runs as a background task after the webhook has been acknowledged, so it
+    opens its own database session rather than using the request's.  The
+    plan id in the session's metadata is only trusted when ``verified`` (the
+    event's signature was checked); otherwise the plan is resolved from the
+    subscription Stripe actually holds.
+    """
+    customer_email: Optional[str] = session_obj.get("customer_details", {}).get("email") or session_obj.get("customer_email")
+    subscription_id = session_obj.get("subscription")
+    if not customer_email or not subscription_id:
+        return
+    # Sessions created by /checkout carry the plan id in their metadata; for
+    # older ones, unsigned events or malformed ids, look the plan up by the
+    # price of the subscription Stripe created
+    plan_id = (session_obj.get("metadata") or {}).get("plan_id") if verified else None
+    try:
+        plan_id = UUID(plan_id) if plan_id else None
+    except (TypeError, ValueError, AttributeError):
+        plan_id = None
+    if plan_id is not None:
+        plan_criterion = SubscriptionPlan.id == plan_id
+    else:
+        price_id = await _subscription_price_id(subscription_id)
+        plan_criterion = SubscriptionPlan.stripe_price_id == price_id if price_id else false()
+    async with async_session_factory() as session:
+        # Find the user and the plan together; no row unless both exist
+        match = (
+            await session.execute(
+                select(User.id, User.tenant_id)
+                .where(User.email == customer_email)
+                .join(SubscriptionPlan, plan_criterion)
+            )
+        ).first()
+        if match is None:
+            return
+        user_id, tenant_id = match
+        # Cancel any existing subscription, then create the new subscription
+        # record from the matched plan
+        await session.execute(_cancel_active(user_id))
+        await session.execute(
+            _subscribe_from_plan(
+                {"user_id": user_id, "status": SubscriptionStatus.active, "tenant_id": tenant_id},
+                plan_criterion,
+            )
+        )
+        await session.commit()
+
+
 @router.post("/webhook")
 async def stripe_webhook(
     request: Request,
-    session: AsyncSession = Depends(get_session),
+    background_tasks: BackgroundTasks,
 ):
     """Handle Stripe webhook events.
 
     This endpoint verifies the Stripe signature and processes checkout
     completion events.  When a subscription is successfully created in
     Stripe, we create a corresponding subscription record in our database
-    for the associated user and plan.
+    for the associated user and plan.  That work runs after the response
+    is sent, so Stripe gets its acknowledgement without waiting on the
+    database.
     """
     if stripe is None:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Stripe library not installed")
@@ -217,53 +346,29 @@ async def stripe_webhook(
     sig_header = request.headers.get("stripe-signature")
     webhook_secret = os.getenv("STRIPE_WEBHOOK_SECRET")
     stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
+    try:
+        data = _json_loads(payload)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid webhook payload")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid webhook payload")
+    # Only checkout completions are acted on; acknowledge other events
+    # without verifying their signature, which re-parses the payload
+    if data.get("type") != "checkout.session.completed":
+        return {"status": "success"}
     try:
         if webhook_secret:
             event = stripe.Webhook.construct_event(payload, sig_header, webhook_secret)
         else:
-            # Without a webhook secret we still attempt to parse the JSON
-            event = stripe.Event.construct_from(
-                stripe.util.json.loads(payload.decode()), stripe.api_key
-            )
+            # Without a webhook secret we still use the parsed JSON, but its
+            # contents are unauthenticated
+            event = stripe.Event.construct_from(data, stripe.api_key)
     except Exception:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid webhook payload")
     # Handle the checkout.session.completed event
     if event["type"] == "checkout.session.completed":
-        session_obj = event["data"]["object"]
-        # Extract customer_email and price ID
-        customer_email: Optional[str] = session_obj.get("customer_details", {}).get("email") or session_obj.get("customer_email")
-        # line_items not available in session; we need to fetch subscription or use metadata
-        # We'll attempt to extract from subscription created
-        subscription_id = session_obj.get("subscription")
-        if customer_email and subscription_id:
-            try:
-                stripe_sub = stripe.Subscription.retrieve(subscription_id, expand=["items.data.price"])
-                price_id = stripe_sub["items"]["data"][0]["price"]["id"]
-            except Exception:
-                price_id = None
-            # find user and plan
-            result_user = await session.execute(select(User).where(User.email == customer_email))
-            user = result_user.scalars().first()
-            result_plan = await session.execute(select(SubscriptionPlan).where(SubscriptionPlan.stripe_price_id == price_id))
-            plan = result_plan.scalars().first()
-            if user and plan:
-                # cancel any existing subscription
-                result_sub = await session.execute(
-                    select(Subscription).where(Subscription.user_id == user.id, Subscription.status == SubscriptionStatus.active)
-                )
-                existing = result_sub.scalars().first()
-                if existing:
-                    existing.status = SubscriptionStatus.cancelled
-                    existing.end_date = datetime.utcnow()
-                # create new subscription record
-                new_sub = Subscription(
-                    user_id=user.id,
-                    plan_id=plan.id,
-                    start_date=datetime.utcnow(),
-                    status=SubscriptionStatus.active,
-                    tenant_id=user.tenant_id,
-                )
-                session.add(new_sub)
-                await session.commit()
+        background_tasks.add_task(
+            _process_checkout_completed, event["data"]["object"], bool(webhook_secret)
+        )
     # Return 200 to acknowledge receipt
-    return {"status": "success"}
\ No newline at end of file
+    return {"status": "success"}
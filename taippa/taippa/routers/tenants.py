@@ -7,20 +7,87 @@ retrieve their own tenant's details.
 
 from __future__ import annotations
 
-from typing import List
+import os
+from typing import List, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from ..database import get_session
-from ..models import Tenant, User, RoleEnum
-from ..schemas import TenantCreate, TenantRead, TenantUpdate
+from ..models import Tenant, User, RoleEnum, uuid7
+from ..schemas import TenantCreate, TenantRead, TenantUpdate, construct_from_orm
 from ..auth import get_current_active_user, require_role
 
 
 router = APIRouter(prefix="/tenants", tags=["tenants"])
 
+# Validates a whole result list in one pass rather than one call per row
+_TENANT_LIST = TypeAdapter(List[TenantRead])
+
+# Columns needed to build a TenantRead without loading Tenant entities
+_TENANT_READ_COLUMNS = tuple(getattr(Tenant, field) for field in TenantRead.model_fields)
+
+# The tenant served by /public, which every landing and login page asks for.
+# Cleared by tenant writes in this process; other workers see changes once
+# their entry expires.
+_public_tenant_cache: TTLCache[str, TenantRead] = TTLCache(maxsize=1, ttl=30)
+
+
+async def lookup_default_tenant_id(session: AsyncSession) -> Optional[UUID]:
+    """Return the tenant for public signups and leads.
+
+    This is `DEFAULT_TENANT_ID` when set, otherwise the first tenant in the
+    database, or None if there are no tenants yet.
+    """
+    env_tenant_id = os.getenv("DEFAULT_TENANT_ID")
+    if env_tenant_id:
+        return UUID(env_tenant_id)
+    result = await session.execute(select(Tenant.id).limit(1))
+    return result.scalar_one_or_none()
+
+
+async def default_tenant_id(request: Request, session: AsyncSession) -> Optional[UUID]:
+    """Return the default tenant resolved at startup.
+
+    If none was available then (e.g. no tenant had been created yet) it is
+    looked up again and remembered on ``app.state`` once found.
+    """
+    tenant_id = getattr(request.app.state, "default_tenant_id", None)
+    if tenant_id is None:
+        tenant_id = await lookup_default_tenant_id(session)
+        request.app.state.default_tenant_id = tenant_id
+    return tenant_id
+
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+async def ensure_default_tenant_id(session: AsyncSession) -> UUID:
+    """Return the id of the tenant named "default", creating it if missing.
+
+    A single ``INSERT ... ON CONFLICT (name) DO NOTHING RETURNING id`` both
+    creates the tenant and returns its id, so concurrent first signups
+    cannot create it twice.  Only if another transaction created it first is
+    it looked up by name.  The caller commits.
+    """
+    upsert = _UPSERT_INSERTS[session.bind.dialect.name]
+    tenant_id = await session.scalar(
+        upsert(Tenant)
+        .values(id=uuid7(), name="default")
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(Tenant.id)
+    )
+    if tenant_id is None:
+        tenant_id = await session.scalar(select(Tenant.id).where(Tenant.name == "default"))
+    return tenant_id
+
 
 @router.get("/", response_model=List[TenantRead])
 async def list_tenants(
@@ -28,9 +95,9 @@ async def list_tenants(
     current_user: User = Depends(require_role(RoleEnum.admin)),
 ):
     """List all tenants.  Admin only."""
-    result = await session.execute(select(Tenant))
-    tenants = result.scalars().all()
-    return [TenantRead.model_validate(t) for t in tenants]
+    result = await session.execute(select(*_TENANT_READ_COLUMNS))
+    tenants = result.all()
+    return _TENANT_LIST.validate_python(tenants, from_attributes=True)
 
 
 @router.post("/", response_model=TenantRead, status_code=status.HTTP_201_CREATED)
@@ -43,8 +110,8 @@ async def create_tenant(
     tenant = Tenant(**tenant_in.model_dump(exclude_unset=True))
     session.add(tenant)
     await session.commit()
-    await session.refresh(tenant)
-    return TenantRead.model_validate(tenant)
+    _public_tenant_cache.clear()
+    return construct_from_orm(TenantRead, tenant)
 
 
 @router.get("/me", response_model=TenantRead)
@@ -56,7 +123,7 @@ async def get_my_tenant(
     tenant = await session.get(Tenant, current_user.tenant_id)
     if not tenant:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found")
-    return TenantRead.model_validate(tenant)
+    return construct_from_orm(TenantRead, tenant)
 
 
 # Public endpoint to retrieve a tenant without authentication.
@@ -72,16 +139,20 @@ async def get_public_tenant(
     could be extended to accept a domain parameter and look up the tenant by
     its custom domain.
     """
+    cached = _public_tenant_cache.get("public")
+    if cached is not None:
+        return cached
     result = await session.execute(select(Tenant).limit(1))
     tenant = result.scalars().first()
     if not tenant:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No tenants configured")
-    return TenantRead.model_validate(tenant)
+    _public_tenant_cache["public"] = tenant_read = construct_from_orm(TenantRead, tenant)
+    return tenant_read
 
 
 @router.put("/{tenant_id}", response_model=TenantRead)
 async def update_tenant(
-    tenant_id: str,
+    tenant_id: UUID,
     tenant_in: TenantUpdate,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(require_role(RoleEnum.admin)),
@@ -93,5 +164,5 @@ async def update_tenant(
     for attr, value in tenant_in.model_dump(exclude_unset=True).items():
         setattr(tenant, attr, value)
     await session.commit()
-    await session.refresh(tenant)
-    return TenantRead.model_validate(tenant)
\ No newline at end of file
+    _public_tenant_cache.clear()
+    return construct_from_orm(TenantRead, tenant)
\ No newline at end of file
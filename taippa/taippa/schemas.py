@@ -11,7 +11,8 @@ with SQLAlchemy objects.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional, Type, TypeVar
+from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
 
@@ -34,7 +35,7 @@ class UserBase(BaseModel):
     role: RoleEnum = RoleEnum.client
     # Optional tenant identifier for multi‑tenant setups.  When creating
     # users via the admin interface you can specify which tenant they belong to.
-    tenant_id: Optional[str] = None
+    tenant_id: Optional[UUID] = None
 
 
 class UserCreate(UserBase):
@@ -42,7 +43,7 @@ class UserCreate(UserBase):
 
 
 class UserRead(UserBase):
-    id: str
+    id: UUID
     created_at: datetime
     updated_at: datetime
 
@@ -52,7 +53,7 @@ class UserRead(UserBase):
 
 
 class UserInDB(UserBase):
-    id: str
+    id: UUID
     hashed_password: str
     created_at: datetime
     updated_at: datetime
@@ -89,8 +90,8 @@ class BrandUpdate(BaseModel):
 
 
 class BrandRead(BrandBase):
-    id: str
-    owner_id: str
+    id: UUID
+    owner_id: UUID
     created_at: datetime
     updated_at: datetime
 
@@ -109,7 +110,7 @@ class CampaignBase(BaseModel):
 
 
 class CampaignCreate(CampaignBase):
-    brand_id: str
+    brand_id: UUID
 
 
 class CampaignUpdate(BaseModel):
@@ -123,8 +124,8 @@ class CampaignUpdate(BaseModel):
 
 
 class CampaignRead(CampaignBase):
-    id: str
-    brand_id: str
+    id: UUID
+    brand_id: UUID
     analysis: Optional[str] = None
     created_at: datetime
     updated_at: datetime
@@ -176,7 +177,7 @@ class InfluencerUpdate(BaseModel):
 
 
 class InfluencerRead(InfluencerBase):
-    id: str
+    id: UUID
     created_at: datetime
     updated_at: datetime
 
@@ -202,7 +203,7 @@ class SubscriptionPlanCreate(SubscriptionPlanBase):
 
 
 class SubscriptionPlanRead(SubscriptionPlanBase):
-    id: str
+    id: UUID
     created_at: datetime
     updated_at: datetime
 
@@ -212,7 +213,7 @@ class SubscriptionPlanRead(SubscriptionPlanBase):
 
 
 class SubscriptionBase(BaseModel):
-    plan_id: str
+    plan_id: UUID
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     status: Optional[SubscriptionStatus] = SubscriptionStatus.active
@@ -223,8 +224,8 @@ class SubscriptionCreate(SubscriptionBase):
 
 
 class SubscriptionRead(SubscriptionBase):
-    id: str
-    user_id: str
+    id: UUID
+    user_id: UUID
     created_at: datetime
     updated_at: datetime
 
@@ -252,7 +253,7 @@ class LeadUpdate(BaseModel):
 
 
 class LeadRead(LeadBase):
-    id: str
+    id: UUID
     created_at: datetime
     model_config = {
     "from_attributes": True
@@ -299,10 +300,22 @@ class TenantUpdate(BaseModel):
 
 
 class TenantRead(TenantBase):
-    id: str
+    id: UUID
     created_at: datetime
     updated_at: datetime
 
     model_config = {
         "from_attributes": True
     }
+
+
+ReadModel = TypeVar("ReadModel", bound=BaseModel)
+
+
+def construct_from_orm(model: Type[ReadModel], obj: Any) -> ReadModel:
+    """Build ``model`` from the matching attributes of ``obj`` without validation.
+
+    Only for objects just loaded from or written to the database, whose
+    values the column types already guarantee.
+    """
+    return model.model_construct(**{name: getattr(obj, name) for name in model.model_fields})
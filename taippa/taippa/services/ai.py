@@ -3,8 +3,8 @@
 This module defines a function `analyse_brief` that takes a free‑form campaign
 brief and returns a structured analysis.  In a production deployment this
 function would integrate with a large language model such as OpenAI's GPT
-family.  The current implementation uses the `openai` Python SDK if an API key
-is configured; otherwise it returns a placeholder analysis.
+family.  The current implementation calls OpenAI's chat completions API if an
+API key is configured; otherwise it returns a placeholder analysis.
 
 The structured analysis returned by this function is a JSON string containing
 the inferred objectives, target audience, suggested influencer criteria,
@@ -15,23 +15,61 @@ labels when no API key is provided.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 from typing import Optional
 
+import httpx
+from cachetools import TTLCache
+
 try:
-    import openai
+    import orjson
 except ImportError:
-    openai = None  # type: ignore
+    orjson = None
+
+# Parses API responses straight from bytes, with orjson when available
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+
+# One HTTP client per process, so calls reuse pooled keep-alive connections
+# instead of paying a TCP and TLS handshake each time.  Created on first use
+# and closed by close_client() when the application shuts down.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=OPENAI_BASE_URL,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _client
+
+
+# Successful analyses keyed by a 16-byte BLAKE2b digest of the brief, so a
+# re-submitted brief is answered without calling the model again.  Errors and
+# fallback analyses are not cached.
+_analysis_cache: TTLCache[bytes, str] = TTLCache(maxsize=10_000, ttl=24 * 3600)
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 async def analyse_brief(brief: str) -> str:
     """Analyse a campaign brief using an LLM.
 
-    If an OpenAI API key is available in the environment variable `OPENAI_API_KEY`
-    and the `openai` package is installed, the function sends the brief to the
-    GPT‑3.5 Turbo model and returns its response.  Otherwise a fallback analysis
-    is returned.
+    If an OpenAI API key is available in the environment variable `OPENAI_API_KEY`,
+    the function sends the brief to the GPT‑3.5 Turbo model and returns its
+    response.  Otherwise a fallback analysis is returned.
 
     Args:
         brief: Free‑form text describing the campaign objectives, audience and
@@ -41,8 +79,11 @@ async def analyse_brief(brief: str) -> str:
         A JSON string containing the structured analysis.
     """
     api_key = os.getenv("OPENAI_API_KEY")
-    if api_key and openai is not None:
-        openai.api_key = api_key
+    if api_key:
+        cache_key = hashlib.blake2b(brief.encode(), digest_size=16).digest()
+        cached = _analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached
         messages = [
             {
                 "role": "system",
@@ -57,19 +98,25 @@ async def analyse_brief(brief: str) -> str:
             {"role": "user", "content": brief},
         ]
         try:
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-3.5-turbo",
-                messages=messages,
-                temperature=0.4,
-                max_tokens=400,
+            response = await _get_client().post(
+                "/chat/completions",
+                json={
+                    "model": "gpt-3.5-turbo",
+                    "messages": messages,
+                    "temperature": 0.4,
+                    "max_tokens": 400,
+                },
+                headers={"Authorization": f"Bearer {api_key}"},
             )
-            content = response.choices[0].message.content
+            response.raise_for_status()
+            content = _json_loads(response.content)["choices"][0]["message"]["content"]
             # ensure the response is valid JSON; if not, wrap it
             try:
-                parsed = json.loads(content)
-                return json.dumps(parsed)
+                analysis = json.dumps(json.loads(content))
             except json.JSONDecodeError:
-                return json.dumps({"analysis": content})
+                analysis = json.dumps({"analysis": content})
+            _analysis_cache[cache_key] = analysis
+            return analysis
         except Exception as e:
             # Fallback to dummy analysis on error
             return json.dumps(
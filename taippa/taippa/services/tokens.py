@@ -0,0 +1,35 @@
+"""Text tokenization shared by matchmaking and the influencer loaders.
+
+Kept free of web and database dependencies so the raw SQLite loaders in
+``scripts/`` and ``data_collection/`` can fill ``influencers.match_tokens``
+exactly as the API does.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import FrozenSet
+
+_TOKEN_SPLIT_RE = re.compile(r"\W+")
+_STOP_WORDS = frozenset({"the", "and", "for", "with", "a", "an", "of", "in", "to", "on"})
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text: str) -> FrozenSet[str]:
+    """Simple tokenizer that lowercases and splits on non-alphabetic characters.
+
+    This function removes very short tokens and a small list of stop words to
+    improve similarity calculations.  It can be replaced with a more
+    sophisticated NLP pipeline as needed.  Influencer text rarely changes
+    between requests, so results are cached by input text.
+    """
+    if not text:
+        return frozenset()
+    tokens = _TOKEN_SPLIT_RE.split(text.lower())
+    return frozenset(t for t in tokens if len(t) > 2 and t not in _STOP_WORDS)
+
+
+def influencer_match_tokens(name: str | None, handle: str | None, platform: str | None) -> str:
+    """Return the value to store in ``Influencer.match_tokens``."""
+    return " ".join(sorted(tokenize(f"{name or ''} {handle or ''} {platform or ''}")))